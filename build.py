@@ -1,10 +1,15 @@
 import os
+import ast
 import shutil
 import subprocess
 import argparse
 
 MPY_CROSS = shutil.which("adafruit-mpy-cross")
 MPY_TARGET_DIR = ".compiled"
+STRIPPED_DIR = os.path.join(MPY_TARGET_DIR, ".stripped")
+LOG_LEVEL_STAMP = os.path.join(MPY_TARGET_DIR, ".log_level")
+# Same values as mkx.log.LogLevel
+LOG_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40, "off": 100}
 SOURCE_DIRS = ["mkx"]
 # Default mountpoint template; upload() can accept a different drive or full path
 DEFAULT_DRIVE_NAME = "CIRCUITPY"
@@ -19,7 +24,41 @@ else:
     )
 
 
-def compile():
+def strip_log_calls(source, log_level):
+    """
+    Replace the log.<level>(...) statements below log_level with pass.
+    Line numbers are kept, so tracebacks still point at the original source.
+    """
+    threshold = LOG_LEVELS[log_level]
+    stripped = {name for name, value in LOG_LEVELS.items() if value < threshold}
+
+    lines = source.splitlines(keepends=True)
+    for node in ast.walk(ast.parse(source)):
+        if not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)):
+            continue
+        func = node.value.func
+        if not (
+            isinstance(func, ast.Attribute)
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "log"
+            and func.attr in stripped
+        ):
+            continue
+
+        first, last = node.lineno - 1, node.end_lineno - 1
+        indent = lines[first][: node.col_offset]
+        rest = lines[last][node.end_col_offset :].strip()
+        if indent.strip() or (rest and not rest.startswith("#")):
+            continue  # Shares its line with other code, keep it
+
+        lines[first] = indent + "pass\n"
+        for i in range(first + 1, last + 1):
+            lines[i] = "\n"
+
+    return "".join(lines)
+
+
+def compile(log_level=None):
     if not MPY_CROSS_CMD:
         print("Error: adafruit circuitpython mpy-cross not found. Install it first.")
         return 1
@@ -43,6 +82,13 @@ def compile():
         print("No .py source files found to compile.")
         return 0
 
+    # Stripped output depends on the log level, rebuild everything when it changes
+    previous_level = None
+    if os.path.exists(LOG_LEVEL_STAMP):
+        with open(LOG_LEVEL_STAMP) as f:
+            previous_level = f.read().strip() or None
+    force = previous_level != log_level
+
     produced_count = 0
     files_to_compile = []
     for src_path in py_files:
@@ -56,7 +102,7 @@ def compile():
 
         # Only compile if output missing or source is newer than output
         need_compile = True
-        if os.path.exists(dst_path_mpy):
+        if os.path.exists(dst_path_mpy) and not force:
             try:
                 src_mtime = os.path.getmtime(src_path)
                 dst_mtime = os.path.getmtime(dst_path_mpy)
@@ -72,10 +118,23 @@ def compile():
         print("==> All files are up-to-date.")
         return 0
 
+    if log_level:
+        print(f"==> Stripping log calls below '{log_level}'")
+
     for idx, (src_path, dst_path_mpy) in enumerate(files_to_compile, 1):
+        compile_path = src_path
+        if log_level:
+            compile_path = os.path.join(STRIPPED_DIR, os.path.relpath(src_path))
+            os.makedirs(os.path.dirname(compile_path), exist_ok=True)
+            with open(src_path) as f:
+                source = strip_log_calls(f.read(), log_level)
+            with open(compile_path, "w") as f:
+                f.write(source)
+
         try:
             proc = subprocess.run(
-                MPY_CROSS_CMD + ["-O2", src_path, "-o", dst_path_mpy],
+                MPY_CROSS_CMD
+                + ["-O2", "-s", src_path, compile_path, "-o", dst_path_mpy],
                 capture_output=True,
                 text=True,
             )
@@ -102,16 +161,19 @@ def compile():
                 f"Warning: expected output not found for [{idx}/{len(files_to_compile)}]: {dst_path_mpy}"
             )
 
+    with open(LOG_LEVEL_STAMP, "w") as f:
+        f.write(log_level or "")
+
     return 0
 
 
-def upload(mountpoint=None, compile_before=False):
+def upload(mountpoint=None, compile_before=False, log_level=None):
     """Upload compiled .mpy files to the given mountpoint.
 
     If compile_before is True, attempt to compile first.
     """
     if compile_before:
-        status = compile()
+        status = compile(log_level)
         if status != 0:
             print("Compilation failed or mpy-cross missing; aborting upload.")
             return
@@ -125,8 +187,11 @@ def upload(mountpoint=None, compile_before=False):
 
         # Collect all files to upload
         files_to_upload = []
-        for root, _, files in os.walk(MPY_TARGET_DIR):
+        for root, dirs, files in os.walk(MPY_TARGET_DIR):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
             for f in files:
+                if f.startswith("."):
+                    continue
                 src_file = os.path.join(root, f)
                 rel_path = os.path.relpath(src_file, MPY_TARGET_DIR)
                 files_to_upload.append(rel_path)
@@ -137,7 +202,9 @@ def upload(mountpoint=None, compile_before=False):
                 f"Uploading [{idx:>{len(str(len(files_to_upload)))}}/{len(files_to_upload)}]  {rel_path}"
             )
 
-        subprocess.run(["rsync", "-r", MPY_TARGET_DIR + "/", target_dir + "/"])
+        subprocess.run(
+            ["rsync", "-r", "--exclude", ".*", MPY_TARGET_DIR + "/", target_dir + "/"]
+        )
     else:
         print(f"Error: drive not found at {mountpoint}.")
 
@@ -185,6 +252,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Upload compiled .mpy files to the drive (does not compile unless --compile given)",
     )
+    parser.add_argument(
+        "--log-level",
+        choices=list(LOG_LEVELS),
+        default=None,
+        help="Strip log calls below this level before compiling (default: keep all)",
+    )
     parser.add_argument(
         "--clean", action="store_true", help="Remove compiled files (.compiled)"
     )
@@ -209,7 +282,7 @@ if __name__ == "__main__":
         clean()
 
     if args.compile and not args.upload:
-        compile()
+        compile(args.log_level)
 
     if args.upload:
         drive_arg = args.drive
@@ -218,4 +291,4 @@ if __name__ == "__main__":
         else:
             target = f"/media/{os.getenv('USER')}/{drive_arg}"
 
-        upload(mountpoint=target, compile_before=args.compile)
+        upload(mountpoint=target, compile_before=args.compile, log_level=args.log_level)
@@ -47,17 +47,17 @@ def boot_cfg(
 
     if keyboard:
         if nkro:
-            from mkx.device_nkro_keyboard import nkro_keyboard
+            from mkx.device_nkro_keyboard import NKRO_KEYBOARD
 
-            devices.append(nkro_keyboard.NKRO_KEYBOARD)
+            devices.append(NKRO_KEYBOARD)
         else:
             devices.append(usb_hid.Device.KEYBOARD)
 
     if mouse:
         if pan:
-            from mkx.device_pointer import pointer
+            from mkx.device_pointer import POINTER
 
-            devices.append(pointer.POINTER)
+            devices.append(POINTER)
         else:
             devices.append(usb_hid.Device.MOUSE)
 
@@ -0,0 +1,134 @@
+from mkx import log
+from mkx.log import LogCategory
+
+
+class _DeviceClock:
+    __slots__ = (
+        "offset",
+        "drift",
+        "jitter",
+        "samples",
+        "block_min",
+        "block_start",
+        "prev_min",
+        "prev_start",
+        "last_remote",
+    )
+
+    def __init__(self, delta, local_ts):
+        self.offset = delta
+        self.drift = 0.0  # ms of offset change per ms of local time
+        self.jitter = 0.0
+        self.samples = 1
+        self.block_min = delta
+        self.block_start = local_ts
+        self.prev_min = None
+        self.prev_start = None
+        self.last_remote = None
+
+
+class ClockSync:
+    """
+    Persistent clock synchronisation between the central and its peripheries.
+
+    Every received message gives a delta = local receive time - remote timestamp,
+    which is the clock offset plus a transit delay that is never negative.
+    The smallest delta over a sliding window (two blocks of window_ms) is the
+    best offset estimate, the change of the block minima gives the drift and
+    the spread of the deltas above the minimum gives the jitter.
+
+    A remote timestamp going backwards or a delta more than resync_ms above the
+    offset means the periphery restarted its clock (reboot), its estimate is
+    restarted from that message.
+
+    Messages marked "anchored" (binary key event frames) are already on the
+    local timeline, anchored at their arrival minus the UART transfer time, see
+    MessageParser. They are neither observed nor corrected.
+    """
+
+    def __init__(self, window_ms=2000, resync_ms=1000):
+        self.window_ms = window_ms
+        self.resync_ms = resync_ms
+        self.clocks = {}
+        self.resyncs = 0
+
+    def observe(self, device_id: str, remote_ts: int, local_ts: int):
+        """Record one message of device_id received at local_ts"""
+        delta = local_ts - remote_ts
+        clock = self.clocks.get(device_id)
+
+        if clock is not None and (
+            remote_ts < clock.last_remote or delta - clock.offset > self.resync_ms
+        ):
+            log.info(LogCategory.COMM, "Clock of %s restarted, resync", device_id)
+            self.resyncs += 1
+            clock = None
+
+        if clock is None:
+            clock = _DeviceClock(delta, local_ts)
+            clock.last_remote = remote_ts
+            self.clocks[device_id] = clock
+            return
+
+        clock.samples += 1
+        clock.last_remote = remote_ts
+
+        if delta < clock.block_min:
+            clock.block_min = delta
+
+        if local_ts - clock.block_start >= self.window_ms:
+            # Close the block, the drift follows the movement of the minima
+            if clock.prev_min is not None:
+                clock.drift = (clock.block_min - clock.prev_min) / (
+                    clock.block_start - clock.prev_start
+                )
+            clock.prev_min = clock.block_min
+            clock.prev_start = clock.block_start
+            clock.block_min = delta
+            clock.block_start = local_ts
+
+        offset = clock.block_min
+        if clock.prev_min is not None:
+            # Previous block minimum, carried forward by the drift
+            prev = clock.prev_min + clock.drift * (local_ts - clock.prev_start)
+            if prev < offset:
+                offset = prev
+        clock.offset = offset
+
+        clock.jitter += (delta - offset - clock.jitter) / 8
+
+    def observe_messages(self, messages: list, local_ts: int):
+        """Record every message with a remote timestamp, received at local_ts"""
+        for msg in messages:
+            if not msg.get("anchored"):
+                self.observe(msg["device_id"], msg["timestamp"], local_ts)
+
+    def correct(self, device_id: str, remote_ts: int) -> int:
+        """remote_ts of device_id on the local timeline"""
+        clock = self.clocks.get(device_id)
+        if clock is None:
+            return remote_ts
+        return remote_ts + int(clock.offset)
+
+    def sync(self, messages: list) -> list:
+        """Move message timestamps to the local timeline and order them, in place"""
+        for msg in messages:
+            device_id = msg.get("device_id")
+            if device_id is not None and not msg.get("anchored"):
+                msg["timestamp"] = self.correct(device_id, msg["timestamp"])
+
+        messages.sort(key=lambda m: m["timestamp"])
+        return messages
+
+    def estimate(self, device_id: str) -> dict | None:
+        """Current offset (ms), drift (ppm) and jitter (ms) of device_id"""
+        clock = self.clocks.get(device_id)
+        if clock is None:
+            return None
+
+        return {
+            "offset_ms": clock.offset,
+            "drift_ppm": clock.drift * 1_000_000,
+            "jitter_ms": clock.jitter,
+            "samples": clock.samples,
+        }
@@ -5,94 +5,483 @@ import struct
 
 from collections import OrderedDict
 
+from mkx import log
+from mkx.log import LogCategory
+from mkx.debouncer import DEBOUNCE_MS
+
 HEADER_BYTE = 0xB2
-DEBOUNCE_MS = 5
+
+# Frame version, the byte right after HEADER_BYTE:
+# - high bit clear: ASCII frame, the byte is the high byte of the 2 byte payload length
+#   HEADER(1) + LENGTH(2) + PAYLOAD(ascii) + CHECKSUM(1)
+# - FRAME_KEY_EVENT: compact binary key event
+#   HEADER(1) + VERSION(1) + DEVICE(1) + DELTA_MS(1) + EVENT(2) + CHECKSUM(1)
+#   EVENT = pressed(1 bit) | row(7 bits) | col(7 bits), big endian
+# - FRAME_KEY_EVENT_CRC: as FRAME_KEY_EVENT, CRC(2) over VERSION..EVENT instead of CHECKSUM(1)
+# - FRAME_ASCII_CRC: HEADER(1) + VERSION(1) + LENGTH(2) + PAYLOAD(ascii) + CRC(2),
+#   CRC over VERSION..PAYLOAD
+FRAME_KEY_EVENT = 0x80
+FRAME_KEY_EVENT_CRC = 0x81
+FRAME_ASCII_CRC = 0x82
+KEY_EVENT_FRAME_SIZE = 7
+MAX_FRAME_OVERHEAD = 6  # FRAME_ASCII_CRC: header, version, length(2), crc(2)
+MAX_DELTA_MS = 0xFF
+
+
+def _crc16_table(poly=0x1021):
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return table
+
+
+# CRC-16/CCITT-FALSE lookup table, built once at import
+CRC16_TABLE = _crc16_table()
+
+
+def crc16(data, start=0, end=None, crc=0xFFFF) -> int:
+    """CRC-16/CCITT-FALSE of data[start:end], without slicing data"""
+    table = CRC16_TABLE
+    if end is None:
+        end = len(data)
+    for i in range(start, end):
+        crc = ((crc << 8) & 0xFF00) ^ table[(crc >> 8) ^ data[i]]
+    return crc
+
+
+def device_number(device_id: str) -> int:
+    """Small integer id of a device_id string (FNV-1a folded to 8 bits)"""
+    h = 0x811C9DC5
+    for b in device_id.encode("ascii"):
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return (h ^ (h >> 8) ^ (h >> 16) ^ (h >> 24)) & 0xFF
+
+
+class KeyEventEncoder:
+    """
+    Encodes key events into binary FRAME_KEY_EVENT frames.
+    The timestamp is sent as the delta to the previous event (saturated at MAX_DELTA_MS),
+    the frame buffer is preallocated and reused, so encode() allocates nothing.
+    """
+
+    def __init__(self, device_id: str, crc=False):
+        self.device_id = device_id
+        self.device_number = device_number(device_id)
+        self.crc = crc
+        self.last_timestamp = None
+        self.frame = bytearray(KEY_EVENT_FRAME_SIZE + (1 if crc else 0))
+        self.frame[0] = HEADER_BYTE
+        self.frame[1] = FRAME_KEY_EVENT_CRC if crc else FRAME_KEY_EVENT
+        self.frame[2] = self.device_number
+
+    def encode(self, col: int, row: int, pressed: bool, verbose=False) -> bytearray:
+        timestamp = time.monotonic_ns() // 1_000_000  # Timestamp in ms
+
+        if self.last_timestamp is None:
+            delta = MAX_DELTA_MS
+        else:
+            delta = min(timestamp - self.last_timestamp, MAX_DELTA_MS)
+        self.last_timestamp = timestamp
+
+        event = (0x8000 if pressed else 0) | ((row & 0x7F) << 7) | (col & 0x7F)
+
+        frame = self.frame
+        frame[3] = delta
+        frame[4] = event >> 8
+        frame[5] = event & 0xFF
+        if self.crc:
+            crc = crc16(frame, 1, 6)
+            frame[6] = crc >> 8
+            frame[7] = crc & 0xFF
+        else:
+            frame[6] = (frame[2] + frame[3] + frame[4] + frame[5]) & 0xFF
+
+        if verbose:
+            log.debug(
+                LogCategory.COMM,
+                "send: %s(%d) +%dms col=%d row=%d pressed=%s",
+                self.device_id,
+                self.device_number,
+                delta,
+                col,
+                row,
+                pressed,
+            )
+
+        return frame
 
 
 class MessageParser:
-    def __init__(self, max_message_size=256):
-        self.buffer = b""
+    """
+    Incremental frame parser.
+    Incoming bytes are kept in a preallocated ring buffer, frames are copied out
+    into a preallocated scratch buffer, so steady-state parsing allocates nothing
+    except the returned messages.
+
+    baudrate: UART speed of the link. A binary key event timeline starts on the
+    local clock minus the transfer time of its frame (10 bits per byte), so it
+    lines up with the central's own events. None assumes no transfer time.
+    """
+
+    def __init__(self, max_message_size=256, buffer_size=None, baudrate=None):
         self.max_message_size = max_message_size
+        self.baudrate = baudrate
+
+        # Room for at least two of the largest frames
+        self.buffer_size = buffer_size or 2 * (max_message_size + MAX_FRAME_OVERHEAD)
+        self._ring = bytearray(self.buffer_size)
+        self._ring_view = memoryview(self._ring)
+        self._head = 0  # Read position
+        self._count = 0  # Bytes waiting in the ring
+
+        self._frame = bytearray(max_message_size + MAX_FRAME_OVERHEAD)
+        self._frame_view = memoryview(self._frame)
+
+        # Binary frames carry a device number and a delta timestamp,
+        # the device_id and the running timestamp are restored per device
+        self.device_ids = {}
+        self.remote_times = {}
+
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Link quality counters, see stats()"""
+        self.frames_ok = 0
+        self.checksum_failures = 0
+        self.bytes_skipped = 0
+        self.frames_dropped = 0
+        self.resyncs = 0
+        self.resync_time_ms = 0
+        self._resync_start = None
+
+    def stats(self) -> dict:
+        return {
+            "frames_ok": self.frames_ok,
+            "checksum_failures": self.checksum_failures,
+            "bytes_skipped": self.bytes_skipped,
+            "frames_dropped": self.frames_dropped,
+            "resyncs": self.resyncs,
+            "resync_time_ms": self.resync_time_ms,
+        }
 
-    def parse(self, new_data: bytes, verbose=False) -> list[dict]:
-        messages = []
-        self.buffer += new_data
+    @property
+    def buffer(self) -> bytes:
+        """Copy of the pending (not yet parsed) bytes, for debugging"""
+        end = self._head + self._count
+        if end <= self.buffer_size:
+            return bytes(self._ring_view[self._head : end])
+        return bytes(self._ring_view[self._head :]) + bytes(
+            self._ring_view[: end - self.buffer_size]
+        )
+
+    def register_device(self, device_id: str):
+        """Accept binary frames from device_id"""
+        self.device_ids[device_number(device_id)] = device_id
+
+    # ---------- ring buffer helpers -----------------------------
+
+    def _write(self, data) -> int:
+        """Append as much of data as fits, returns the number of bytes written"""
+        size = self.buffer_size
+        n = min(len(data), size - self._count)
+        if n == 0:
+            return 0
+
+        tail = self._head + self._count
+        if tail >= size:
+            tail -= size
+
+        first = min(n, size - tail)
+        self._ring_view[tail : tail + first] = data[:first]
+        if first < n:
+            self._ring_view[0 : n - first] = data[first:n]
+
+        self._count += n
+        return n
+
+    def _peek(self, offset: int) -> int:
+        idx = self._head + offset
+        if idx >= self.buffer_size:
+            idx -= self.buffer_size
+        return self._ring[idx]
+
+    def _copy_out(self, offset: int, length: int):
+        """Copy length bytes starting at offset into the frame scratch buffer"""
+        size = self.buffer_size
+        start = self._head + offset
+        if start >= size:
+            start -= size
+
+        first = min(length, size - start)
+        self._frame_view[0:first] = self._ring_view[start : start + first]
+        if first < length:
+            self._frame_view[first:length] = self._ring_view[0 : length - first]
+
+    def _consume(self, n: int):
+        self._head += n
+        if self._head >= self.buffer_size:
+            self._head -= self.buffer_size
+        self._count -= n
+        if self._count == 0:
+            self._head = 0
+
+    # ---------- frames ------------------------------------------
+
+    def transfer_ms(self, frame_size: int) -> int:
+        """Time in ms the UART takes to receive frame_size bytes"""
+        if not self.baudrate:
+            return 0
+        return (frame_size * 10_000 + self.baudrate // 2) // self.baudrate
+
+    def _parse_key_event(self, frame, frame_size) -> OrderedDict | None:
+        number = frame[2]
+        device_id = self.device_ids.get(number)
+        if device_id is None:
+            log.warning(
+                LogCategory.COMM,
+                "Warning: binary frame from unregistered device %d",
+                number,
+            )
+            return None
+
+        delta = frame[3]
+        if delta >= MAX_DELTA_MS or number not in self.remote_times:
+            # Idle gap or first event, restart the timeline on the local clock
+            # at the time the frame was sent
+            timestamp = time.monotonic_ns() // 1_000_000 - self.transfer_ms(frame_size)
+        else:
+            timestamp = self.remote_times[number] + delta
+        self.remote_times[number] = timestamp
+
+        event = (frame[4] << 8) | frame[5]
+
+        msg = OrderedDict()
+        msg["timestamp"] = timestamp
+        msg["device_id"] = device_id
+        msg["type"] = "key_event"
+        msg["data"] = [event & 0x7F, (event >> 7) & 0x7F, bool(event & 0x8000)]
+        msg["anchored"] = True  # Local timeline already, no ClockSync correction
+        return msg
+
+    def _parse_ascii(self, payload, verbose=False) -> OrderedDict | None:
+        line_str = str(payload, "ascii").strip()
 
         if verbose:
-            print("data:", self.buffer)
+            log.debug(LogCategory.COMM, "received: %s", line_str)
+
+        parts = line_str.split(":")
+        if len(parts) < 3:
+            log.warning(LogCategory.COMM, "Invalid message format: %s", line_str)
+            return None
+
+        msg = OrderedDict()
+        msg["timestamp"] = int(parts[0])
+        msg["device_id"] = parts[1]
+        msg["type"] = parts[2]
+        msg["data"] = parts[3:]
+        return msg
+
+    def _resync(self):
+        """Drop the byte at the read position and skip straight to the next header"""
+        if self._resync_start is None:
+            self._resync_start = time.monotonic_ns() // 1_000_000
+            self.resyncs += 1
+
+        skipped = 1
+        while skipped < self._count and self._peek(skipped) != HEADER_BYTE:
+            skipped += 1
+
+        self._consume(skipped)
+        self.bytes_skipped += skipped
+
+    def _frame_ok(self):
+        self.frames_ok += 1
+        if self._resync_start is not None:
+            self.resync_time_ms += time.monotonic_ns() // 1_000_000 - self._resync_start
+            self._resync_start = None
+
+    def _frame_layout(self):
+        """
+        Returns (frame_size, payload_start, crc) of the frame at the read position,
+        None if more data is needed to tell, or frame_size 0 if it is not a valid frame.
+        """
+        version = self._peek(1)
+
+        if version == FRAME_KEY_EVENT:
+            return KEY_EVENT_FRAME_SIZE, 2, False
+
+        if version == FRAME_KEY_EVENT_CRC:
+            return KEY_EVENT_FRAME_SIZE + 1, 2, True
+
+        if version == FRAME_ASCII_CRC:
+            if self._count < 4:
+                return None
+            length = (self._peek(2) << 8) | self._peek(3)
+            payload_start, crc = 4, True
+
+        elif version & 0x80:
+            log.warning(
+                LogCategory.COMM, "Warning: unknown frame version: %02X", version
+            )
+            return 0, 0, False
+
+        else:
+            length = (version << 8) | self._peek(2)
+            payload_start, crc = 3, False
 
+        if length > self.max_message_size:
+            log.warning(
+                LogCategory.COMM,
+                "Warning: frame length %d exceeds max_message_size",
+                length,
+            )
+            return 0, 0, False
+
+        return payload_start + length + (2 if crc else 1), payload_start, crc
+
+    def _parse_frames(self, messages: list, verbose=False):
         while True:
             # Need at least header(1) + length(2)
-            if len(self.buffer) < 3:
+            if self._count < 3:
                 break
 
-            if self.buffer[0] != HEADER_BYTE:
-                # Skip invalid byte
-                print(f"Warning: skipping invalid header byte: {self.buffer[0]:02X}")
-                self.buffer = self.buffer[1:]
+            if self._peek(0) != HEADER_BYTE:
+                # Skip invalid bytes up to the next header
+                log.warning(
+                    LogCategory.COMM,
+                    "Warning: skipping invalid header byte: %02X",
+                    self._peek(0),
+                )
+                self._resync()
                 continue
 
-            length = struct.unpack(">H", self.buffer[1:3])[0]
+            layout = self._frame_layout()
+            if layout is None:
+                break  # Wait for more data
+
+            frame_size, payload_start, crc = layout
+            if frame_size == 0:
+                self._resync()
+                continue
 
             # Check if full message is present
             if verbose:
-                print("in buffer:", len(self.buffer), "data size:", 3 + length + 1)
+                log.debug(
+                    LogCategory.COMM,
+                    "in buffer: %d data size: %d",
+                    self._count,
+                    frame_size,
+                )
 
-            if len(self.buffer) < 3 + length + 1:
+            if self._count < frame_size:
                 # Wait for more data
-                print("Wait for more data, break")
+                log.debug(LogCategory.COMM, "Wait for more data, break")
                 break
 
-            payload = self.buffer[3 : 3 + length]
-            checksum = self.buffer[3 + length]
+            self._copy_out(0, frame_size)
+            frame = self._frame
 
-            computed_checksum = sum(payload) & 0xFF
+            if crc:
+                checksum = (frame[frame_size - 2] << 8) | frame[frame_size - 1]
+                computed_checksum = crc16(frame, 1, frame_size - 2)
+            else:
+                checksum = frame[frame_size - 1]
+                computed_checksum = 0
+                for i in range(payload_start, frame_size - 1):
+                    computed_checksum += frame[i]
+                computed_checksum &= 0xFF
 
             if checksum != computed_checksum:
-                print(
-                    f"Checksum mismatch! expected {checksum}, got {computed_checksum}"
+                log.warning(
+                    LogCategory.COMM,
+                    "Checksum mismatch! expected %d, got %d",
+                    checksum,
+                    computed_checksum,
                 )
-                # Skip this header and try next byte
-                self.buffer = self.buffer[1:]
+                # Skip this header and resync on the next one
+                self.checksum_failures += 1
+                self._resync()
                 continue
 
-            try:
-                line_str = payload.decode("ascii").strip()
+            if payload_start == 2:
+                msg = self._parse_key_event(frame, frame_size)
+            else:
+                payload_end = frame_size - (2 if crc else 1)
+                payload = self._frame_view[payload_start:payload_end]
+                try:
+                    msg = self._parse_ascii(payload, verbose)
+                except Exception as e:
+                    log.warning(
+                        LogCategory.COMM,
+                        "Failed to parse payload: %s Error: %s",
+                        bytes(payload),
+                        e,
+                    )
+                    # Also discard header and try the next one
+                    self._resync()
+                    continue
+
+            self._frame_ok()
+
+            if msg is not None:
+                if verbose and payload_start == 2:
+                    log.debug(LogCategory.COMM, "received: %s", msg)
+                messages.append(msg)
 
-                if verbose:
-                    print("received:", line_str)
+            # Remove this message from the buffer
+            self._consume(frame_size)
 
-                parts = line_str.split(":")
-                if len(parts) < 3:
-                    print("Invalid message format:", line_str)
-                else:
-                    msg = OrderedDict()
-                    msg["timestamp"] = int(parts[0])
-                    msg["device_id"] = parts[1]
-                    msg["type"] = parts[2]
-                    msg["data"] = parts[3:]
+    def _drop_pending_frame(self):
+        """Overflow policy: discard the whole frame waiting at the read position"""
+        self.frames_dropped += 1
+        log.warning(
+            LogCategory.COMM, "Warning: parser buffer overflow, dropping pending frame"
+        )
 
-                    messages.append(msg)
+        layout = None
+        if self._peek(0) == HEADER_BYTE and self._count >= 3:
+            layout = self._frame_layout()
 
-            except Exception as e:
-                print("Failed to parse payload:", payload, "Error:", e)
-                # Also discard header and try next byte
-                self.buffer = self.buffer[1:]
-                continue
+        if layout and layout[0]:
+            self._consume(min(layout[0], self._count))
+        else:
+            self._consume(self._count)
 
-            # Remove this message from the buffer
-            self.buffer = self.buffer[3 + length + 1 :]
+    def parse(self, new_data: bytes, verbose=False) -> list[dict]:
+        messages = []
+        data = memoryview(new_data)
 
         if verbose:
-            print("messages: ", messages, "\n")
+            log.debug(LogCategory.COMM, "data: %s", bytes(new_data))
+
+        written = self._write(data)
+        self._parse_frames(messages, verbose)
+
+        # Burst larger than the free space, feed the rest in pieces
+        while written < len(data):
+            if self._count == self.buffer_size:
+                self._drop_pending_frame()
+
+            written += self._write(data[written:])
+            self._parse_frames(messages, verbose)
+
+        if verbose:
+            log.debug(LogCategory.COMM, "messages: %s\n", messages)
 
         return messages
 
 
-def encode_message(device_id: str, msg_type: str, data: dict, verbose=False) -> bytes:
+def encode_message(
+    device_id: str, msg_type: str, data: dict, verbose=False, crc=False
+) -> bytes:
     """
     Encodes a message in the format:
     HEADER(1) + LENGTH(2) + PAYLOAD(ascii) + CHECKSUM(1)
+    or with crc=True:
+    HEADER(1) + FRAME_ASCII_CRC(1) + LENGTH(2) + PAYLOAD(ascii) + CRC(2)
     """
     timestamp = time.monotonic_ns() // 1_000_000  # Timestamp in ms
 
@@ -108,69 +497,55 @@ def encode_message(device_id: str, msg_type: str, data: dict, verbose=False) ->
     payload_str = ":".join(fields) + "\n"
     payload_bytes = payload_str.encode("ascii")
 
-    # Compute length and checksum
     length = len(payload_bytes)
-    checksum = sum(payload_bytes) & 0xFF
 
     # Pack everything
     message = bytearray()
     message.append(HEADER_BYTE)
-    message += struct.pack(">H", length)  # 2 bytes, big endian
-    message += payload_bytes
-    message.append(checksum)
+
+    if crc:
+        message.append(FRAME_ASCII_CRC)
+        message += struct.pack(">H", length)  # 2 bytes, big endian
+        message += payload_bytes
+        checksum = crc16(message, 1)
+        message += struct.pack(">H", checksum)
+    else:
+        checksum = sum(payload_bytes) & 0xFF
+        message += struct.pack(">H", length)  # 2 bytes, big endian
+        message += payload_bytes
+        message.append(checksum)
 
     if verbose:
-        print(f"send: {payload_str.strip()} (len={length}, checksum={checksum})")
+        log.debug(
+            LogCategory.COMM,
+            "send: %s (len=%d, checksum=%d)",
+            payload_str.strip(),
+            length,
+            checksum,
+        )
 
     return bytes(message)
 
 
-def sync_messages(all_messages, now, verbose=False):
-    adjusted_msg = []
-    sync_offsets = {}
-
-    for msg in all_messages:
-        device_id = msg.get("device_id")
-        if device_id is None:
-            continue
-
-        print("msg", msg)
-        print("device_id", device_id)
-        print("timestamp", msg["timestamp"])
-        print("type", msg["type"])
-        print("data", msg["data"])
-
-        # Compute offset if not already done
-        if device_id not in sync_offsets:
-            sync_offsets[device_id] = now - msg["timestamp"]
-            if verbose:
-                print("sync_offset:", device_id, sync_offsets[device_id])
-
-        # Adjust timestamp
-        ordered_msg = OrderedDict(
-            (
-                ("timestamp", msg["timestamp"] + sync_offsets[device_id]),
-                ("device_id", device_id),
-                ("type", msg.get("type")),
-                ("data", msg.get("data")),
-            )
-        )
-        adjusted_msg.append(ordered_msg)
-
-    # Sort globally by adjusted timestamp
-    adjusted_msg.sort(key=lambda m: m["timestamp"])
-    return adjusted_msg
+def key_event_fields(msg) -> tuple[int, int, bool]:
+    """(col, row, pressed) of a parsed key_event message, ASCII or binary"""
+    data_fields = msg.get("data")
+    col = int(data_fields[0])
+    row = int(data_fields[1])
+    pressed = data_fields[2]
+    if isinstance(pressed, str):  # ASCII frames carry "True"/"False"
+        pressed = pressed.lower() == "true"
+    return col, row, pressed
 
 
 def debounce(messages, verbose=False):
+    """
+    Stateless debounce within a single frame.
+    MKX_Central keeps a persistent mkx.debouncer.Debouncer per device instead.
+    """
     debounced_msg = []
     key_states = {}
 
-    # TO DO - Upgrade to keep key_states across Timeframes
-    # if device_id not in self.key_states:
-    #     self.key_states[device_id] = {}
-    # key_states = self.key_states[device_id]
-
     for msg in messages:
         if msg.get("type") != "key_event":
             continue  # Ignore non-key_events
@@ -178,10 +553,7 @@ def debounce(messages, verbose=False):
         timestamp = msg.get("timestamp")
         device_id = msg.get("device_id")
         type = msg.get("type")
-        data_fields = msg.get("data")
-        col = int(data_fields[0])
-        row = int(data_fields[1])
-        pressed = data_fields[2].lower() == "true"
+        col, row, pressed = key_event_fields(msg)
 
         if None in (col, row, pressed):
             continue  # Skip malformed
@@ -194,7 +566,7 @@ def debounce(messages, verbose=False):
             "row": row,
             "pressed": pressed,
         }
-        print("normalized_msg:", normalized_msg)
+        log.debug(LogCategory.COMM, "normalized_msg: %s", normalized_msg)
 
         key = (device_id, col, row)
         state = key_states.get(key)
@@ -207,8 +579,9 @@ def debounce(messages, verbose=False):
                 key_states[key] = {"timestamp": timestamp, "pressed": pressed}
                 debounced_msg.append(normalized_msg)
             elif verbose:
-                print(
-                    "debounced:",
+                log.debug(
+                    LogCategory.COMM,
+                    "debounced: %s %d %s",
                     key,
                     timestamp - state["timestamp"],
                     debounced_msg,
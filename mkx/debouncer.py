@@ -0,0 +1,152 @@
+from array import array
+
+DEBOUNCE_MS = 5
+
+# Timestamps are kept as unsigned 32-bit ms, differences are taken modulo 2**32
+_TIME_MASK = 0xFFFFFFFF
+
+
+class DebounceMode:
+    """
+    EAGER       - report an edge at once, then ignore chatter for debounce_ms.
+                  If the key ends up in the other state when the window closes,
+                  the final state is reported by poll().
+    DEFERRED    - report an edge only after the key has been stable for debounce_ms.
+                  Filters noise spikes, adds debounce_ms latency to every event.
+    EAGER_PRESS - report a press at once, a release only after the key has been
+                  released for debounce_ms. Keeps presses fast on chattering
+                  switches, adds debounce_ms latency to releases only.
+    """
+
+    EAGER = 0
+    DEFERRED = 1
+    EAGER_PRESS = 2
+
+
+MODE_NAMES = ("EAGER", "DEFERRED", "EAGER_PRESS")
+
+
+class Debouncer:
+    """
+    Persistent debounce state for one device, kept across frames.
+    State lives in compact arrays indexed by the logical key index.
+    Every key has its own debounce time, set_key_debounce() lengthens it
+    for a worn switch without slowing down the others.
+    """
+
+    def __init__(self, num_keys, debounce_ms=DEBOUNCE_MS, mode=DebounceMode.EAGER):
+        if mode not in (
+            DebounceMode.EAGER,
+            DebounceMode.DEFERRED,
+            DebounceMode.EAGER_PRESS,
+        ):
+            raise ValueError(f"Invalid Debounce Mode: {mode}")
+
+        self.num_keys = num_keys
+        self.debounce_ms = debounce_ms
+        self.mode = mode
+
+        self.state = bytearray(num_keys)  # Debounced (reported) state
+        self.raw = bytearray(num_keys)  # Last raw state seen
+        self.stamp = array("L", [0] * num_keys)  # Last reported (EAGER) or raw edge
+        self.key_ms = array("H", [debounce_ms] * num_keys)  # Debounce time per key
+        self._pending = []  # Keys waiting for their debounce window to close
+
+    def set_key_debounce(self, index: int, debounce_ms: int):
+        """Debounce time of one key"""
+        self.key_ms[index] = debounce_ms
+
+    def latency_cost(self) -> tuple[int, int]:
+        """
+        Worst added latency (ms) of a clean press and release, with the
+        longest per-key debounce time. EAGER delays only an edge following
+        another one within the window.
+        """
+        longest = max(self.key_ms) if self.num_keys else self.debounce_ms
+        if self.mode == DebounceMode.DEFERRED:
+            return longest, longest
+        if self.mode == DebounceMode.EAGER_PRESS:
+            return 0, longest
+        return 0, 0
+
+    def describe(self) -> str:
+        press_ms, release_ms = self.latency_cost()
+        return (
+            f"{MODE_NAMES[self.mode]} {self.debounce_ms} ms, "
+            f"press +{press_ms} ms, release +{release_ms} ms"
+        )
+
+    def process(self, index: int, pressed: bool, timestamp: int) -> bool:
+        """Feed a raw edge, returns True if it should be reported right away."""
+        pressed = 1 if pressed else 0
+        self.raw[index] = pressed
+
+        if self.mode != DebounceMode.EAGER:
+            self.stamp[index] = timestamp & _TIME_MASK
+            if pressed == self.state[index]:
+                return False
+            if pressed and self.mode == DebounceMode.EAGER_PRESS:
+                self.state[index] = 1
+                return True
+            if index not in self._pending:
+                self._pending.append(index)
+            return False
+
+        if pressed == self.state[index]:
+            return False  # Chatter back to the reported state
+
+        if (timestamp - self.stamp[index]) & _TIME_MASK >= self.key_ms[index]:
+            self.state[index] = pressed
+            self.stamp[index] = timestamp & _TIME_MASK
+            return True
+
+        if index not in self._pending:
+            self._pending.append(index)
+        return False
+
+    def poll(self, now: int, out: list) -> list:
+        """
+        Append (index, pressed, timestamp) of edges whose debounce window
+        closed by now to out, and return it.
+        """
+        if not self._pending:
+            return out
+
+        i = 0
+        while i < len(self._pending):
+            index = self._pending[i]
+            if (now - self.stamp[index]) & _TIME_MASK < self.key_ms[index]:
+                i += 1
+                continue
+
+            self._pending.pop(i)
+            pressed = self.raw[index]
+            if pressed == self.state[index]:
+                continue
+
+            self.state[index] = pressed
+            if self.mode != DebounceMode.EAGER:
+                # Report with the time of the edge, durations stay accurate
+                out.append((index, bool(pressed), self.stamp[index]))
+            else:
+                self.stamp[index] = now & _TIME_MASK
+                out.append((index, bool(pressed), now))
+
+        return out
+
+    def is_pending(self) -> bool:
+        return bool(self._pending)
+
+    def next_deadline(self, now: int):
+        """
+        Time the first pending debounce window closes, on the timeline of now,
+        None if none is open. The stamps are masked, so is the elapsed time.
+        """
+        remaining = None
+        for index in self._pending:
+            left = self.key_ms[index] - ((now - self.stamp[index]) & _TIME_MASK)
+            if remaining is None or left < remaining:
+                remaining = left
+        if remaining is None:
+            return None
+        return now + max(remaining, 0)
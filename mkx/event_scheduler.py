@@ -0,0 +1,92 @@
+REORDER_MS = 3
+
+
+class EventScheduler:
+    """
+    Releases key events as soon as they are decoded, in timestamp order across halves.
+
+    An event is held only while another device could still deliver an earlier one.
+    The local half is scanned synchronously, so its clock is always current.
+    A remote half is current up to the last timestamp it sent, or up to
+    now - reorder_ms once it has gone quiet.
+    """
+
+    def __init__(self, local_device_id=None, reorder_ms=REORDER_MS):
+        self.local_device_id = local_device_id
+        self.reorder_ms = reorder_ms
+        self.watermarks = {}  # device_id -> latest timestamp seen (local timeline)
+        self._held = []  # (timestamp, device_id, logical_index, pressed, received), sorted
+
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.events = 0
+        self.held_events = 0
+        self.latency_total = 0
+        self.latency_max = 0
+
+    def stats(self) -> dict:
+        """Added latency (ms) between decoding and dispatching the events"""
+        return {
+            "events": self.events,
+            "held_events": self.held_events,
+            "latency_avg_ms": self.latency_total / self.events if self.events else 0,
+            "latency_max_ms": self.latency_max,
+        }
+
+    def advance(self, device_id: str, timestamp: int):
+        """Record that device_id has reported everything up to timestamp"""
+        if timestamp > self.watermarks.get(device_id, timestamp - 1):
+            self.watermarks[device_id] = timestamp
+
+    def push(self, event: tuple, received: int):
+        """Queue a (timestamp, device_id, logical_index, pressed) event decoded at received"""
+        entry = event + (received,)
+        held = self._held
+        i = len(held)
+        while i and held[i - 1][0] > entry[0]:
+            i -= 1
+        held.insert(i, entry)
+
+    def _ready(self, timestamp: int, device_id: str, now: int) -> bool:
+        if timestamp <= now - self.reorder_ms:
+            return True
+
+        for other, watermark in self.watermarks.items():
+            if other == device_id:
+                continue
+            if other == self.local_device_id:
+                watermark = now
+            if watermark < timestamp:
+                return False  # other may still send an earlier event
+        return True
+
+    def release(self, now: int, out: list) -> list:
+        """Append the events that can be dispatched by now to out, and return it"""
+        held = self._held
+        while held:
+            timestamp, device_id, logical_index, pressed, received = held[0]
+            if not self._ready(timestamp, device_id, now):
+                break
+
+            held.pop(0)
+            latency = now - received
+            self.events += 1
+            if latency > 0:
+                self.held_events += 1
+                self.latency_total += latency
+                if latency > self.latency_max:
+                    self.latency_max = latency
+
+            out.append((timestamp, device_id, logical_index, pressed))
+
+        return out
+
+    def next_release(self):
+        """Latest time the first held event is dispatched, None if nothing is held"""
+        if not self._held:
+            return None
+        return self._held[0][0] + self.reorder_ms
+
+    def is_pending(self) -> bool:
+        return bool(self._held)
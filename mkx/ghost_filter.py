@@ -0,0 +1,71 @@
+from mkx import log
+from mkx.log import LogCategory
+
+# Ghost keys appear on matrices without (or with a failed) diode: with three
+# corners of a rectangle pressed the fourth one reads as pressed as well.
+# The symptom is two drive lines sharing two or more pressed sense bits, only
+# lines with at least two bits set can take part, so the masks are filtered in
+# O(drive lines) and only those few lines are compared in pairs.
+
+
+class GhostMode:
+    """
+    FLAG     - pass all events, count and log the ghost patterns.
+    SUPPRESS - keep the keys of a ghost pattern in their previous state,
+               their presses are reported once the pattern is gone.
+    """
+
+    FLAG = 0
+    SUPPRESS = 1
+
+
+def ghost_masks(row_masks):
+    """Ambiguous bits of every drive line, None if there is no rectangle"""
+    multi = None
+    for i, mask in enumerate(row_masks):
+        if mask & (mask - 1):  # Two or more bits set
+            if multi is None:
+                multi = [i]
+            else:
+                multi.append(i)
+
+    if multi is None or len(multi) < 2:
+        return None
+
+    ghosts = None
+    for a in range(len(multi) - 1):
+        i = multi[a]
+        for j in multi[a + 1 :]:
+            shared = row_masks[i] & row_masks[j]
+            if shared & (shared - 1):
+                if ghosts is None:
+                    ghosts = [0] * len(row_masks)
+                ghosts[i] |= shared
+                ghosts[j] |= shared
+    return ghosts
+
+
+class GhostFilter:
+    def __init__(self, mode=GhostMode.SUPPRESS):
+        if mode not in (GhostMode.FLAG, GhostMode.SUPPRESS):
+            raise ValueError(f"Invalid Ghost Mode: {mode}")
+
+        self.mode = mode
+        self.count = 0  # Ghost patterns seen, each counted once while it lasts
+        self.ghosts = None  # Ambiguous bits of the last scan
+
+    def filter(self, new_masks, old_masks):
+        """Check the scanned masks, in SUPPRESS mode ambiguous bits keep old_masks"""
+        ghosts = ghost_masks(new_masks)
+        if ghosts is not None and ghosts != self.ghosts:
+            self.count += 1
+            log.warning(LogCategory.KEYS, "Ghost keys in the matrix: %s", ghosts)
+        self.ghosts = ghosts
+
+        if ghosts is None or self.mode == GhostMode.FLAG:
+            return new_masks
+
+        for i, ghost in enumerate(ghosts):
+            if ghost:
+                new_masks[i] = (new_masks[i] & ~ghost) | (old_masks[i] & ghost)
+        return new_masks
@@ -0,0 +1,101 @@
+"""
+Keyboard for the NKRO device of device_nkro_keyboard.py (boot_cfg(nkro=True)).
+
+The report is the modifier byte followed by a 120 bit key bitmap, so any
+number of keys can be held at once. It replaces adafruit_hid.keyboard.Keyboard,
+which only speaks the 6KRO boot report, with the same press/release interface.
+"""
+
+import time
+
+from mkx import log
+from mkx.log import LogCategory
+
+REPORT_LENGTH = 16
+KEY_BITS = (REPORT_LENGTH - 1) * 8  # Usages 0..119
+MODIFIER_MIN = 0xE0
+MODIFIER_MAX = 0xE7
+
+
+def find_nkro_device(devices):
+    """
+    Returns the keyboard device taking the 16 byte NKRO report, None if there is none.
+    The stock keyboard rejects the length, the NKRO one gets an all released report.
+    Before USB enumeration completes the send fails with OSError, like adafruit_hid
+    it is retried once after a second.
+    """
+    report = bytes(REPORT_LENGTH)
+    for device in devices:
+        if device.usage_page != 0x01 or device.usage != 0x06:
+            continue
+        try:
+            try:
+                device.send_report(report)
+            except OSError:
+                time.sleep(1)
+                device.send_report(report)
+        except ValueError:
+            continue
+        return device
+    return None
+
+
+class KeyboardNKRO:
+    def __init__(self, device):
+        self.device = device
+        self.report = bytearray(REPORT_LENGTH)
+        self._sent = bytearray(REPORT_LENGTH)
+
+    def _set(self, keycode, pressed: bool) -> bool:
+        if keycode is None:
+            return False
+
+        if MODIFIER_MIN <= keycode <= MODIFIER_MAX:
+            byte = 0
+            mask = 1 << (keycode - MODIFIER_MIN)
+        elif 0 <= keycode < KEY_BITS:
+            byte = 1 + (keycode >> 3)
+            mask = 1 << (keycode & 0x07)
+        else:
+            log.warning(LogCategory.KEYS, "NKRO: keycode 0x%02X out of range", keycode)
+            return False
+
+        if pressed:
+            self.report[byte] |= mask
+        else:
+            self.report[byte] &= ~mask
+        return True
+
+    def _send(self):
+        """Send the report only if it changed since the last one"""
+        if self.report != self._sent:
+            self.device.send_report(self.report)
+            self._sent[:] = self.report
+
+    def press(self, *keycodes):
+        for keycode in keycodes:
+            self._set(keycode, True)
+        self._send()
+
+    def release(self, *keycodes):
+        for keycode in keycodes:
+            self._set(keycode, False)
+        self._send()
+
+    def update(self, pressed, released):
+        """Release and press keycodes in a single report"""
+        for keycode in released:
+            self._set(keycode, False)
+        for keycode in pressed:
+            self._set(keycode, True)
+        self._send()
+
+    def release_all(self):
+        for i in range(REPORT_LENGTH):
+            self.report[i] = 0
+        self._send()
+
+    def send(self, *keycodes):
+        """Press and release keycodes"""
+        self.press(*keycodes)
+        self.release_all()
@@ -0,0 +1,96 @@
+MODIFIER_MIN = 0xE0
+MODIFIER_MAX = 0xE7
+
+
+def _is_modifier(keycode) -> bool:
+    return MODIFIER_MIN <= keycode <= MODIFIER_MAX
+
+
+class KeyboardBatcher:
+    """
+    Collects the key changes of one run_once pass and sends them in one report.
+
+    Sits between the keys and the keyboard (adafruit_hid Keyboard or KeyboardNKRO)
+    with the same press/release interface, flush() is called once per pass.
+    Changes the host has to see in order are sent early:
+      - a release of a key pressed in this batch (SEQ taps),
+      - a press of a key released in this batch (repeated taps),
+      - a modifier change while a key press is pending, so the key keeps
+        the modifiers it was pressed with (MOD, shifted SEQ steps).
+    """
+
+    def __init__(self, keyboard):
+        self.keyboard = keyboard
+        self._held = set()  # Keycodes the host holds
+        self._pressed = []  # Pending presses, in order
+        self._released = []  # Pending releases, in order
+        self._key_pending = False  # A non-modifier press is pending
+        self.reports = 0  # Flushes that sent a change
+
+    def _pending(self) -> bool:
+        return bool(self._pressed or self._released)
+
+    def press(self, *keycodes):
+        for keycode in keycodes:
+            if keycode is None:
+                continue
+
+            modifier = _is_modifier(keycode)
+            if keycode in self._released or (modifier and self._key_pending):
+                self.flush()
+
+            if keycode in self._held or keycode in self._pressed:
+                continue
+            self._pressed.append(keycode)
+            if not modifier:
+                self._key_pending = True
+
+    def release(self, *keycodes):
+        for keycode in keycodes:
+            if keycode is None:
+                continue
+
+            if keycode in self._pressed or (
+                self._key_pending and _is_modifier(keycode)
+            ):
+                self.flush()
+
+            if keycode in self._held and keycode not in self._released:
+                self._released.append(keycode)
+
+    def release_all(self):
+        self.flush()
+        self.keyboard.release_all()
+        self._held.clear()
+
+    def send(self, *keycodes):
+        """Press and release keycodes"""
+        self.press(*keycodes)
+        self.release_all()
+
+    def flush(self):
+        """Send the pending changes, releases before presses"""
+        if not self._pending():
+            return
+
+        pressed = self._pressed
+        released = self._released
+        keyboard = self.keyboard
+
+        if hasattr(keyboard, "update"):
+            keyboard.update(pressed, released)  # One report
+        else:
+            if released:
+                keyboard.release(*released)
+            if pressed:
+                keyboard.press(*pressed)
+
+        for keycode in released:
+            self._held.discard(keycode)
+        for keycode in pressed:
+            self._held.add(keycode)
+
+        pressed.clear()
+        released.clear()
+        self._key_pending = False
+        self.reports += 1
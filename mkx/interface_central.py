@@ -1,3 +1,5 @@
+from mkx import log
+from mkx.log import LogCategory
 from mkx.interface_abstract import InterfaceAbstract
 from mkx.communication_message import MessageParser
 
@@ -17,15 +19,20 @@ class InterfaceCentral(InterfaceAbstract):
         pass  # Not needed
 
     def receive(self, verbose=False):
+        # Key events come already structured from the periphery's queue
+        messages = self.central_periphery.drain_key_events([])
+        if verbose and messages:
+            log.debug(LogCategory.COMM, "received: %s", messages)
+
         try:
             data = self.central_periphery.payload
             self.central_periphery.payload = None
             if data:
-                return self.msg_parser.parse(data, verbose)
+                messages.extend(self.msg_parser.parse(data, verbose))
         except Exception as e:
             print(f"[{self.device_id}] Central read error: {e}")
             self.uart = None  # Mark as disconnected
-        return []
+        return messages
 
     def send(self, msg_type: str, data: dict, verbose=False):
         pass  # Placeholder for sending messages from central to perypheries
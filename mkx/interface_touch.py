@@ -1,6 +1,10 @@
 from mkx.interface_abstract import InterfaceAbstract
+from mkx import log
+from mkx.log import LogCategory
 from mkx.ansi_colors import Ansi, Ansi256
 
+_MSG_KEY = f"{Ansi256.SKY}Logical key {Ansi256.PEACH}%d %s{Ansi.RESET}"
+
 
 class InterfaceTouch(InterfaceAbstract):
     def __init__(self, col_min, row_min, col_max, row_max):
@@ -127,11 +131,11 @@ class InterfaceTouch(InterfaceAbstract):
         """
         THRESHOLD = 10  # Threshold for active electrode
 
-        print(f"values: {values}")
+        log.debug(LogCategory.TOUCH, "values: %s", values)
 
         # Determine active electrodes based on threshold
         current_active = {ele for ele, value in values.items() if value > THRESHOLD}
-        print(f"current_active: {current_active}")
+        log.debug(LogCategory.TOUCH, "current_active: %s", current_active)
 
         events = []
 
@@ -154,16 +158,12 @@ class InterfaceTouch(InterfaceAbstract):
                 # Release old key
                 if prev_key is not None:
                     events.append((prev_key, False))
-                    print(
-                        f"{Ansi256.SKY}Logical key {Ansi256.PEACH}{prev_key} released{Ansi.RESET}"
-                    )
+                    log.debug(LogCategory.TOUCH, _MSG_KEY, prev_key, "released")
 
                 # Press new key
                 if current_key is not None:
                     events.append((current_key, True))
-                    print(
-                        f"{Ansi256.SKY}Logical key {Ansi256.PEACH}{current_key} pressed{Ansi.RESET}"
-                    )
+                    log.debug(LogCategory.TOUCH, _MSG_KEY, current_key, "pressed")
         else:
             # Single electrode mode: track state changes per electrode
             prev_active = self._last_active.get(address, set())
@@ -179,17 +179,13 @@ class InterfaceTouch(InterfaceAbstract):
                 logical_index = self.get_logical_index_for_electrode(address, ele)
                 if logical_index is not None:
                     events.append((logical_index, True))
-                    print(
-                        f"{Ansi256.SKY}Logical key {Ansi256.PEACH}{logical_index} pressed{Ansi.RESET}"
-                    )
+                    log.debug(LogCategory.TOUCH, _MSG_KEY, logical_index, "pressed")
 
             for ele in released:
                 logical_index = self.get_logical_index_for_electrode(address, ele)
                 if logical_index is not None:
                     events.append((logical_index, False))
-                    print(
-                        f"{Ansi256.SKY}Logical key {Ansi256.PEACH}{logical_index} released{Ansi.RESET}"
-                    )
+                    log.debug(LogCategory.TOUCH, _MSG_KEY, logical_index, "released")
 
         return events
 
@@ -1,8 +1,13 @@
 from mkx.interface_abstract import InterfaceAbstract
 from mkx.slider_event import SliderEvent
+from mkx import log
+from mkx.log import LogCategory
 from mkx.ansi_colors import Ansi, Ansi256
 from mkx.error import halt_on_error
 
+_MSG_VALUE = f"{Ansi256.SKY}[Slider] %s: {Ansi256.PEACH}%.3f{Ansi.RESET}"
+_MSG_STEPS = f"{Ansi256.SKY}[Slider] steps: {Ansi256.PEACH}%d{Ansi.RESET}"
+
 
 class InterfaceTouchSlider(InterfaceAbstract):
     def __init__(
@@ -105,12 +110,8 @@ class InterfaceTouchSlider(InterfaceAbstract):
         # Map to slider range
         value = self.value_min + norm * (self.value_max - self.value_min)
 
-        print(
-            f"{Ansi256.SKY}[Slider] normalized: {Ansi256.PEACH}{norm:.2f}{Ansi.RESET}"
-        )
-        print(
-            f"{Ansi256.SKY}[Slider] absolute value: {Ansi256.PEACH}{value:.3f}{Ansi.RESET}"
-        )
+        log.debug(LogCategory.TOUCH, _MSG_VALUE, "normalized", norm)
+        log.debug(LogCategory.TOUCH, _MSG_VALUE, "absolute value", value)
 
         return value
 
@@ -119,7 +120,7 @@ class InterfaceTouchSlider(InterfaceAbstract):
 
         delta = value - self._last_value
         self._last_value = value
-        print(f"{Ansi256.SKY}[Slider] delta: {Ansi256.PEACH}{delta:.3f}{Ansi.RESET}")
+        log.debug(LogCategory.TOUCH, _MSG_VALUE, "delta", delta)
 
         if self.dynamic_step:
             step_size_to_use = self._get_dynamic_step_size(delta)
@@ -128,9 +129,7 @@ class InterfaceTouchSlider(InterfaceAbstract):
 
         # Accumulate motion
         self.motion_accumulator += delta
-        print(
-            f"{Ansi256.SKY}[Slider] accumulated: {Ansi256.PEACH}{self.motion_accumulator:.3f}{Ansi.RESET}"
-        )
+        log.debug(LogCategory.TOUCH, _MSG_VALUE, "accumulated", self.motion_accumulator)
 
         # Convert accumulated motion to discrete steps
         steps = int(self.motion_accumulator / step_size_to_use)
@@ -143,7 +142,7 @@ class InterfaceTouchSlider(InterfaceAbstract):
             )
             self.motion_accumulator -= steps * step_size_to_use
 
-            print(f"{Ansi256.SKY}[Slider] steps: {Ansi256.PEACH}{steps}{Ansi.RESET}")
+            log.debug(LogCategory.TOUCH, _MSG_STEPS, steps)
 
             # Generate press-release events
             key_increase, key_decrease = self._get_slider_keys(current_layer)
@@ -168,9 +167,7 @@ class InterfaceTouchSlider(InterfaceAbstract):
             if value is not None:
                 if self._last_value is None:
                     self._last_value = value
-                    print(
-                        f"{Ansi256.SKY}[Slider] initial position set to {Ansi256.PEACH}{value:.3f}{Ansi.RESET}"
-                    )
+                    log.debug(LogCategory.TOUCH, _MSG_VALUE, "initial position", value)
                 else:
                     events = self._resolve_delta(value, current_layer)
         else:
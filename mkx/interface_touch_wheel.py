@@ -1,7 +1,12 @@
 from mkx.interface_touch_slider import InterfaceTouchSlider
 from mkx.slider_event import SliderEvent
+from mkx import log
+from mkx.log import LogCategory
 from mkx.ansi_colors import Ansi, Ansi256
 
+_MSG_VALUE = f"{Ansi256.SKY}[Wheel] %s: {Ansi256.PEACH}%.3f{Ansi.RESET}"
+_MSG_STEPS = f"{Ansi256.SKY}[Wheel] steps: {Ansi256.PEACH}%d{Ansi.RESET}"
+
 
 class InterfaceTouchWheel(InterfaceTouchSlider):
     def __init__(
@@ -60,10 +65,8 @@ class InterfaceTouchWheel(InterfaceTouchSlider):
 
         value = self.value_min + norm * (self.value_max - self.value_min)
 
-        print(f"{Ansi256.SKY}[Wheel] normalized: {Ansi256.PEACH}{norm:.3f}{Ansi.RESET}")
-        print(
-            f"{Ansi256.SKY}[Wheel] absolute value: {Ansi256.PEACH}{value:.3f}{Ansi.RESET}"
-        )
+        log.debug(LogCategory.TOUCH, _MSG_VALUE, "normalized", norm)
+        log.debug(LogCategory.TOUCH, _MSG_VALUE, "absolute value", value)
 
         return value
 
@@ -86,7 +89,7 @@ class InterfaceTouchWheel(InterfaceTouchSlider):
         elif delta < -0.5:
             delta += 1.0
 
-        print(f"{Ansi256.SKY}[Wheel] delta: {Ansi256.PEACH}{delta:.3f}{Ansi.RESET}")
+        log.debug(LogCategory.TOUCH, _MSG_VALUE, "delta", delta)
 
         if self.dynamic_step:
             step_size_to_use = self._get_dynamic_step_size(delta)
@@ -105,7 +108,7 @@ class InterfaceTouchWheel(InterfaceTouchSlider):
 
             self.motion_accumulator -= steps * step_size_to_use
 
-            print(f"{Ansi256.SKY}[Wheel] steps: {Ansi256.PEACH}{steps}{Ansi.RESET}")
+            log.debug(LogCategory.TOUCH, _MSG_STEPS, steps)
 
             key_inc, key_dec = self._get_slider_keys(current_layer)
 
@@ -22,7 +22,8 @@ class InterfaceUART(InterfaceAbstract):
         self.rx_pin = rx_pin
         self.baudrate = baudrate
         self.uart = None
-        self.msg_parser = MessageParser()
+        self.msg_parser = MessageParser(baudrate=baudrate)
+        self.msg_parser.register_device(device_id)
 
         self.reconnect()
 
@@ -0,0 +1,242 @@
+"""
+Lazy key namespace, a key object is created only when a keymap uses its name.
+
+    from mkx import kc
+
+    keymap = [[kc.ESC, kc.A, kc.LSFT, kc.MB_LC, kc.VOLU, kc.TRNS]]
+
+Importing keys_standard, keys_media or keys_mouse creates every key and alias
+up front. Here all aliases of a key share one object, created on the first
+access through the module __getattr__ and kept as a module attribute after.
+Use kc.NAME or `from mkx.kc import A, B`, `import *` only sees keys created so far.
+"""
+
+from mkx.keys_standard_core import KeysStandard, TRANSPARENT
+
+# The layers resolve transparency by identity, so these are the shared marker
+TRNS = _______ = TRANSPARENT
+
+# fmt: off
+
+# (Keycode attribute, names...)
+_STANDARD = (
+    (None, "NO", "XXXXXXX"),
+    # letters
+    ("A", "A"),
+    ("B", "B"),
+    ("C", "C"),
+    ("D", "D"),
+    ("E", "E"),
+    ("F", "F"),
+    ("G", "G"),
+    ("H", "H"),
+    ("I", "I"),
+    ("J", "J"),
+    ("K", "K"),
+    ("L", "L"),
+    ("M", "M"),
+    ("N", "N"),
+    ("O", "O"),
+    ("P", "P"),
+    ("Q", "Q"),
+    ("R", "R"),
+    ("S", "S"),
+    ("T", "T"),
+    ("U", "U"),
+    ("V", "V"),
+    ("W", "W"),
+    ("X", "X"),
+    ("Y", "Y"),
+    ("Z", "Z"),
+    # numbers
+    ("ONE", "ONE", "N1"),
+    ("TWO", "TWO", "N2"),
+    ("THREE", "THREE", "N3"),
+    ("FOUR", "FOUR", "N4"),
+    ("FIVE", "FIVE", "N5"),
+    ("SIX", "SIX", "N6"),
+    ("SEVEN", "SEVEN", "N7"),
+    ("EIGHT", "EIGHT", "N8"),
+    ("NINE", "NINE", "N9"),
+    ("ZERO", "ZERO", "N0"),
+    # punctuation
+    ("MINUS", "MINUS", "MINS"),
+    ("EQUALS", "EQUALS", "EQUAL", "EQL"),
+    ("LEFT_BRACKET", "LEFT_BRACKET", "LBRACKET", "LBRC"),
+    ("RIGHT_BRACKET", "RIGHT_BRACKET", "RBRACKET", "RBRC"),
+    ("BACKSLASH", "BACKSLASH", "BSLASH", "BSLS"),
+    ("POUND", "POUND"),
+    ("SEMICOLON", "SEMICOLON", "SCOLON", "SCLN"),
+    ("QUOTE", "QUOTE", "QUOT"),
+    ("GRAVE_ACCENT", "GRAVE_ACCENT", "GRAVE", "GRV", "ZKHK"),
+    ("COMMA", "COMMA", "COMM"),
+    ("PERIOD", "PERIOD", "DOT"),
+    ("FORWARD_SLASH", "FORWARD_SLASH", "SLASH", "SLSH"),
+    # functions
+    ("F1", "F1"),
+    ("F2", "F2"),
+    ("F3", "F3"),
+    ("F4", "F4"),
+    ("F5", "F5"),
+    ("F6", "F6"),
+    ("F7", "F7"),
+    ("F8", "F8"),
+    ("F9", "F9"),
+    ("F10", "F10"),
+    ("F11", "F11"),
+    ("F12", "F12"),
+    ("F13", "F13"),
+    ("F14", "F14"),
+    ("F15", "F15"),
+    ("F16", "F16"),
+    ("F17", "F17"),
+    ("F18", "F18"),
+    ("F19", "F19"),
+    ("F20", "F20"),
+    ("F21", "F21"),
+    ("F22", "F22"),
+    ("F23", "F23"),
+    ("F24", "F24"),
+    # navigation
+    ("INSERT", "INSERT", "INS"),
+    ("HOME", "HOME"),
+    ("PAGE_UP", "PAGE_UP", "PGUP"),
+    ("DELETE", "DELETE", "DEL"),
+    ("END", "END"),
+    ("PAGE_DOWN", "PAGE_DOWN", "PGDN"),
+    ("RIGHT_ARROW", "RIGHT_ARROW", "RIGHT", "RGHT"),
+    ("LEFT_ARROW", "LEFT_ARROW", "LEFT"),
+    ("DOWN_ARROW", "DOWN_ARROW", "DOWN"),
+    ("UP_ARROW", "UP_ARROW", "UP"),
+    # numpad
+    ("KEYPAD_NUMLOCK", "KEYPAD_NUMLOCK", "NUMLOCK", "NLCK"),
+    ("KEYPAD_FORWARD_SLASH", "KEYPAD_FORWARD_SLASH", "KP_SLASH", "PSLS"),
+    ("KEYPAD_ASTERISK", "KEYPAD_ASTERISK", "KP_ASTERISK", "PAST"),
+    ("KEYPAD_MINUS", "KEYPAD_MINUS", "KP_MINUS", "PMNS"),
+    ("KEYPAD_PLUS", "KEYPAD_PLUS", "KP_PLUS", "PPLS"),
+    ("KEYPAD_ENTER", "KEYPAD_ENTER", "KP_ENTER", "PENT"),
+    ("KEYPAD_ONE", "KEYPAD_ONE", "KP_1", "P1"),
+    ("KEYPAD_TWO", "KEYPAD_TWO", "KP_2", "P2"),
+    ("KEYPAD_THREE", "KEYPAD_THREE", "KP_3", "P3"),
+    ("KEYPAD_FOUR", "KEYPAD_FOUR", "KP_4", "P4"),
+    ("KEYPAD_FIVE", "KEYPAD_FIVE", "KP_5", "P5"),
+    ("KEYPAD_SIX", "KEYPAD_SIX", "KP_6", "P6"),
+    ("KEYPAD_SEVEN", "KEYPAD_SEVEN", "KP_7", "P7"),
+    ("KEYPAD_EIGHT", "KEYPAD_EIGHT", "KP_8", "P8"),
+    ("KEYPAD_NINE", "KEYPAD_NINE", "KP_9", "P9"),
+    ("KEYPAD_ZERO", "KEYPAD_ZERO", "KP_0", "P0"),
+    ("KEYPAD_PERIOD", "KEYPAD_PERIOD", "KP_DOT", "PDOT"),
+    ("KEYPAD_BACKSLASH", "KEYPAD_BACKSLASH", "KP_BSLASH", "PBSL"),
+    ("KEYPAD_EQUALS", "KEYPAD_EQUALS", "KP_EQUAL", "PEQL"),
+    # modifiers
+    ("LEFT_CONTROL", "LEFT_CONTROL", "CONTROL", "LCTRL", "LCTL"),
+    ("LEFT_SHIFT", "LEFT_SHIFT", "SHIFT", "LSHIFT", "LSFT"),
+    ("LEFT_ALT", "LEFT_ALT", "ALT", "OPTION", "OPT", "LALT"),
+    ("LEFT_GUI", "LEFT_GUI", "GUI", "WINDOWS", "WIN", "COMMAND", "CMD",
+     "LGUI", "LCMD", "LWIN"),
+    ("RIGHT_CONTROL", "RIGHT_CONTROL", "RCTRL", "RCTL"),
+    ("RIGHT_SHIFT", "RIGHT_SHIFT", "RSHIFT", "RSFT"),
+    ("RIGHT_ALT", "RIGHT_ALT", "RALT"),
+    ("RIGHT_GUI", "RIGHT_GUI", "RGUI", "RCMD", "RWIN"),
+    # special
+    ("ENTER", "ENTER", "RETURN", "ENT"),
+    ("ESCAPE", "ESCAPE", "ESC"),
+    ("BACKSPACE", "BACKSPACE", "BSPACE", "BSPC"),
+    ("TAB", "TAB"),
+    ("SPACEBAR", "SPACEBAR", "SPACE", "SPC"),
+    ("CAPS_LOCK", "CAPS_LOCK", "CAPSLOCK", "CAPS", "CLCK"),
+    ("PRINT_SCREEN", "PRINT_SCREEN", "PSCREEN", "PSCR"),
+    ("SCROLL_LOCK", "SCROLL_LOCK", "SCROLLOCK", "SLCK"),
+    ("PAUSE", "PAUSE", "PAUS", "BRK"),
+    ("APPLICATION", "APPLICATION", "APP"),
+    ("POWER", "POWER", "POW"),
+)
+
+# (ConsumerControlCode attribute, names...)
+_MEDIA = (
+    ("PLAY_PAUSE", "PLAY_PAUSE", "MPLY", "MEDIA_PLAY_PAUSE"),
+    ("STOP", "STOP", "MSTP", "MEDIA_STOP"),
+    ("MUTE", "MUTE", "AUDIO_MUTE"),
+    ("VOLUME_INCREMENT", "VOLU", "AUDIO_VOL_UP", "VOLUME_INCREMENT"),
+    ("VOLUME_DECREMENT", "VOLD", "AUDIO_VOL_DOWN", "VOLUME_DECREMENT"),
+    ("BRIGHTNESS_INCREMENT", "BRIU", "BRIGHTNESS_UP", "BRIGHTNESS_INCREMENT"),
+    ("BRIGHTNESS_DECREMENT", "BRID", "BRIGHTNESS_DOWN", "BRIGHTNESS_DECREMENT"),
+    ("SCAN_NEXT_TRACK", "MNXT", "MEDIA_NEXT_TRACK", "SCAN_NEXT_TRACK"),
+    ("SCAN_PREVIOUS_TRACK", "MPRV", "MEDIA_PREV_TRACK", "SCAN_PREVIOUS_TRACK"),
+    ("EJECT", "EJCT", "MEDIA_EJECT", "EJECT"),
+    ("FAST_FORWARD", "MFFD", "MEDIA_FAST_FORWARD", "FAST_FORWARD"),
+    ("REWIND", "MRWD", "MEDIA_REWIND", "REWIND"),
+    ("RECORD", "MREC", "MEDIA_RECORD", "RECORD"),
+)
+
+# ((action, Mouse button attribute or move steps), names...)
+_MOUSE = (
+    (("click", "LEFT_BUTTON"), "LMB", "MB_LC", "MB_LEFT_CLICK"),
+    (("click", "RIGHT_BUTTON"), "RMB", "MB_RC", "MB_RIGHT_CLICK"),
+    (("click", "MIDDLE_BUTTON"), "MMB", "MB_MC", "MB_MIDDLE_CLICK"),
+    (("click", "BACK_BUTTON"), "BMB", "MB_BC", "MB_BACK_CLICK"),
+    (("click", "FORWARD_BUTTON"), "FMB", "MB_FC", "MB_FORWARD_CLICK"),
+    (("press", "LEFT_BUTTON"), "MB_LP", "MB_LEFT_PRESS"),
+    (("press", "RIGHT_BUTTON"), "MB_RP", "MB_RIGHT_PRESS"),
+    (("press", "MIDDLE_BUTTON"), "MB_MP", "MB_MIDDLE_PRESS"),
+    (("press", "BACK_BUTTON"), "MB_BP", "MB_BACK_PRESS"),
+    (("press", "FORWARD_BUTTON"), "MB_FP", "MB_FORWARD_PRESS"),
+    (("release", "LEFT_BUTTON"), "MB_LR", "MB_LEFT_RELEASE"),
+    (("release", "RIGHT_BUTTON"), "MB_RR", "MB_RIGHT_RELEASE"),
+    (("release", "MIDDLE_BUTTON"), "MB_R", "MB_MIDDLE_RELEASE"),
+    (("release", "BACK_BUTTON"), "MB_BR", "MB_BACK_RELEASE"),
+    (("release", "FORWARD_BUTTON"), "MB_FR", "MB_FORWARD_RELEASE"),
+    (("move", 1, 0), "MB_MR", "MB_MOVE_RIGHT"),
+    (("move", -1, 0), "MB_ML", "MB_MOVE_LEFT"),
+    (("move", 0, 1), "MB_MU", "MB_MOVE_UP"),
+    (("move", 0, -1), "MB_MD", "MB_MOVE_DOWN"),
+    (("move", 0, 0, 1), "MB_SU", "MB_SCROLL_UP"),
+    (("move", 0, 0, -1), "MB_SD", "MB_SCROLL_DOWN"),
+)
+# fmt: on
+
+created = 0  # Key objects created so far
+
+
+def _standard(code, name):
+    from adafruit_hid.keycode import Keycode
+
+    return KeysStandard(getattr(Keycode, code) if code else None, name)
+
+
+def _media(code, name):
+    from adafruit_hid.consumer_control_code import ConsumerControlCode
+    from mkx.keys_media_core import KeysMedia
+
+    return KeysMedia(getattr(ConsumerControlCode, code), name)
+
+
+def _mouse(spec, name):
+    from adafruit_hid.mouse import Mouse
+    from mkx.keys_mouse_core import KeysMouse
+
+    action = spec[0]
+    if action == "move":
+        return KeysMouse(name, action, *spec[1:])
+    return KeysMouse(name, action, getattr(Mouse, spec[1]))
+
+
+_TABLES = ((_STANDARD, _standard), (_MEDIA, _media), (_MOUSE, _mouse))
+
+
+def __getattr__(name):
+    global created
+
+    for table, build in _TABLES:
+        for entry in table:
+            if name in entry[1:]:
+                key = build(entry[0], entry[1])
+                created += 1
+
+                # Every alias resolves to this object from now on
+                module = globals()
+                for alias in entry[1:]:
+                    module[alias] = key
+                return key
+
+    raise AttributeError(f"mkx.kc has no key {name}")
@@ -0,0 +1,57 @@
+from mkx.keys_standard_core import TRANSPARENT
+
+MAX_TABLES = 8
+
+
+class KeymapCompiler:
+    """
+    Resolves the keymap once per distinct active-layer stack.
+
+    A table maps the logical index to the key of the topmost active layer
+    whose key is not transparent, so a press costs a single list index.
+    Tables are cached per stack, the current table is looked up again only
+    when the LayersManager reports a change.
+    """
+
+    def __init__(self, keymap, transparent=TRANSPARENT, max_tables=MAX_TABLES):
+        self.keymap = keymap
+        self.transparent = transparent
+        self.max_tables = max_tables
+
+        self._tables = {}  # tuple(active_layers) -> resolved list of keys
+        self._table = None
+        self._version = None
+
+    def compile(self, active_layers) -> list:
+        """Resolved table of the given layer stack (bottom first)"""
+        stack = tuple(active_layers)
+        table = self._tables.get(stack)
+        if table is None:
+            if len(self._tables) >= self.max_tables:
+                self._tables.clear()  # Keep RAM bounded, stacks are rebuilt on demand
+            table = self._build(stack)
+            self._tables[stack] = table
+        return table
+
+    def _build(self, stack) -> list:
+        size = len(self.keymap[0]) if self.keymap else 0
+        table = [self.transparent] * size
+
+        # Walk bottom to top, upper non-transparent keys override lower ones
+        for layer in stack:
+            if not 0 <= layer < len(self.keymap):
+                continue
+            keys = self.keymap[layer]
+            for i in range(size):
+                if keys[i] is not self.transparent:
+                    table[i] = keys[i]
+
+        return table
+
+    def get_key(self, layers_manager, logical_index: int):
+        if layers_manager.version != self._version:
+            self._table = self.compile(
+                layers_manager.active_layers or (layers_manager.default_layer,)
+            )
+            self._version = layers_manager.version
+        return self._table[logical_index]
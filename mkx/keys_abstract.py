@@ -3,10 +3,29 @@ from adafruit_hid.keyboard import Keyboard
 from mkx.manager_layers import LayersManager
 
 
+class KeyFlags:
+    """
+    Capability bits of a key class, read by process_key_event.
+
+    LAYER  - the press only changes layers, no further handling.
+    TIMED  - registered with the TimedKeysManager after the press (see TimedKeys).
+    STICKY - registered with the StickyKeyManager, its release keeps the stickies.
+    MACRO  - a sequence of keys, expanded in place when queued by the MacroPlayer.
+    """
+
+    NONE = 0
+    LAYER = 1
+    TIMED = 2
+    STICKY = 4
+    MACRO = 8
+
+
 class KeysAbstract:
     """
     Abstract base class for all key types.
     Subclasses must implement `on_press` and `on_release`.
+    Set the class attribute `flags` (KeyFlags) to opt into layer, timed or sticky handling,
+    TimedKeys and SK subclasses get their bit without it.
     """
 
     __slots__ = ("_is_pressed",)
@@ -1,11 +1,15 @@
 from adafruit_hid.keyboard import Keyboard
 
-from mkx.keys_abstract import KeysAbstract
+from mkx import log
+from mkx.log import LogCategory
+from mkx.keys_abstract import KeysAbstract, KeyFlags
 from mkx.timed_keys import TimedKeys
 from mkx.manager_layers import LayersManager
 
 
 class HT(KeysAbstract, TimedKeys):
+    flags = KeyFlags.TIMED
+
     def __init__(self, tap_key: KeysAbstract, hold_key: KeysAbstract, timeout=200):
         KeysAbstract.__init__(self)
         TimedKeys.__init__(self)
@@ -26,7 +30,9 @@ class HT(KeysAbstract, TimedKeys):
         self, layer_manager: LayersManager, keyboard: Keyboard, timestamp: int
     ):
         if self._pressed_time is None:
-            print("HT.on_release called without valid press time!")
+            log.warning(
+                LogCategory.TIMERS, "HT.on_release called without valid press time!"
+            )
             return
 
         duration = timestamp - self._pressed_time
@@ -35,17 +41,24 @@ class HT(KeysAbstract, TimedKeys):
             if self._hold_sent:
                 self._hold_key.on_release(layer_manager, keyboard, timestamp)
             else:
-                print("HT: hold timeout passed but hold was not sent!")
+                log.warning(
+                    LogCategory.TIMERS, "HT: hold timeout passed but hold was not sent!"
+                )
         else:
             duration = timestamp - self._pressed_time
             if duration < self._timeout:
                 self._tap_key.on_press(layer_manager, keyboard, timestamp)
                 self._tap_key.on_release(layer_manager, keyboard, timestamp)
             else:
-                print("HT: tap too late, ignoring!")
+                log.debug(LogCategory.TIMERS, "HT: tap too late, ignoring!")
 
         self.stop_timer()
 
+    def deadline(self):
+        if self._pressed_time is None or self._held_past_timeout:
+            return None
+        return self._pressed_time + self._timeout
+
     def check_time(
         self, layer_manager: LayersManager, keyboard: Keyboard, timestamp: int
     ):
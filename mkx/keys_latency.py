@@ -0,0 +1,28 @@
+from mkx import latency
+from mkx.keys_abstract import KeysAbstract
+
+
+class KeysLatency(KeysAbstract):
+    """
+    Prints the latency summary of the loop stages, optionally starting a new one.
+    Requires latency.enable() in code.py.
+    """
+
+    def __init__(self, key_name: str, reset: bool = False):
+        super().__init__()
+        self.key_name = key_name
+        self.reset = reset
+
+    def on_press(self, _, __, ___):
+        latency.print_summary()
+        if self.reset and latency.stats:
+            latency.stats.reset()
+
+    def on_release(self, _, __, ___):
+        pass
+
+
+LATENCY = KeysLatency("LATENCY")
+"""Print the latency summary"""
+LATENCY_RESET = KeysLatency("LATENCY_RESET", reset=True)
+"""Print the latency summary and reset it"""
@@ -1,11 +1,15 @@
 from adafruit_hid.keyboard import Keyboard
 
-from mkx.keys_abstract import KeysAbstract
+from mkx import log
+from mkx.log import LogCategory
+from mkx.keys_abstract import KeysAbstract, KeyFlags
 from mkx.manager_layers import LayersManager
 from mkx.timed_keys import TimedKeys
 
 
 class KeysLayer(KeysAbstract):
+    flags = KeyFlags.LAYER
+
     def __init__(self, layer):
         super().__init__()
         self.key_name = "LAY"
@@ -67,7 +71,7 @@ class RL(KeysLayer):
 
     def on_press(self, layer_manager: LayersManager, _, __):
         if len(layer_manager.active_layers) > 1:
-            layer_manager.active_layers[-1] = self.layer  # Replace top layer
+            layer_manager.replace_top_layer(self.layer)
         else:  # If only one layer is active (default), just add RL layer
             layer_manager.activate_layer(self.layer)
 
@@ -115,6 +119,8 @@ class LT(KeysLayer, TimedKeys):
         LT(1, KC.ESC)  # tap = Escape, hold = activate layer 1
     """
 
+    flags = KeyFlags.TIMED
+
     def __init__(self, layer, tap_key: KeysAbstract, timeout=200):
         assert tap_key is not None, "tap_key must not be None"
         KeysLayer.__init__(self, layer)
@@ -155,12 +161,16 @@ class LT(KeysLayer, TimedKeys):
         self.stop_timer()
         self._pressed_time = None
 
+    def deadline(self):
+        if self._pressed_time is None or self._hold:
+            return None
+        return self._pressed_time + self.timeout
+
     def check_time(self, layers_manager: LayersManager, _, timestamp: int):
-        print("_pressed_time", self._pressed_time)
+        log.debug(LogCategory.TIMERS, "LT: pressed_time %s", self._pressed_time)
         if self._pressed_time is None:
             return
 
-        print(not self._hold, (timestamp - self._pressed_time >= self.timeout))
         if not self._hold and (timestamp - self._pressed_time >= self.timeout):
             layers_manager.activate_layer(self.layer)
             self._hold = True
@@ -244,6 +254,8 @@ class TT(KeysLayer, TimedKeys):
         TT(1)  # tap-tap toggles layer 1; hold = momentary
     """
 
+    flags = KeyFlags.TIMED
+
     def __init__(self, layer, timeout=200):
         KeysLayer.__init__(self, layer)
         TimedKeys.__init__(self)
@@ -261,16 +273,14 @@ class TT(KeysLayer, TimedKeys):
         self.start_timer(timestamp)
 
     def on_release(self, layer_manager: LayersManager, _, timestamp: int):
-        print("on_release")
-        print(self._pressed_time)
         if self._pressed_time is None:
             return
 
         duration = timestamp - self._pressed_time
-        print(duration, self.timeout)
+        log.debug(LogCategory.TIMERS, "TT: released after %d ms", duration)
 
         if duration < self.timeout:
-            print("tap")
+            log.debug(LogCategory.LAYERS, "TT: tap")
             # Valid tap — increment tap count
             if (timestamp - self._last_tap_time) > self.timeout:
                 self._tap_count = 0  # Too slow — reset count
@@ -280,12 +290,17 @@ class TT(KeysLayer, TimedKeys):
             self.start_timer(timestamp)  # restart timer for second tap window
             return  # <-- Prevent state reset here
         elif self._hold:
-            print("hold")
+            log.debug(LogCategory.LAYERS, "TT: hold")
             layer_manager.deactivate_layer(self.layer)
 
         self.stop_timer()
         self._pressed_time = None
 
+    def deadline(self):
+        if self._pressed_time is None or self._hold:
+            return None
+        return self._pressed_time + self.timeout
+
     def check_time(self, layer_manager: LayersManager, _, timestamp: int):
         if self._pressed_time is None:
             return
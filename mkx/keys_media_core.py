@@ -0,0 +1,33 @@
+"""
+Core KeysMedia class definition - no key instances.
+"""
+
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.consumer_control_code import ConsumerControlCode
+
+from mkx.keys_abstract import KeysAbstract
+
+
+class KeysMedia(KeysAbstract):
+    """
+    A media key that sends a Consumer Control code using Adafruit HID library.
+    """
+
+    def __init__(self, media_code: ConsumerControlCode, key_name: str):
+        super().__init__()
+        self.media_code = media_code
+        self.key_name = key_name
+        self._cc = None  # Lazy init
+
+    def _ensure_cc(self):
+        if self._cc is None:
+            import usb_hid
+
+            self._cc = ConsumerControl(usb_hid.devices)
+
+    def on_press(self, _, __, ___):
+        self._ensure_cc()
+        self._cc.send(self.media_code)
+
+    def on_release(self, _, __, ___):
+        pass
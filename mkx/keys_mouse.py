@@ -1,54 +1,6 @@
-import usb_hid
-
 from adafruit_hid.mouse import Mouse
 
-from mkx.keys_abstract import KeysAbstract
-
-
-class KeysMouse(KeysAbstract):
-    """
-    A key that sends a Mouse action using Adafruit HID Mouse.
-    """
-
-    def __init__(self, key_name: str, mouse_action: str, *args):
-        super().__init__()
-        self.key_name = key_name
-        self.mouse_action = mouse_action
-        self.args = args
-        self.mouse = Mouse(usb_hid.devices)
-
-        self._x_move = 1
-        self._y_move = 1
-        self._scroll = 1
-
-    def X(self, value):
-        self._x_move = int(value)
-        return self
-
-    def Y(self, value):
-        self._y_move = int(value)
-        return self
-
-    def S(self, value):
-        self._scroll = int(value)
-        return self
-
-    def on_press(self, _, __, ___):
-        if self.mouse_action == "click":
-            self.mouse.click(*self.args)
-        elif self.mouse_action == "press":
-            self.mouse.press(*self.args)
-        elif self.mouse_action == "release":
-            self.mouse.release(*self.args)
-        elif self.mouse_action == "move":
-            x = self.args[0] * self._x_move if len(self.args) > 0 else 0
-            y = self.args[1] * self._y_move if len(self.args) > 1 else 0
-            scroll = self.args[2] * self._scroll if len(self.args) > 2 else 0
-            self.mouse.move(x, y, scroll)
-
-    def on_release(self, _, __, ___):
-        if self.mouse_action == "press":
-            self.mouse.release(*self.args)
+from mkx.keys_mouse_core import KeysMouse
 
 
 # Mouse key definitions
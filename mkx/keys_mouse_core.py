@@ -0,0 +1,86 @@
+"""
+Core KeysMouse class definition - no key instances.
+"""
+
+from mkx import mouse_motion
+from mkx.keys_abstract import KeysAbstract, KeyFlags
+
+
+class KeysMouse(KeysAbstract):
+    """
+    A key that sends a Mouse action using Adafruit HID Mouse.
+    All keys share one Mouse, move and scroll keys repeat and accelerate
+    while held (see mkx.mouse_motion).
+    """
+
+    # Held move keys are stepped by the TimedKeysManager
+    flags = KeyFlags.TIMED
+
+    def __init__(self, key_name: str, mouse_action: str, *args):
+        super().__init__()
+        self.key_name = key_name
+        self.mouse_action = mouse_action
+        self.args = args
+        self._mouse = None  # Shared mouse on first use
+
+        self._x_move = 1
+        self._y_move = 1
+        self._scroll = 1
+
+    @property
+    def mouse(self):
+        if self._mouse is None:
+            self._mouse = mouse_motion.shared_mouse()
+        return self._mouse
+
+    @mouse.setter
+    def mouse(self, mouse):
+        self._mouse = mouse
+
+    def X(self, value):
+        self._x_move = int(value)
+        return self
+
+    def Y(self, value):
+        self._y_move = int(value)
+        return self
+
+    def S(self, value):
+        self._scroll = int(value)
+        return self
+
+    def direction(self) -> tuple[int, int, int]:
+        """(x, y, wheel) of one step, scaled by X(), Y() and S()"""
+        args = self.args
+        x = args[0] * self._x_move if len(args) > 0 else 0
+        y = args[1] * self._y_move if len(args) > 1 else 0
+        wheel = args[2] * self._scroll if len(args) > 2 else 0
+        return x, y, wheel
+
+    @property
+    def _active(self) -> bool:
+        return mouse_motion.motion.is_moving(self)
+
+    def deadline(self):
+        if self.mouse_action != "move":
+            return None
+        return mouse_motion.motion.deadline()
+
+    def check_time(self, _, __, timestamp: int):
+        mouse_motion.motion.tick(timestamp)
+
+    def on_press(self, _, __, timestamp):
+        if self.mouse_action == "click":
+            self.mouse.click(*self.args)
+        elif self.mouse_action == "press":
+            self.mouse.press(*self.args)
+        elif self.mouse_action == "release":
+            self.mouse.release(*self.args)
+        elif self.mouse_action == "move":
+            mouse_motion.motion.press(self, timestamp)
+
+    def on_release(self, _, __, ___):
+        if self.mouse_action == "press":
+            self.mouse.release(*self.args)
+        elif self.mouse_action == "move":
+            mouse_motion.motion.release(self)
@@ -1,21 +1,55 @@
 from adafruit_hid.keyboard import Keyboard
 
-from mkx.keys_abstract import KeysAbstract
+from mkx import macro_player
+from mkx.keys_abstract import KeysAbstract, KeyFlags
 from mkx.manager_layers import LayersManager
 
 
 class SEQ(KeysAbstract):
-    def __init__(self, key_list: list[KeysAbstract]):
+    flags = KeyFlags.MACRO
+
+    def __init__(self, key_list: list[KeysAbstract], delay_ms=None):
+        """
+        delay_ms: pause after every tap when played by the MacroPlayer,
+                  None uses the player default.
+        """
         super().__init__()
         self._key_list = key_list
+        self.delay_ms = delay_ms
         self.key_name = "SEQ(keys[])"
 
     def on_press(
         self, layer_manager: LayersManager, keyboard: Keyboard, timestamp: int
     ):
+        # Played over the next passes, see mkx.macro_player
+        if macro_player.player:
+            macro_player.player.play(self._key_list, self.delay_ms)
+            return
+
         for key in self._key_list:
             key.on_press(layer_manager, keyboard, timestamp)
             key.on_release(layer_manager, keyboard, timestamp)
 
     def on_release(self, _, __, ___):
         pass
+
+
+class MacroCancel(KeysAbstract):
+    """Stops the playing macro and releases the keys it holds"""
+
+    def __init__(self, key_name: str):
+        super().__init__()
+        self.key_name = key_name
+
+    def on_press(
+        self, layer_manager: LayersManager, keyboard: Keyboard, timestamp: int
+    ):
+        if macro_player.player:
+            macro_player.player.cancel(layer_manager, keyboard, timestamp)
+
+    def on_release(self, _, __, ___):
+        pass
+
+
+MACRO_CANCEL = MacroCancel("MACRO_CANCEL")
+"""Stop the playing macro"""
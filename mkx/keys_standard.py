@@ -24,6 +24,7 @@ __all__ = [
     "KeysStandard",
     
     "NO", "XXXXXXX",
+    "TRANSPARENT", "TRNS", "_______",
 
     "A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M",
     "N", "O", "P", "Q", "R", "S", "T", "U", "V", "W", "X", "Y", "Z",
@@ -53,7 +54,7 @@ __all__ = [
     "F1", "F2", "F3", "F4", "F5", "F6", 
     "F7", "F8", "F9", "F10", "F11", "F12", 
     "PRINT_SCREEN", "PSCREEN", "PSCR", 
-    "SCROLL_LOCK", "SCROLLLOCK",
+    "SCROLL_LOCK", "SCROLLOCK",
     "SLCK", "PAUSE", "PAUS", "BRK", 
     "INSERT", "INS", 
     "HOME", 
@@ -1,5 +1,5 @@
 """
-Core KeysStandard class definition - no key instances.
+Core KeysStandard class definition - no key instances except the TRANSPARENT marker.
 """
 
 from adafruit_hid.keyboard import Keyboard
@@ -25,3 +25,7 @@ class KeysStandard(KeysAbstract):
 
     def on_release(self, _, keyboard: Keyboard, __):
         keyboard.release(self.key_code)
+
+
+TRANSPARENT = KeysStandard(None, "TRANSPARENT")
+"""Transparent key, falls through to the next active layer"""
@@ -1,11 +1,15 @@
 from adafruit_hid.keycode import Keycode
 
-from mkx.keys_standard_core import KeysStandard
+from mkx.keys_standard_core import KeysStandard, TRANSPARENT
 
 NO = KeysStandard(None, "None")
 """None key"""
 XXXXXXX = KeysStandard(None, "XXXXXXX")
 """None key"""
+TRNS = TRANSPARENT
+"""Transparent key, falls through to the next active layer"""
+_______ = TRANSPARENT
+"""Transparent key, falls through to the next active layer"""
 
 ENTER = KeysStandard(Keycode.ENTER, "ENTER")
 """Enter (Return)"""
@@ -79,6 +83,7 @@ POW = KeysStandard(Keycode.POWER, "POW")
 # fmt: off
 __all__ = [
     "NO", "XXXXXXX",
+    "TRANSPARENT", "TRNS", "_______",
     "ENTER", "RETURN", "ENT",
     "ESCAPE", "ESC",
     "BACKSPACE", "BSPACE", "BSPC",
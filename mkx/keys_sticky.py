@@ -1,9 +1,11 @@
 from adafruit_hid.keyboard import Keyboard
 
-from mkx.keys_abstract import KeysAbstract
+from mkx.keys_abstract import KeysAbstract, KeyFlags
 
 
 class SK(KeysAbstract):
+    flags = KeyFlags.STICKY
+
     def __init__(self, key: KeysAbstract, defer_release=False, retap_cancel=True):
         self.key_name = "SK"
         self._key = key
@@ -45,7 +47,8 @@ class StickyKeyManager:
         self._active_sticky_keys = []
 
     def register(self, key: KeysAbstract):
-        if isinstance(key, SK) and key not in self._active_sticky_keys:
+        sticky = isinstance(key, SK) or getattr(type(key), "flags", 0) & KeyFlags.STICKY
+        if sticky and key not in self._active_sticky_keys:
             self._active_sticky_keys.append(key)
 
     def clear_stickies(self, keyboard: Keyboard, timestamp: int):
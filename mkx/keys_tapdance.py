@@ -1,11 +1,15 @@
 from adafruit_hid.keyboard import Keyboard
 
-from mkx.keys_abstract import KeysAbstract
+from mkx import log
+from mkx.log import LogCategory
+from mkx.keys_abstract import KeysAbstract, KeyFlags
 from mkx.timed_keys import TimedKeys
 from mkx.manager_layers import LayersManager
 
 
 class TD(KeysAbstract, TimedKeys):
+    flags = KeyFlags.TIMED
+
     def __init__(self, *keys: KeysAbstract, timeout=200):
         KeysAbstract.__init__(self)
         TimedKeys.__init__(self)
@@ -27,6 +31,11 @@ class TD(KeysAbstract, TimedKeys):
         # Wait until timeout to act (handled in check_time)
         pass
 
+    def deadline(self):
+        if self._pressed_time is None:
+            return None
+        return self._pressed_time + self._timeout
+
     def check_time(
         self, layer_manager: LayersManager, keyboard: Keyboard, timestamp: int
     ):
@@ -39,7 +48,9 @@ class TD(KeysAbstract, TimedKeys):
                 selected_key.on_press(layer_manager, keyboard, timestamp)
                 selected_key.on_release(layer_manager, keyboard, timestamp)
             else:
-                print("TapDance: tap count exceeds defined keys")
+                log.warning(
+                    LogCategory.TIMERS, "TapDance: tap count exceeds defined keys"
+                )
 
             self._tap_count = 0
             self.stop_timer()
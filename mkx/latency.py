@@ -0,0 +1,151 @@
+"""
+Per-stage latency histograms for the run_once loops.
+
+Each stage keeps count, total, min and max plus a histogram of fixed
+power-of-two microsecond buckets, so recording never allocates. The loops
+check `latency.stats` before every stage, a disabled profiler costs one
+attribute read per stage.
+
+    from mkx import latency
+
+    latency.enable(report_ms=10_000)  # in code.py, 0 disables the periodic summary
+    ...
+    latency.print_summary()           # from the REPL or with the LATENCY key
+"""
+
+import time
+from array import array
+
+BUCKETS = 16  # bucket i holds durations below 2**i us, the last one everything above
+
+
+class Stage:
+    SCAN = 0
+    RECEIVE = 1
+    SYNC = 2
+    DEBOUNCE = 3
+    TIMERS = 4
+    DISPATCH = 5
+    HID_SEND = 6
+    BACKLIGHT = 7
+
+
+STAGE_NAMES = (
+    "scan",
+    "receive",
+    "sync",
+    "debounce",
+    "timers",
+    "dispatch",
+    "hid_send",
+    "backlight",
+)
+
+
+class LatencyStats:
+    def __init__(self, report_ms=0):
+        self.report_ms = report_ms
+        self.last_report = 0
+
+        stages = len(STAGE_NAMES)
+        self._count = array("L", [0] * stages)
+        self._total = array("L", [0] * stages)
+        self._min = array("L", [0] * stages)
+        self._max = array("L", [0] * stages)
+        self._buckets = array("L", [0] * (stages * BUCKETS))
+
+    def reset(self):
+        for values in (self._count, self._total, self._min, self._max, self._buckets):
+            for i in range(len(values)):
+                values[i] = 0
+
+    def add(self, stage: int, duration_us: int):
+        count = self._count[stage]
+        if not count or duration_us < self._min[stage]:
+            self._min[stage] = duration_us
+        if duration_us > self._max[stage]:
+            self._max[stage] = duration_us
+        self._count[stage] = count + 1
+        self._total[stage] = (self._total[stage] + duration_us) & 0xFFFFFFFF
+
+        bucket = 0
+        while bucket < BUCKETS - 1 and duration_us >= 1 << bucket:
+            bucket += 1
+        self._buckets[stage * BUCKETS + bucket] += 1
+
+    def lap(self, stage: int, start_ns: int) -> int:
+        """Record the time since start_ns for stage, returns now to time the next stage"""
+        now = time.monotonic_ns()
+        self.add(stage, (now - start_ns) // 1000)
+        return now
+
+    def percentile(self, stage: int, percent: int) -> int:
+        """Upper bound (us) of the bucket holding the percentile, capped at max"""
+        count = self._count[stage]
+        if not count:
+            return 0
+
+        target = (count * percent + 99) // 100
+        seen = 0
+        for bucket in range(BUCKETS):
+            seen += self._buckets[stage * BUCKETS + bucket]
+            if seen >= target:
+                return min(1 << bucket, self._max[stage])
+        return self._max[stage]
+
+    def summary(self) -> dict:
+        """min/avg/max/p99 in us of every stage that was timed"""
+        result = {}
+        for stage, name in enumerate(STAGE_NAMES):
+            count = self._count[stage]
+            if not count:
+                continue
+            result[name] = {
+                "count": count,
+                "min_us": self._min[stage],
+                "avg_us": self._total[stage] // count,
+                "max_us": self._max[stage],
+                "p99_us": self.percentile(stage, 99),
+            }
+        return result
+
+    def print_summary(self):
+        print(f"{'stage':<10}{'count':>8}{'min':>8}{'avg':>8}{'max':>8}{'p99':>8}  us")
+        for name, s in self.summary().items():
+            print(
+                f"{name:<10}{s['count']:>8}{s['min_us']:>8}{s['avg_us']:>8}"
+                f"{s['max_us']:>8}{s['p99_us']:>8}"
+            )
+
+    def report(self, now: int):
+        """Print and reset the summary every report_ms, now in ms"""
+        if not self.report_ms:
+            return
+        if not self.last_report:
+            self.last_report = now
+        elif now - self.last_report >= self.report_ms:
+            self.print_summary()
+            self.reset()
+            self.last_report = now
+
+
+stats = None
+
+
+def enable(report_ms=0) -> LatencyStats:
+    """Start timing the loop stages, report_ms > 0 prints a summary periodically"""
+    global stats
+    stats = LatencyStats(report_ms)
+    return stats
+
+
+def disable():
+    global stats
+    stats = None
+
+
+def print_summary():
+    if stats is None:
+        print("Latency stats are not enabled, call latency.enable() first")
+        return
+    stats.print_summary()
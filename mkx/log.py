@@ -0,0 +1,74 @@
+"""
+Leveled, categorised logging for the hot paths.
+
+Messages are %-format strings with their arguments passed separately, so
+nothing is formatted or written while a level or category is disabled.
+`build.py --log-level` removes the disabled log.<level>() statements from
+the sources before mpy-cross, so production builds pay nothing for them.
+
+    from mkx import log
+    from mkx.log import LogCategory
+
+    log.debug(LogCategory.KEYS, "key: %s pressed", key.key_name)
+"""
+
+
+class LogLevel:
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    OFF = 100
+
+
+class LogCategory:
+    KEYS = 0x01  # Key events and key behaviour
+    LAYERS = 0x02  # Layer changes
+    TIMERS = 0x04  # Timed keys
+    COMM = 0x08  # Messages between central and peripheries
+    TOUCH = 0x10  # Touch electrodes, sliders and wheels
+    SYSTEM = 0x20  # Main loops
+    ALL = 0xFF
+
+
+_level = LogLevel.INFO
+_categories = LogCategory.ALL
+
+
+def set_level(level: int):
+    global _level
+    _level = level
+
+
+def set_categories(categories: int):
+    """Bit mask of LogCategory values to log"""
+    global _categories
+    _categories = categories
+
+
+def enabled(level: int, category: int) -> bool:
+    return level >= _level and bool(category & _categories)
+
+
+def _emit(msg, args):
+    print(msg % args if args else msg)
+
+
+def debug(category: int, msg: str, *args):
+    if LogLevel.DEBUG >= _level and category & _categories:
+        _emit(msg, args)
+
+
+def info(category: int, msg: str, *args):
+    if LogLevel.INFO >= _level and category & _categories:
+        _emit(msg, args)
+
+
+def warning(category: int, msg: str, *args):
+    if LogLevel.WARNING >= _level and category & _categories:
+        _emit(msg, args)
+
+
+def error(category: int, msg: str, *args):
+    if LogLevel.ERROR >= _level and category & _categories:
+        _emit(msg, args)
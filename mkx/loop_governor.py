@@ -0,0 +1,80 @@
+import time
+
+IDLE_AFTER_MS = 250
+WAKE_LATENCY_MS = 8
+WAKE_SLEEP_MS = 100
+
+
+class LoopGovernor:
+    """
+    Chooses the sleep at the end of every loop pass.
+
+    While keys are held, events arrive or timers are pending the loop runs with
+    active_sleep_ms (0 = full rate). After idle_after_ms without activity the
+    sleep doubles every pass up to max_sleep_ms, the worst added latency of the
+    first press. With wake_pins the idle sleep grows up to wake_sleep_ms as an
+    alarm light sleep that a level on any of the pins ends early. Wake pins must
+    be free pins (e.g. an interrupt line), the matrix pins are in use by the scanner.
+    """
+
+    def __init__(
+        self,
+        active_sleep_ms=0,
+        idle_after_ms=IDLE_AFTER_MS,
+        max_sleep_ms=WAKE_LATENCY_MS,
+        *,
+        wake_pins=None,
+        wake_value=False,
+        wake_sleep_ms=WAKE_SLEEP_MS,
+    ):
+        self.active_sleep_ms = active_sleep_ms
+        self.idle_after_ms = idle_after_ms
+        self.max_sleep_ms = max_sleep_ms
+
+        self.wake_pins = wake_pins or []
+        self.wake_value = wake_value
+        self.wake_sleep_ms = wake_sleep_ms
+        self._pin_alarms = None  # Created on the first light sleep
+
+        self.last_active = None
+        self._sleep_ms = active_sleep_ms
+
+    def sleep_time(self, now: int, busy: bool, deadline=None) -> int:
+        """Sleep (ms) for this pass, never past the deadline of the next timer"""
+        if busy or self.last_active is None:
+            self.last_active = now
+            self._sleep_ms = self.active_sleep_ms
+        elif now - self.last_active >= self.idle_after_ms:
+            limit = self.wake_sleep_ms if self.wake_pins else self.max_sleep_ms
+            self._sleep_ms = min(max(1, self._sleep_ms * 2), limit)
+
+        sleep_ms = self._sleep_ms
+        if deadline is not None and deadline - now < sleep_ms:
+            sleep_ms = max(0, deadline - now)
+        return sleep_ms
+
+    def sleep(self, now: int, busy: bool, deadline=None):
+        sleep_ms = self.sleep_time(now, busy, deadline)
+        if sleep_ms <= 0:
+            return
+
+        if self.wake_pins and sleep_ms > self.max_sleep_ms:
+            self._light_sleep(sleep_ms)
+        else:
+            time.sleep(sleep_ms / 1000)
+
+    def _light_sleep(self, sleep_ms: int):
+        import alarm
+
+        if self._pin_alarms is None:
+            self._pin_alarms = [
+                alarm.pin.PinAlarm(pin, value=self.wake_value, pull=True)
+                for pin in self.wake_pins
+            ]
+
+        time_alarm = alarm.time.TimeAlarm(
+            monotonic_time=time.monotonic() + sleep_ms / 1000
+        )
+        woken_by = alarm.light_sleep_until_alarms(time_alarm, *self._pin_alarms)
+        if woken_by is not time_alarm:
+            self._sleep_ms = self.active_sleep_ms  # Woken by a pin, scan at full rate
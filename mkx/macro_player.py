@@ -0,0 +1,96 @@
+"""
+Plays SEQ and VIM sequences over several run_once passes.
+
+SEQ.on_press queues its taps here instead of sending them all inside the
+dispatcher, the loops play steps_per_frame steps (one press or release,
+at most one report each) per pass, so scanning and timed keys keep running
+while a long macro is typed. Without a player SEQ plays synchronously.
+
+    mkx.use_macro_player(True, steps_per_frame=4, delay_ms=0)
+"""
+
+from mkx import log
+from mkx.log import LogCategory
+from mkx.keys_abstract import KeyFlags
+
+STEPS_PER_FRAME = 4
+MAX_STEPS = 256
+
+
+class MacroPlayer:
+    def __init__(
+        self, steps_per_frame=STEPS_PER_FRAME, delay_ms=0, max_steps=MAX_STEPS
+    ):
+        """
+        steps_per_frame: presses and releases played per run_once pass.
+        delay_ms: default pause after every tap, SEQ(delay_ms=...) overrides it.
+        max_steps: longest queue, a macro that does not fit is dropped.
+        """
+        self.steps_per_frame = steps_per_frame
+        self.delay_ms = delay_ms
+        self.max_steps = max_steps
+
+        self._steps = []  # (key, pressed, delay_ms), played from _head
+        self._head = 0
+        self._held = []  # Keys pressed by the macro and not yet released
+        self.next_time = 0  # No step is played before this time (ms)
+
+    def _queue(self, keys, delay_ms, steps):
+        for key in keys:
+            if getattr(type(key), "flags", 0) & KeyFlags.MACRO:
+                self._queue(key._key_list, delay_ms, steps)  # Nested SEQ in place
+            else:
+                steps.append((key, True, 0))
+                steps.append((key, False, delay_ms))
+
+    def play(self, keys, delay_ms=None):
+        """Queue a tap of every key after the macros already queued"""
+        if delay_ms is None:
+            delay_ms = self.delay_ms
+
+        steps = []
+        self._queue(keys, delay_ms, steps)
+        if len(self._steps) - self._head + len(steps) > self.max_steps:
+            log.warning(
+                LogCategory.KEYS, "Macro queue full, %d steps dropped", len(steps)
+            )
+            return
+        self._steps.extend(steps)
+
+    def is_pending(self) -> bool:
+        return self._head < len(self._steps)
+
+    def update(self, layer_manager, keyboard, timestamp: int):
+        """Play the steps due by timestamp, at most steps_per_frame"""
+        steps = self._steps
+        budget = self.steps_per_frame
+
+        while self._head < len(steps) and budget and timestamp >= self.next_time:
+            key, pressed, delay_ms = steps[self._head]
+            self._head += 1
+            budget -= 1
+
+            if pressed:
+                key.on_press(layer_manager, keyboard, timestamp)
+                self._held.append(key)
+            else:
+                key.on_release(layer_manager, keyboard, timestamp)
+                self._held.remove(key)
+                if delay_ms:
+                    self.next_time = timestamp + delay_ms
+
+        if self._head >= len(steps):
+            steps.clear()
+            self._head = 0
+
+    def cancel(self, layer_manager, keyboard, timestamp: int):
+        """Drop the queued steps and release the keys the macro holds"""
+        for key in self._held:
+            key.on_release(layer_manager, keyboard, timestamp)
+        self._held.clear()
+        self._steps.clear()
+        self._head = 0
+        self.next_time = 0
+
+
+player = None
@@ -1,3 +1,5 @@
+from mkx import trace
+from mkx.trace import TraceAction
 from mkx.layer_status_led_abstract import LayerStatusLedAbstract
 
 
@@ -6,6 +8,13 @@ class LayersManager:
         self.default_layer = default_layer
         self.active_layers = [default_layer]
         self.status_led = None
+        self.version = 0  # Bumped on every change of the layer stack
+        self._update_status_led()
+
+    def _changed(self):
+        self.version += 1
+        if trace.recorder:
+            trace.recorder.record(TraceAction.LAYER_CHANGE, layers_manager=self)
         self._update_status_led()
 
     def _update_status_led(self):
@@ -23,22 +32,26 @@ class LayersManager:
                 self.active_layers.append(layer)
         else:
             self.active_layers.append(layer)
-        self._update_status_led()
+        self._changed()
 
     def deactivate_layer(self, layer):
         if layer in self.active_layers and layer != self.default_layer:
             self.active_layers.remove(layer)
-        self._update_status_led()
+        self._changed()
 
     def set_active_layer(self, layer):
         self.active_layers = [layer]
-        self._update_status_led()
+        self._changed()
 
     def set_default_layer(self, layer):
         self.default_layer = layer
         if layer not in self.active_layers:
             self.active_layers.insert(0, layer)
-        self._update_status_led()
+        self._changed()
+
+    def replace_top_layer(self, layer):
+        self.active_layers[-1] = layer
+        self._changed()
 
     def toggle_layer(self, layer, *, prioritize=False):
         if layer in self.active_layers:
@@ -63,16 +63,13 @@ class MatrixScanner:
 
         # In CircuitPython, to use a GPIO pin, wrap it in a digitalio.DigitalInOut(pin) object.
         self.drive_pins = [ensure_digital_in_out(p) for p in self.drive_pins]
-        self.sense_pins = [ensure_digital_in_out(p) for p in self.sense_pins]
 
         # Set drive and sense pin roles
         for pin in self.drive_pins:
             pin.switch_to_output()
-        for pin in self.sense_pins:
-            pin.switch_to_input(pull=self.pull)
+        self._setup_sense_pins()
 
-        initial_val = 1 if pull is digitalio.Pull.UP else 0
-        self.state = bytearray([initial_val] * (self.len_cols * self.len_rows))
+        self._init_state()
         time.sleep(1)
 
         # Run safety warmup cycles before hardware pins stabilize
@@ -80,6 +77,15 @@ class MatrixScanner:
             _ = self.get_key_events()  # Throw away events
             time.sleep(0.001)
 
+    def _setup_sense_pins(self):
+        self.sense_pins = [ensure_digital_in_out(p) for p in self.sense_pins]
+        for pin in self.sense_pins:
+            pin.switch_to_input(pull=self.pull)
+
+    def _init_state(self):
+        initial_val = 1 if self.pull is digitalio.Pull.UP else 0
+        self.state = bytearray([initial_val] * (self.len_cols * self.len_rows))
+
     def get_key_events(self) -> list[tuple[int, int, bool]]:
         raw_events = []
         output_active = (
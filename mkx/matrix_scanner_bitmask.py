@@ -0,0 +1,114 @@
+import digitalio
+
+from mkx.diode_orientation import DiodeOrientation
+from mkx.ghost_filter import GhostFilter
+from mkx.matrix_scanner import MatrixScanner
+
+# Scanner backend with the matrix state packed into one integer per drive line.
+# Bit i of row_masks[d] is set while the switch of drive line d and sense pin i
+# is pressed. Every pass builds the new mask of a drive line, XORs it with the
+# stored one and only the set bits of the difference become events, through
+# a (col, row) table built once. An idle scan compares one int per drive line.
+#
+# Same pins, arguments and events as MatrixScanner: scanner=MatrixScannerBitmask.
+# The (col, row) table follows the pins the drive lines came from, so with
+# Pull.UP the events are mapped by the actual columns and rows as well.
+#
+# ghost=GhostMode.FLAG or SUPPRESS checks every scan for ghost key rectangles,
+# see ghost_filter.py. All drive lines are read before the masks are diffed.
+
+
+def append_mask_events(raw_events, coords, changed: int, mask: int):
+    """Append a (col, row, pressed) event for every set bit of changed"""
+    in_idx = 0
+    while changed:
+        if changed & 1:
+            col, row = coords[in_idx]
+            raw_events.append((col, row, bool(mask >> in_idx & 1)))
+        changed >>= 1
+        in_idx += 1
+
+
+class MatrixScannerBitmask(MatrixScanner):
+    def __init__(
+        self,
+        cols,
+        rows,
+        diode_orientation,
+        pull,
+        warmup_cycles=100,
+        *,
+        ghost=None,
+    ):
+        self.ghost_filter = None if ghost is None else GhostFilter(ghost)
+        super().__init__(cols, rows, diode_orientation, pull, warmup_cycles)
+
+    def _init_state(self):
+        self.output_active = self.pull is not digitalio.Pull.UP
+        self.pressed_value = self.output_active  # A press pulls the sense pin to it
+
+        # Pressed switches of every drive line, bit = sense pin index
+        self.row_masks = [0] * len(self.drive_pins)
+        self._scan_masks = [0] * len(self.drive_pins)  # Ghost check, whole scan
+        self.sense_bits = [(pin, 1 << i) for i, pin in enumerate(self.sense_pins)]
+
+        # (col, row) of every drive line and sense bit
+        drive_cols = (self.diode_orientation == DiodeOrientation.COL2ROW) == (
+            self.pull is digitalio.Pull.DOWN
+        )
+        self.coords = [
+            tuple((d, s) if drive_cols else (s, d) for s in range(len(self.sense_pins)))
+            for d in range(len(self.drive_pins))
+        ]
+
+    def read_mask(self) -> int:
+        """Pressed bits of the sense pins for the driven line"""
+        pressed_value = self.pressed_value
+        mask = 0
+        for pin, bit in self.sense_bits:
+            if pin.value == pressed_value:
+                mask |= bit
+        return mask
+
+    def get_key_events(self) -> list[tuple[int, int, bool]]:
+        if self.ghost_filter is not None:
+            return self._get_key_events_ghost()
+
+        raw_events = []
+        row_masks = self.row_masks
+        output_active = self.output_active
+
+        for out_idx, out_pin in enumerate(self.drive_pins):
+            out_pin.value = output_active
+            mask = self.read_mask()
+            out_pin.value = not output_active
+
+            changed = mask ^ row_masks[out_idx]
+            if not changed:
+                continue
+            row_masks[out_idx] = mask
+
+            append_mask_events(raw_events, self.coords[out_idx], changed, mask)
+
+        return raw_events
+
+    def _get_key_events_ghost(self) -> list[tuple[int, int, bool]]:
+        masks = self._scan_masks
+        output_active = self.output_active
+
+        for out_idx, out_pin in enumerate(self.drive_pins):
+            out_pin.value = output_active
+            masks[out_idx] = self.read_mask()
+            out_pin.value = not output_active
+
+        row_masks = self.row_masks
+        self.ghost_filter.filter(masks, row_masks)
+
+        raw_events = []
+        for out_idx, mask in enumerate(masks):
+            changed = mask ^ row_masks[out_idx]
+            if changed:
+                row_masks[out_idx] = mask
+                append_mask_events(raw_events, self.coords[out_idx], changed, mask)
+
+        return raw_events
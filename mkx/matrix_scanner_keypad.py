@@ -0,0 +1,105 @@
+import time
+
+import keypad
+from keypad import Event as KeyEvent
+
+from mkx import log
+from mkx.log import LogCategory
+from mkx.diode_orientation import DiodeOrientation
+
+# Scanner backend built on CircuitPython's native keypad.KeyMatrix.
+# The matrix is scanned in the background by C code, debounced by the
+# scan interval (and debounce_threshold) and the transitions are queued.
+# get_key_events() only drains that queue, so an idle loop does no per-key work.
+#
+# keypad.KeyMatrix takes raw microcontroller.Pin objects and sets up the pulls
+# on its own, the pull argument is accepted only to keep the MatrixScanner signature.
+
+
+class MatrixScannerKeypad:
+    def __init__(
+        self,
+        cols,
+        rows,
+        diode_orientation,
+        pull=None,
+        warmup_cycles=0,
+        *,
+        interval=0.02,
+        max_events=64,
+        debounce_threshold=1,
+    ):
+        self.len_cols = len(cols)
+        self.len_rows = len(rows)
+        self.diode_orientation = diode_orientation
+        self.pull = pull
+
+        # Pin overlap check
+        unique_pins = {repr(c) for c in cols} | {repr(r) for r in rows}
+        assert (
+            len(unique_pins) == self.len_cols + self.len_rows
+        ), "Cannot use a pin as both a column and row"
+
+        if self.diode_orientation == DiodeOrientation.COL2ROW:
+            columns_to_anodes = True
+        elif self.diode_orientation == DiodeOrientation.ROW2COL:
+            columns_to_anodes = False
+        else:
+            raise ValueError(f"Invalid Diode Orientation: {self.diode_orientation}")
+
+        self.key_matrix = keypad.KeyMatrix(
+            row_pins=rows,
+            column_pins=cols,
+            columns_to_anodes=columns_to_anodes,
+            interval=interval,
+            max_events=max_events,
+            debounce_threshold=debounce_threshold,
+        )
+
+        # Reused for every get_into() call, no allocation per event
+        self._event = KeyEvent()
+
+        # Keys last reported as pressed, by key number, released on an overflow
+        self._pressed = bytearray(self.len_cols * self.len_rows)
+
+        # Let the background scan settle, then drop whatever was queued meanwhile
+        time.sleep(warmup_cycles * 0.001)
+        self.key_matrix.events.clear()
+
+    def deinit(self):
+        self.key_matrix.deinit()
+
+    def get_key_events(self) -> list[tuple[int, int, bool]]:
+        raw_events = []
+        events = self.key_matrix.events
+        event = self._event
+
+        if events.overflowed:
+            # Some transitions were lost, release every reported key and resync,
+            # after reset() the keys still held are reported as pressed again
+            log.warning(LogCategory.KEYS, "Key event queue overflowed, resetting")
+            events.clear()
+            self.key_matrix.reset()
+            pressed = self._pressed
+            for key_number in range(len(pressed)):
+                if pressed[key_number]:
+                    pressed[key_number] = 0
+                    row, col = divmod(key_number, self.len_cols)
+                    raw_events.append((col, row, False))
+
+        while events.get_into(event):
+            # keypad.KeyMatrix numbers keys row by row: row * columns + col
+            row, col = divmod(event.key_number, self.len_cols)
+
+            if row < self.len_rows:
+                self._pressed[event.key_number] = event.pressed
+                raw_events.append((col, row, event.pressed))
+            else:
+                log.warning(
+                    LogCategory.KEYS,
+                    "Ignoring out-of-bounds key event: col=%d, row=%d",
+                    col,
+                    row,
+                )
+
+        return raw_events
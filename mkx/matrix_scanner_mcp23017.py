@@ -0,0 +1,94 @@
+from mkx.matrix_scanner_bitmask import append_mask_events
+
+# Scanner backend for a matrix on MCP23017 I2C expanders.
+#
+# Every expander drives 8 columns on GPA0..7 (low = active, idle high) and
+# reads the rows on GPB0..7 with its internal pull-ups, the diodes point from
+# the rows to the columns (ROW2COL). Expander k of addresses holds columns
+# 8 * k .. 8 * k + 7, all expanders share the rows.
+#
+# Every column costs one register write and one whole-port read of GPIOB, plus
+# one write per expander to release its last column before the next expander
+# drives (the rows are shared), so a pass is 2 * cols + expanders short I2C
+# transactions whatever the number of keys.
+#
+# The backend is built with the bus and passed as an instance:
+#     scanner = MatrixScannerMCP23017(i2c, 16, 8, addresses=(0x20, 0x21))
+#     periphery = PeripherySingle(None, None, scanner=scanner)
+
+IODIRA = 0x00
+IODIRB = 0x01
+GPPUB = 0x0D
+GPIOB = 0x13
+OLATA = 0x14
+
+COLS_PER_EXPANDER = 8
+
+
+class MatrixScannerMCP23017:
+    def __init__(self, i2c, cols, rows, *, addresses=(0x20,)):
+        assert rows <= 8, "MCP23017 reads up to 8 rows on GPB"
+        assert cols <= COLS_PER_EXPANDER * len(addresses), "Too few expanders"
+
+        self.i2c = i2c
+        self.len_cols = cols
+        self.len_rows = rows
+        self.all_rows = (1 << rows) - 1
+
+        # (address, column write) of every column, the rest of GPA stays high
+        self._columns = [
+            (
+                addresses[col // COLS_PER_EXPANDER],
+                bytes((OLATA, 0xFF & ~(1 << col % COLS_PER_EXPANDER))),
+            )
+            for col in range(cols)
+        ]
+        self._idle_write = bytes((OLATA, 0xFF))
+        self._read_reg = bytes((GPIOB,))
+        self._in_buf = bytearray(1)
+
+        self.row_masks = [0] * cols
+        self.coords = [tuple((col, row) for row in range(rows)) for col in range(cols)]
+
+        self._lock()
+        try:
+            for address in addresses[: (cols + 7) // COLS_PER_EXPANDER]:
+                self.i2c.writeto(address, self._idle_write)
+                self.i2c.writeto(address, bytes((IODIRA, 0x00)))
+                self.i2c.writeto(address, bytes((IODIRB, 0xFF)))
+                self.i2c.writeto(address, bytes((GPPUB, 0xFF)))
+        finally:
+            self.i2c.unlock()
+
+    def _lock(self):
+        while not self.i2c.try_lock():
+            pass
+
+    def get_key_events(self) -> list[tuple[int, int, bool]]:
+        raw_events = []
+        row_masks = self.row_masks
+        in_buf = self._in_buf
+
+        self._lock()
+        try:
+            driven = None  # Expander driving a column
+            for col, (address, column_write) in enumerate(self._columns):
+                if address != driven:
+                    if driven is not None:
+                        self.i2c.writeto(driven, self._idle_write)
+                    driven = address
+                self.i2c.writeto(address, column_write)
+                self.i2c.writeto_then_readfrom(address, self._read_reg, in_buf)
+
+                mask = ~in_buf[0] & self.all_rows  # A press pulls its row low
+                changed = mask ^ row_masks[col]
+                if changed:
+                    row_masks[col] = mask
+                    append_mask_events(raw_events, self.coords[col], changed, mask)
+
+            if driven is not None:
+                self.i2c.writeto(driven, self._idle_write)
+        finally:
+            self.i2c.unlock()
+
+        return raw_events
@@ -0,0 +1,141 @@
+from array import array
+
+from mkx import log
+from mkx.log import LogCategory
+from mkx.matrix_scanner_bitmask import MatrixScannerBitmask
+
+# Scanner backend reading all sense lines with one port access per drive line.
+#
+# read_port is any callable returning the input levels as an int, e.g. a read of
+# the GPIO input register. port_bits gives the bit of every sense pin in that
+# int, default 0, 1, 2, ... (consecutive bits are extracted with one shift).
+# Without read_port a PIO state machine samples the sense pins on RP2040 when
+# they are consecutive GPIOs in sense pin order (pull=Pull.DOWN: the rows for
+# COL2ROW, the columns for ROW2COL). Otherwise, or without rp2pio, the scanner
+# falls back to per-pin digitalio reads.
+
+# PIO program: wait for a request word, sample the in pins, push the sample.
+PIO_PROGRAM = (0x80A0, 0x4000, 0x8020)  # pull block / in pins, N / push block
+PIO_FREQUENCY = 10_000_000
+
+
+def gpio_number(pin):
+    """GPIO number of a microcontroller pin, None if it has none"""
+    import microcontroller
+
+    for name in dir(microcontroller.pin):
+        if name.startswith("GPIO") and getattr(microcontroller.pin, name) is pin:
+            return int(name[4:])
+    return None
+
+
+class PioPortReader:
+    """Reads up to 32 consecutive GPIOs at once with an rp2pio state machine"""
+
+    def __init__(self, pins, pull):
+        import digitalio
+        import rp2pio
+
+        count = len(pins)
+        first = gpio_number(pins[0])
+        if first is None or any(
+            gpio_number(pin) != first + i for i, pin in enumerate(pins)
+        ):
+            raise ValueError("sense pins are not consecutive GPIOs")
+
+        program = array("H", PIO_PROGRAM)
+        program[1] |= count & 0x1F  # in pins, 32 is encoded as 0
+        all_pins = (1 << count) - 1
+
+        self.sm = rp2pio.StateMachine(
+            program,
+            frequency=PIO_FREQUENCY,
+            first_in_pin=pins[0],
+            in_pin_count=count,
+            pull_in_pin_up=all_pins if pull == digitalio.Pull.UP else 0,
+            pull_in_pin_down=all_pins if pull == digitalio.Pull.DOWN else 0,
+            in_shift_right=False,
+        )
+        self._request = array("L", [0])
+        self._sample = array("L", [0])
+
+    def __call__(self) -> int:
+        self.sm.write(self._request)
+        self.sm.readinto(self._sample)
+        return self._sample[0]
+
+    def deinit(self):
+        self.sm.deinit()
+
+
+def pio_port_reader(pins, pull):
+    """PioPortReader for the pins, None if there is no PIO or they do not fit"""
+    try:
+        return PioPortReader(pins, pull)
+    except ImportError:
+        return None
+    except (ValueError, RuntimeError, TypeError, AttributeError) as e:
+        # TypeError: DigitalInOut objects instead of pins
+        log.warning(LogCategory.SYSTEM, "PIO port read not possible: %s", e)
+        return None
+
+
+class MatrixScannerPort(MatrixScannerBitmask):
+    def __init__(
+        self,
+        cols,
+        rows,
+        diode_orientation,
+        pull,
+        warmup_cycles=100,
+        *,
+        read_port=None,
+        port_bits=None,
+        ghost=None,
+    ):
+        self.read_port = read_port
+        self.port_bits = port_bits
+        super().__init__(
+            cols, rows, diode_orientation, pull, warmup_cycles, ghost=ghost
+        )
+
+    def _setup_sense_pins(self):
+        if self.read_port is None:
+            self.read_port = pio_port_reader(self.sense_pins, self.pull)
+
+        if self.read_port is None:
+            log.info(LogCategory.SYSTEM, "Port read not available, reading pins")
+            super()._setup_sense_pins()
+
+    def _init_state(self):
+        super()._init_state()
+
+        port_bits = self.port_bits
+        if port_bits is None:
+            port_bits = range(len(self.sense_pins))
+
+        # Consecutive ascending bits: one shift and mask per read
+        self._shift = None
+        first = port_bits[0]
+        if list(port_bits) == list(range(first, first + len(port_bits))):
+            self._shift = first
+            self._all = (1 << len(port_bits)) - 1
+        self._gather = [(1 << port_bit, 1 << i) for i, port_bit in enumerate(port_bits)]
+
+    def read_mask(self) -> int:
+        """Pressed bits of the sense pins for the driven line, one port read"""
+        if self.read_port is None:
+            return super().read_mask()
+
+        port = self.read_port()
+        if not self.pressed_value:
+            port = ~port  # Pull.UP, a press reads low
+
+        if self._shift is not None:
+            return (port >> self._shift) & self._all
+
+        mask = 0
+        for port_bit, bit in self._gather:
+            if port & port_bit:
+                mask |= bit
+        return mask
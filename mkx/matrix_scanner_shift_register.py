@@ -0,0 +1,148 @@
+import digitalio
+
+from mkx.diode_orientation import DiodeOrientation
+from mkx.matrix_scanner import ensure_digital_in_out
+from mkx.matrix_scanner_bitmask import append_mask_events
+
+# Scanner backend for a matrix on 74HC595 (drive) and 74HC165 (sense) chains
+# sharing one SPI bus: SCK to both clocks, MOSI to the first 595 SER, MISO to
+# the first 165 QH, latch to the 595 RCLK and load to the 165 SH/LD.
+#
+# Drive line d is output QA + d % 8 of the 595 number d // 8 counted from MOSI,
+# sense line s is input A + s % 8 of the 165 number s // 8 counted from MISO.
+# The drive and sense roles follow diode_orientation and pull as in MatrixScanner,
+# pull is the one of the resistors on the 165 inputs.
+#
+# Every drive line costs one SPI transfer: the 165s load the driven line and
+# while it is clocked in, the pattern of the next drive line is clocked out.
+# Without latch there is no 595 and every switch has its own 165 input, key
+# col + row * cols, the whole board is read with a single transfer.
+#
+# The backend is built with the bus and passed as an instance:
+#     scanner = MatrixScannerShiftRegister(spi, board.GP5, 16, 8, latch=board.GP6)
+#     periphery = PeripherySingle(None, None, scanner=scanner)
+
+SPI_BAUDRATE = 4_000_000
+
+
+class MatrixScannerShiftRegister:
+    def __init__(
+        self,
+        spi,
+        load,
+        cols,
+        rows,
+        *,
+        latch=None,
+        diode_orientation=DiodeOrientation.COL2ROW,
+        pull=digitalio.Pull.DOWN,
+        baudrate=SPI_BAUDRATE,
+    ):
+        self.spi = spi
+        self.len_cols = cols
+        self.len_rows = rows
+        self.baudrate = baudrate
+        self.pressed_value = pull is not digitalio.Pull.UP
+
+        self.load = ensure_digital_in_out(load)
+        self.load.switch_to_output(value=True)
+        self.latch = None
+
+        if latch is None:
+            # Direct wiring, one sense bit per key
+            n_drive = 1
+            n_sense = cols * rows
+            self.coords = [tuple((k % cols, k // cols) for k in range(n_sense))]
+        else:
+            drive_cols = (diode_orientation == DiodeOrientation.COL2ROW) == (
+                pull is digitalio.Pull.DOWN
+            )
+            n_drive, n_sense = (cols, rows) if drive_cols else (rows, cols)
+            self.coords = [
+                tuple((d, s) if drive_cols else (s, d) for s in range(n_sense))
+                for d in range(n_drive)
+            ]
+            self.latch = ensure_digital_in_out(latch)
+            self.latch.switch_to_output(value=False)
+
+        self.row_masks = [0] * n_drive
+        self.all_sense = (1 << n_sense) - 1
+
+        in_bytes = (n_sense + 7) // 8
+        out_bytes = (n_drive + 7) // 8 if latch is not None else 0
+        length = max(in_bytes, out_bytes)
+        self._in_buf = bytearray(length)
+        self._in_view = memoryview(self._in_buf)[:in_bytes]
+
+        # Pattern of every drive line, padded at the front to the transfer length
+        all_drive = (1 << 8 * out_bytes) - 1
+        self._drive_bufs = []
+        for d in range(n_drive if latch is not None else 0):
+            pattern = 1 << d if self.pressed_value else all_drive & ~(1 << d)
+            buf = bytearray(length)
+            buf[length - out_bytes :] = pattern.to_bytes(out_bytes, "big")
+            self._drive_bufs.append(buf)
+
+        if self.latch is not None:
+            self._lock()
+            try:
+                self.spi.write(self._drive_bufs[0])
+                self._pulse_latch()
+            finally:
+                self.spi.unlock()
+
+    def _lock(self):
+        while not self.spi.try_lock():
+            pass
+        self.spi.configure(baudrate=self.baudrate)
+
+    def _pulse_load(self):
+        self.load.value = False
+        self.load.value = True
+
+    def _pulse_latch(self):
+        self.latch.value = True
+        self.latch.value = False
+
+    def _read_mask(self) -> int:
+        value = int.from_bytes(self._in_view, "little")
+        if not self.pressed_value:
+            value = ~value  # Pull.UP, a press reads low
+        return value & self.all_sense
+
+    def get_key_events(self) -> list[tuple[int, int, bool]]:
+        raw_events = []
+        row_masks = self.row_masks
+
+        self._lock()
+        try:
+            if self.latch is None:
+                self._pulse_load()
+                self.spi.readinto(self._in_buf)
+                mask = self._read_mask()
+                changed = mask ^ row_masks[0]
+                if changed:
+                    row_masks[0] = mask
+                    append_mask_events(raw_events, self.coords[0], changed, mask)
+                return raw_events
+
+            drive_bufs = self._drive_bufs
+            n_drive = len(drive_bufs)
+            for out_idx in range(n_drive):
+                # Sample the driven line, clock out the next one meanwhile
+                self._pulse_load()
+                next_idx = out_idx + 1 if out_idx + 1 < n_drive else 0
+                self.spi.write_readinto(drive_bufs[next_idx], self._in_buf)
+                self._pulse_latch()
+
+                mask = self._read_mask()
+                changed = mask ^ row_masks[out_idx]
+                if changed:
+                    row_masks[out_idx] = mask
+                    append_mask_events(
+                        raw_events, self.coords[out_idx], changed, mask
+                    )
+        finally:
+            self.spi.unlock()
+
+        return raw_events
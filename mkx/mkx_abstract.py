@@ -4,6 +4,8 @@ import usb_hid
 from adafruit_hid.keyboard import Keyboard
 
 from mkx.ble import BLE
+from mkx.hid_nkro_keyboard import KeyboardNKRO, find_nkro_device
+from mkx.hid_report_batcher import KeyboardBatcher
 
 from mkx.periphery_single import PeripherySingle
 from mkx.interface_abstract import InterfaceAbstract
@@ -11,15 +13,25 @@ from mkx.keys_abstract import KeysAbstract
 
 from mkx.layer_status_led_abstract import LayerStatusLedAbstract
 from mkx.manager_layers import LayersManager
+from mkx.keymap_compiler import KeymapCompiler
 from mkx.timed_keys import TimedKeysManager
 from mkx.keys_sticky import StickyKeyManager
 from mkx.backlight_abstract import BacklightAbstract
-
+from mkx.debouncer import Debouncer, DebounceMode, DEBOUNCE_MS
+from mkx.loop_governor import LoopGovernor
+from mkx.macro_player import MacroPlayer
+from mkx.mouse_motion import MouseMotion
+
+from mkx import log, latency, macro_player, mouse_motion
+from mkx.log import LogCategory
+from mkx.latency import Stage
 from mkx.check import check
 from mkx.process_key_event import process_key_event
 from mkx.error import halt_on_error
 from mkx.ansi_colors import Ansi, Ansi256
 
+IDLE_SLEEP_MS = 1
+
 
 class MKX_Abstract:
     def __init__(self):
@@ -30,6 +42,7 @@ class MKX_Abstract:
         self.col_size = 0
         self.row_size = 0
         self.keymap = []
+        self.keymap_compiler = KeymapCompiler(self.keymap)
         self.interfaces = []
         self.pressed_keys: dict[int, bool] = (
             {}
@@ -41,6 +54,13 @@ class MKX_Abstract:
 
         self.backlight = None
 
+        # Persistent debounce state, one Debouncer per device_id
+        self.debouncers = {}
+        self._debounce_config = {}
+
+        # Adaptive loop sleep, None sleeps a fixed time per pass
+        self.loop_governor = None
+
         self._use_ble = False
         self._ble = None
 
@@ -50,6 +70,38 @@ class MKX_Abstract:
     def use_ble(self, use_ble: bool):
         self._use_ble = use_ble
 
+    def set_debounce(
+        self,
+        device_id: str,
+        debounce_ms=DEBOUNCE_MS,
+        mode=DebounceMode.EAGER,
+        key_ms=None,
+    ):
+        """
+        Debounce time and mode (DebounceMode.EAGER, DEFERRED or EAGER_PRESS) of one
+        device, key_ms maps logical key indexes to their own debounce time.
+        """
+        self._debounce_config[device_id] = (debounce_ms, mode, key_ms)
+        self.debouncers.pop(device_id, None)  # Rebuilt with the new settings
+
+    def use_loop_governor(self, use_loop_governor: bool, **governor_kwargs):
+        """Scan at full rate while typing and back off when idle, see LoopGovernor"""
+        if use_loop_governor:
+            self.loop_governor = LoopGovernor(**governor_kwargs)
+        else:
+            self.loop_governor = None
+
+    def use_macro_player(self, use_macro_player: bool, **player_kwargs):
+        """Play SEQ/VIM keys over several passes, see MacroPlayer"""
+        if use_macro_player:
+            macro_player.player = MacroPlayer(**player_kwargs)
+        else:
+            macro_player.player = None
+
+    def set_mouse_motion(self, **motion_kwargs):
+        """Step interval and acceleration curves of the mouse keys, see MouseMotion"""
+        mouse_motion.motion = MouseMotion(**motion_kwargs)
+
     def add_periphery_single(self, periphery_single: PeripherySingle):
         self.periphery_single = periphery_single
 
@@ -63,6 +115,7 @@ class MKX_Abstract:
         self, keymap: list[list[KeysAbstract]], col_size: int, row_size: int
     ):
         self.keymap = keymap
+        self.keymap_compiler = KeymapCompiler(keymap)
         self.col_size = col_size
         self.row_size = row_size
 
@@ -95,9 +148,17 @@ class MKX_Abstract:
         if self._use_ble:
             self._ble = BLE()
             self._ble.init()
-            self.keyboard = Keyboard(self._ble.devices)
+            keyboard = Keyboard(self._ble.devices)
         else:
-            self.keyboard = Keyboard(usb_hid.devices)
+            # boot_cfg(nkro=True) replaces the boot keyboard with the NKRO device
+            nkro_device = find_nkro_device(usb_hid.devices)
+            if nkro_device:
+                keyboard = KeyboardNKRO(nkro_device)
+            else:
+                keyboard = Keyboard(usb_hid.devices)
+
+        # Key changes of one run_once pass go out together, see _flush_reports()
+        self.keyboard = KeyboardBatcher(keyboard)
 
         print(
             f"{Ansi256.LIGHT_GREEN}Keyboard initialized successfully! {Ansi.BOLD}TYPE!!!{Ansi.RESET}"
@@ -129,6 +190,22 @@ class MKX_Abstract:
             print(e)
             return None
 
+    def _get_debouncer(self, device_id: str) -> Debouncer:
+        debouncer = self.debouncers.get(device_id)
+        if debouncer is None:
+            debounce_ms, mode, key_ms = self._debounce_config.get(
+                device_id, (DEBOUNCE_MS, DebounceMode.EAGER, None)
+            )
+            debouncer = Debouncer(self.col_size * self.row_size, debounce_ms, mode)
+            if key_ms:
+                for index, ms in key_ms.items():
+                    debouncer.set_key_debounce(index, ms)
+            log.info(
+                LogCategory.SYSTEM, "Debounce %s: %s", device_id, debouncer.describe()
+            )
+            self.debouncers[device_id] = debouncer
+        return debouncer
+
     def _collect_key_events(self):
         if not self.periphery_single:
             halt_on_error(
@@ -144,10 +221,14 @@ class MKX_Abstract:
             )
 
         raw_events = self.periphery_single.get_key_events()
-        if not raw_events:
+        debouncer = self._get_debouncer(self.periphery_single.device_id)
+        if not raw_events and not debouncer.is_pending():
             return []
 
-        events = []
+        now = time.monotonic_ns() // 1_000_000
+
+        # Edges held back in earlier passes whose debounce window closed by now
+        events = debouncer.poll(now, [])
 
         # translate to flat index through the interface’s coordinate map
         for local_col, local_row, pressed in raw_events:
@@ -155,7 +236,8 @@ class MKX_Abstract:
             if logical_index is None:
                 continue
 
-            events.append((logical_index, pressed))
+            if debouncer.process(logical_index, pressed, now):
+                events.append((logical_index, pressed, now))
 
         return events
 
@@ -165,19 +247,80 @@ class MKX_Abstract:
 
         now = time.monotonic_ns() // 1_000_000
 
+        stats = latency.stats
+        if stats:
+            t = time.monotonic_ns()
+
         self.timed_keys_manager.update(self.layers_manager, self.keyboard, now)
+        if stats:
+            t = stats.lap(Stage.TIMERS, t)
+
+        key_events = self._collect_key_events()
+        if stats:
+            t = stats.lap(Stage.SCAN, t)
 
-        for event in self._collect_key_events():
-            logical_index, pressed = event
+        self._play_macros(now)
 
+        for logical_index, pressed, timestamp in key_events:
             process_key_event(
-                self, self.periphery_single.device_id, logical_index, pressed, now
+                self, self.periphery_single.device_id, logical_index, pressed, timestamp
             )
+        if stats:
+            t = stats.lap(Stage.DISPATCH, t)
+
+        self._flush_reports()
+        if stats:
+            t = stats.lap(Stage.HID_SEND, t)
 
         if self.backlight:
             self.backlight.shine()
+        if stats:
+            stats.lap(Stage.BACKLIGHT, t)
+            stats.report(now)
+
+        self._idle_sleep(now, active=bool(key_events))
+
+    def _play_macros(self, now):
+        player = macro_player.player
+        if player and player.is_pending():
+            player.update(self.layers_manager, self.keyboard, now)
+
+    def _next_deadline(self, now):
+        """
+        Earliest time a timed key, a macro step or a debounced edge is due,
+        None if nothing waits
+        """
+        deadline = self.timed_keys_manager.next_deadline()
+        player = macro_player.player
+        if player and player.is_pending():
+            if deadline is None or player.next_time < deadline:
+                deadline = player.next_time
+        for debouncer in self.debouncers.values():
+            due = debouncer.next_deadline(now)
+            if due is not None and (deadline is None or due < deadline):
+                deadline = due
+        return deadline
+
+    def _flush_reports(self):
+        """Send the key changes and mouse steps collected during this pass"""
+        if self.keyboard:
+            self.keyboard.flush()
+        mouse_motion.motion.flush()
+
+    def _idle_sleep(self, now, sleep_ms=IDLE_SLEEP_MS, active=False):
+        """Keep CPU usage low, but wake up when the next timed key is due"""
+        deadline = self._next_deadline(now)
+
+        governor = self.loop_governor
+        if governor:
+            busy = active or bool(self.pressed_keys) or deadline is not None
+            governor.sleep(now, busy, deadline)
+            return
 
-        time.sleep(0.001)  # Keep CPU usage low
+        if deadline is not None and deadline - now < sleep_ms:
+            sleep_ms = deadline - now
+        if sleep_ms > 0:
+            time.sleep(sleep_ms / 1000)
 
     def run_forever(self):
         self._init_keyboard()
@@ -1,11 +1,14 @@
 import sys, time
-import json
-from collections import OrderedDict
 
-from mkx.mkx_abstract import MKX_Abstract
+from mkx import log, latency
+from mkx.log import LogCategory
+from mkx.latency import Stage
+from mkx.mkx_abstract import MKX_Abstract, IDLE_SLEEP_MS
 from mkx.periphery_central import PeripheryCentral
 
-from mkx.communication_message import sync_messages, debounce
+from mkx.communication_message import key_event_fields
+from mkx.clock_sync import ClockSync
+from mkx.event_scheduler import EventScheduler, REORDER_MS
 from mkx.process_key_event import process_key_event
 
 FRAME_INTERVAL_MS = 5
@@ -17,20 +20,29 @@ class MKX_Central(MKX_Abstract):
         self.periphery_central = None
         self.last_frame_time = 0
 
+        # Remote timestamps are moved to the central timeline by a persistent estimate
+        self.clock_sync = ClockSync()
+
+        # Event-driven scheduling, None runs the fixed frame loop
+        self.event_scheduler = None
+
     def add_periphery_central(self, periphery_central: PeripheryCentral):
         self.periphery_central = periphery_central
 
+    def use_event_scheduler(self, use_event_scheduler: bool, reorder_ms=REORDER_MS):
+        """Process key events as soon as they are decoded instead of once per frame"""
+        if use_event_scheduler:
+            self.event_scheduler = EventScheduler(reorder_ms=reorder_ms)
+        else:
+            self.event_scheduler = None
+
     def _periphery_central_send(self):
         if self.periphery_central:
             signal = self.periphery_central.get_key_events()
-            for col, row, pressed in signal:
-                self.periphery_central.send(
-                    "key_event",
-                    OrderedDict(
-                        [("col", col), ("row", row), ("pressed", pressed)],
-                    ),
-                    verbose=False,
-                )
+            if signal:
+                now = time.monotonic_ns() // 1_000_000
+                for col, row, pressed in signal:
+                    self.periphery_central.push_key_event(col, row, pressed, now)
         else:
             print("No periphery central registered!")
             exit(1)
@@ -42,72 +54,208 @@ class MKX_Central(MKX_Abstract):
         else:
             print(f"[{device_id}] not connected, can't send")
 
-    def _process_key_event_msg(self, event_json):
-        timestamp = event_json["timestamp"]
-        device_id = event_json["device_id"]
-        local_col = event_json["col"]
-        local_row = event_json["row"]
-        pressed = event_json["pressed"]
-
-        # find the interface for this device_id
-        iface = self._get_interface(device_id)
-        if iface is None:
-            print(f"No interface registered for device_id {device_id}!")
-            exit(1)
+    def _debounce_key_events(self, messages, now):
+        """
+        Returns the debounced key events as (timestamp, device_id, logical_index, pressed),
+        including edges held back in earlier frames whose debounce window closed by now.
+        """
+        events = []
 
-        # translate to flat index through the interface’s coordinate map
-        logical_index = self._get_logical_index(iface, local_col, local_row)
-        if logical_index is None:
-            return
+        for msg in messages:
+            if msg.get("type") != "key_event":
+                continue  # Ignore non-key_events
+
+            device_id = msg["device_id"]
+            local_col, local_row, pressed = key_event_fields(msg)
+
+            # find the interface for this device_id
+            iface = self._get_interface(device_id)
+            if iface is None:
+                print(f"No interface registered for device_id {device_id}!")
+                exit(1)
+
+            # translate to flat index through the interface’s coordinate map
+            logical_index = self._get_logical_index(iface, local_col, local_row)
+            if logical_index is None:
+                continue
+
+            timestamp = msg["timestamp"]
+            debouncer = self._get_debouncer(device_id)
+            if debouncer.process(logical_index, pressed, timestamp):
+                events.append((timestamp, device_id, logical_index, pressed))
+
+        matured = []
+        for device_id, debouncer in self.debouncers.items():
+            for logical_index, pressed, timestamp in debouncer.poll(now, matured):
+                events.append((timestamp, device_id, logical_index, pressed))
+            matured.clear()
+
+        events.sort(key=lambda e: e[0])
+        return events
+
+    def _next_deadline(self, now):
+        """Also wakes up when the first event held for reordering is due"""
+        deadline = super()._next_deadline(now)
+        if self.event_scheduler:
+            release = self.event_scheduler.next_release()
+            if release is not None and (deadline is None or release < deadline):
+                deadline = release
+        return deadline
+
+    def _run_once_event_driven(self):
+        scheduler = self.event_scheduler
+        if scheduler.local_device_id is None and self.periphery_central:
+            scheduler.local_device_id = self.periphery_central.device_id
+
+        stats = latency.stats
+        if stats:
+            t = time.monotonic_ns()
+
+        self._periphery_central_send()
+        if stats:
+            t = stats.lap(Stage.SCAN, t)
+
+        all_messages = []
+        for interface in self.interfaces:
+            data = interface.receive(verbose=False)
+            if data:
+                received = time.monotonic_ns() // 1_000_000
+                self.clock_sync.observe_messages(data, received)
+                all_messages.extend(data)
+        if stats:
+            t = stats.lap(Stage.RECEIVE, t)
+
+        now = time.monotonic_ns() // 1_000_000
 
-        process_key_event(self, device_id, logical_index, pressed, timestamp)
+        if all_messages:
+            for msg in self.clock_sync.sync(all_messages):
+                scheduler.advance(msg["device_id"], msg["timestamp"])
+        if stats:
+            t = stats.lap(Stage.SYNC, t)
+
+        # Also releases edges whose debounce window closed since the last pass
+        for event in self._debounce_key_events(all_messages, now):
+            scheduler.push(event, now)
+
+        key_events = scheduler.release(now, [])
+        if stats:
+            t = stats.lap(Stage.DEBOUNCE, t)
+
+        # Timers fire in deadline order, only once the earliest one is due
+        deadline = self.timed_keys_manager.next_deadline()
+        if deadline is not None and deadline <= now:
+            self.timed_keys_manager.update(self.layers_manager, self.keyboard, now)
+        if stats:
+            t = stats.lap(Stage.TIMERS, t)
+
+        self._play_macros(now)
+
+        for timestamp, device_id, logical_index, pressed in key_events:
+            process_key_event(self, device_id, logical_index, pressed, timestamp)
+        if stats:
+            t = stats.lap(Stage.DISPATCH, t)
+
+        self._flush_reports()
+        if stats:
+            t = stats.lap(Stage.HID_SEND, t)
+
+        if now - self.last_frame_time >= FRAME_INTERVAL_MS:
+            if self.backlight:
+                self.backlight.shine()
+            self.last_frame_time = now
+            if stats:
+                stats.lap(Stage.BACKLIGHT, t)
+                stats.report(now)
+
+        # Poll again at once while events arrive, else sleep until the next deadline
+        self._idle_sleep(
+            now,
+            0 if all_messages else IDLE_SLEEP_MS,
+            active=bool(all_messages) or scheduler.is_pending(),
+        )
 
     def run_once(self):
         if not self._ensure_ble():
             return
 
+        if self.event_scheduler:
+            self._run_once_event_driven()
+            return
+
         now = time.monotonic_ns() // 1_000_000  # Current time in ms
 
         if now - self.last_frame_time >= FRAME_INTERVAL_MS:
             frame_end = now + FRAME_INTERVAL_MS
 
+            # Close the frame early when a timed key or macro step is due before its end
+            deadline = self._next_deadline(now)
+            if deadline is not None and now < deadline < frame_end:
+                frame_end = deadline
+
             all_messages = []
+            stats = latency.stats
 
             # Continuously receive data while we're within the frame time
             while True:
                 if time.monotonic_ns() // 1_000_000 >= frame_end:
                     break
 
+                if stats:
+                    t = time.monotonic_ns()
                 self._periphery_central_send()
+                if stats:
+                    t = stats.lap(Stage.SCAN, t)
 
                 # Loop over all interfaces to process received data
                 for interface in self.interfaces:
                     data = interface.receive(verbose=True)
                     if data:
+                        received = time.monotonic_ns() // 1_000_000
+                        self.clock_sync.observe_messages(data, received)
                         all_messages.extend(data)
+                if stats:
+                    stats.lap(Stage.RECEIVE, t)
 
                 time.sleep(0.001)  # Keep CPU usage low
 
-            sync_msg = sync_messages(
-                all_messages, time.monotonic_ns() // 1_000_000, verbose=True
-            )
+            if stats:
+                t = time.monotonic_ns()
+            sync_msg = self.clock_sync.sync(all_messages)
+            if stats:
+                t = stats.lap(Stage.SYNC, t)
             if sync_msg:
-                print("sync_msg:", json.dumps(sync_msg))
+                log.debug(LogCategory.COMM, "sync_msg: %s", sync_msg)
 
-            debounced_msg = debounce(sync_msg, verbose=True)
-            if debounced_msg:
-                print("debounced_msg:", json.dumps(debounced_msg))
+            key_events = self._debounce_key_events(
+                sync_msg, time.monotonic_ns() // 1_000_000
+            )
+            if stats:
+                t = stats.lap(Stage.DEBOUNCE, t)
+            if key_events:
+                log.debug(LogCategory.KEYS, "key_events: %s", key_events)
 
             self.timed_keys_manager.update(
                 self.layers_manager, self.keyboard, time.monotonic_ns() // 1_000_000
             )
+            if stats:
+                t = stats.lap(Stage.TIMERS, t)
+
+            self._play_macros(now)
+
+            for timestamp, device_id, logical_index, pressed in key_events:
+                process_key_event(self, device_id, logical_index, pressed, timestamp)
+            if stats:
+                t = stats.lap(Stage.DISPATCH, t)
 
-            for key_event in debounced_msg:
-                self._process_key_event_msg(key_event)
-                print("")
+            self._flush_reports()
+            if stats:
+                t = stats.lap(Stage.HID_SEND, t)
 
             if self.backlight:
                 self.backlight.shine()
+            if stats:
+                stats.lap(Stage.BACKLIGHT, t)
+                stats.report(now)
 
             self.last_frame_time = frame_end
 
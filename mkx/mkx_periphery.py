@@ -2,6 +2,7 @@ import time
 from collections import OrderedDict
 
 from mkx.periphery_abstract import PeripheryAbstract
+from mkx.loop_governor import LoopGovernor
 
 
 class MKX_Periphery:
@@ -9,10 +10,23 @@ class MKX_Periphery:
         self.periphery = periphery
         self.debug = debug
 
+        # Adaptive loop sleep, None sleeps a fixed time per pass
+        self.loop_governor = None
+        self._held = 0  # Keys currently held, keeps the governor at full rate
+
+    def use_loop_governor(self, use_loop_governor: bool, **governor_kwargs):
+        """Scan at full rate while typing and back off when idle, see LoopGovernor"""
+        if use_loop_governor:
+            self.loop_governor = LoopGovernor(**governor_kwargs)
+        else:
+            self.loop_governor = None
+
     def run_once(self):
+        signal = None
         if self.periphery:
             signal = self.periphery.get_key_events()
             for col, row, pressed in signal:
+                self._held = max(0, self._held + (1 if pressed else -1))
                 self.periphery.send(
                     "key_event",
                     OrderedDict(
@@ -21,7 +35,11 @@ class MKX_Periphery:
                     verbose=True,
                 )
 
-        time.sleep(0.001)  # Keep CPU usage low
+        if self.loop_governor:
+            now = time.monotonic_ns() // 1_000_000
+            self.loop_governor.sleep(now, bool(signal) or self._held > 0)
+        else:
+            time.sleep(0.001)  # Keep CPU usage low
 
         if self.debug and self.periphery:
             self.periphery.debug_receive(verbose=True)
@@ -6,10 +6,15 @@ from mkx.slider_event import SliderEvent
 from mkx.interface_touch_slider import InterfaceTouchSlider
 from mkx.haptic import Haptic
 
+from mkx import log, latency
+from mkx.log import LogCategory
+from mkx.latency import Stage
 from mkx.process_key_event import process_key_event
 from mkx.error import halt_on_error
 from mkx.ansi_colors import Ansi, Ansi256
 
+_MSG_SLIDER_KEY = f"{Ansi.YELLOW}{Ansi.BOLD}key: %s %s{Ansi.RESET}"
+
 
 class MKX_Touch(MKX_Abstract):
     def __init__(self):
@@ -122,18 +127,14 @@ class MKX_Touch(MKX_Abstract):
     def _handle_slider_event(self, event, now):
         action = "pressed" if event.is_pressed else "released"
 
-        print(
-            f"{Ansi.YELLOW}{Ansi.BOLD}"
-            f"key: {event.key.key_name} {action}"
-            f"{Ansi.RESET}"
-        )
+        log.debug(LogCategory.KEYS, _MSG_SLIDER_KEY, event.key.key_name, action)
 
         if event.is_pressed:
             event.key.on_press(self.layers_manager, self.keyboard, now)
         else:
             event.key.on_release(self.layers_manager, self.keyboard, now)
 
-        print()
+        log.debug(LogCategory.KEYS, "")
 
     def run_once(self):
         # print(f"{Ansi.YELLOW}{Ansi.BOLD}=== run_once ==={Ansi.RESET}")
@@ -142,19 +143,40 @@ class MKX_Touch(MKX_Abstract):
 
         now = time.monotonic_ns() // 1_000_000
 
+        stats = latency.stats
+        if stats:
+            t = time.monotonic_ns()
+
         self.timed_keys_manager.update(self.layers_manager, self.keyboard, now)
+        if stats:
+            t = stats.lap(Stage.TIMERS, t)
+
+        electrode_events = self._collect_electrode_events()
+        if stats:
+            t = stats.lap(Stage.SCAN, t)
 
-        for event in self._collect_electrode_events():
+        self._play_macros(now)
+
+        for event in electrode_events:
             if isinstance(event, SliderEvent):
                 self._handle_slider_event(event, now)
             else:
                 logical_index, pressed = event
                 process_key_event(self, "periphery_touch", logical_index, pressed, now)
+        if stats:
+            t = stats.lap(Stage.DISPATCH, t)
+
+        self._flush_reports()
+        if stats:
+            t = stats.lap(Stage.HID_SEND, t)
 
         if self.backlight:
             self.backlight.shine()
+        if stats:
+            stats.lap(Stage.BACKLIGHT, t)
+            stats.report(now)
 
-        time.sleep(0.01)  # Keep CPU usage low
+        self._idle_sleep(now, 10, active=bool(electrode_events))
 
     def run_forever(self):
         self._init_keyboard()
@@ -0,0 +1,126 @@
+"""
+Shared mouse device and the motion engine of the mouse move and scroll keys.
+
+All mouse keys use one adafruit_hid Mouse, created on the first use.
+Held move and scroll keys are stepped by the timed keys scheduler every
+interval_ms, the step grows with the hold time along a curve of
+(held_ms, step) points. The steps of all held keys are summed and sent as
+one report when the loop flushes its reports.
+"""
+
+MOUSE_INTERVAL_MS = 10
+SCROLL_INTERVAL_MS = 80
+MOVE_CURVE = ((0, 2), (200, 2), (1000, 10), (2000, 20))  # (held_ms, pixels per step)
+SCROLL_CURVE = ((0, 1), (1000, 1), (2000, 3))  # (held_ms, lines per step)
+
+_mouse = None
+
+
+def shared_mouse():
+    global _mouse
+    if _mouse is None:
+        import usb_hid
+        from adafruit_hid.mouse import Mouse
+
+        _mouse = Mouse(usb_hid.devices)
+    return _mouse
+
+
+def curve_step(curve, held_ms: int) -> int:
+    """Step at held_ms, linear between the curve points and flat after the last one"""
+    prev_ms, prev_step = curve[0]
+    for point_ms, point_step in curve:
+        if held_ms < point_ms:
+            return prev_step + (point_step - prev_step) * (held_ms - prev_ms) // (
+                point_ms - prev_ms
+            )
+        prev_ms, prev_step = point_ms, point_step
+    return prev_step
+
+
+class MouseMotion:
+    def __init__(
+        self,
+        interval_ms=MOUSE_INTERVAL_MS,
+        scroll_interval_ms=SCROLL_INTERVAL_MS,
+        move_curve=MOVE_CURVE,
+        scroll_curve=SCROLL_CURVE,
+    ):
+        self.interval_ms = interval_ms
+        self.scroll_interval_ms = scroll_interval_ms
+        self.move_curve = move_curve
+        self.scroll_curve = scroll_curve
+
+        self.held = {}  # key -> press time
+        self.next_move = 0
+        self.next_scroll = 0
+
+        # Pending report
+        self._x = 0
+        self._y = 0
+        self._wheel = 0
+
+        self._mouse = None
+
+    @property
+    def mouse(self):
+        if self._mouse is None:
+            self._mouse = shared_mouse()
+        return self._mouse
+
+    @mouse.setter
+    def mouse(self, mouse):
+        self._mouse = mouse
+
+    def _step(self, key, held_ms: int, move: bool, scroll: bool):
+        x, y, wheel = key.direction()
+        if move and (x or y):
+            step = curve_step(self.move_curve, held_ms)
+            self._x += x * step
+            self._y += y * step
+        if scroll and wheel:
+            self._wheel += wheel * curve_step(self.scroll_curve, held_ms)
+
+    def press(self, key, timestamp: int):
+        """Start moving with key, the first step goes out with this frame"""
+        if not self.held:
+            self.next_move = timestamp + self.interval_ms
+            self.next_scroll = timestamp + self.scroll_interval_ms
+        self.held[key] = timestamp
+        self._step(key, 0, True, True)
+
+    def release(self, key):
+        self.held.pop(key, None)
+
+    def is_moving(self, key) -> bool:
+        return key in self.held
+
+    def deadline(self):
+        """Time of the next step, None while no key is held"""
+        if not self.held:
+            return None
+        return min(self.next_move, self.next_scroll)
+
+    def tick(self, timestamp: int):
+        """Add the steps due by timestamp, once per frame however many keys are held"""
+        move = timestamp >= self.next_move
+        scroll = timestamp >= self.next_scroll
+        if not (move or scroll):
+            return
+
+        for key, pressed_time in self.held.items():
+            self._step(key, timestamp - pressed_time, move, scroll)
+
+        if move:
+            self.next_move = timestamp + self.interval_ms
+        if scroll:
+            self.next_scroll = timestamp + self.scroll_interval_ms
+
+    def flush(self):
+        """Send the summed steps as one report"""
+        if self._x or self._y or self._wheel:
+            self.mouse.move(self._x, self._y, self._wheel)
+            self._x = self._y = self._wheel = 0
+
+
+motion = MouseMotion()
@@ -13,17 +13,33 @@ class PeripheryAbstract:
         *,
         diode_orientation=DiodeOrientation.COL2ROW,
         pull=digitalio.Pull.DOWN,
-        warmup_cycles=100
+        warmup_cycles=100,
+        scanner=MatrixScanner,
+        **scanner_kwargs
     ):
+        """
+        scanner: matrix scanner backend class, MatrixScanner (digitalio, default),
+                 MatrixScannerBitmask, MatrixScannerPort (one port read per
+                 drive line) or MatrixScannerKeypad (native keypad.KeyMatrix).
+                 Or a backend instance with get_key_events(), e.g.
+                 MatrixScannerShiftRegister or MatrixScannerMCP23017, then the
+                 pins and the other matrix options are unused.
+        scanner_kwargs: extra backend options, e.g. interval for MatrixScannerKeypad,
+                        read_port and port_bits for MatrixScannerPort.
+        """
         self.device_id = device_id or "unknown"
 
-        self.matrix_scanner = MatrixScanner(
-            cols=col_pins,
-            rows=row_pins,
-            diode_orientation=diode_orientation,
-            pull=pull,
-            warmup_cycles=warmup_cycles,
-        )
+        if isinstance(scanner, type):
+            self.matrix_scanner = scanner(
+                cols=col_pins,
+                rows=row_pins,
+                diode_orientation=diode_orientation,
+                pull=pull,
+                warmup_cycles=warmup_cycles,
+                **scanner_kwargs,
+            )
+        else:
+            self.matrix_scanner = scanner  # Prebuilt backend, owns its pins and buses
 
     def get_key_events(self) -> list[tuple[int, int, bool]]:
         """Returns a list of (col, row, pressed) events"""
@@ -1,15 +1,74 @@
+from array import array
+
+from mkx import log
+from mkx.log import LogCategory
 from mkx.communication_message import encode_message
 from mkx.periphery_abstract import PeripheryAbstract
 
+EVENT_QUEUE_SIZE = 32
+
 
 class PeripheryCentral(PeripheryAbstract):
-    def __init__(self, device_id, col_pins, row_pins, **kwargs):
+    def __init__(
+        self, device_id, col_pins, row_pins, *, queue_size=EVENT_QUEUE_SIZE, **kwargs
+    ):
+        """
+        queue_size: capacity of the in-memory key event queue read by InterfaceCentral.
+        """
         super().__init__(device_id, col_pins, row_pins, **kwargs)
         self.payload = None
 
+        # Local key events skip the encode/parse round trip, packed as
+        # col | row << 7 | pressed << 15 in a preallocated ring
+        self.queue_size = queue_size
+        self._events = array("H", [0] * queue_size)
+        self._stamps = [0] * queue_size
+        self._head = 0
+        self._count = 0
+        self.events_dropped = 0
+
     def receive(self, verbose=False) -> list[dict]:
         # Central has no transport to receive messages
         return []
 
     def send(self, msg_type: str, data: dict, verbose=False):
         self.payload = encode_message(self.device_id, msg_type, data, verbose)
+
+    def push_key_event(self, col: int, row: int, pressed: bool, timestamp: int) -> bool:
+        """Queue one key event, returns False if the queue is full"""
+        if self._count == self.queue_size:
+            self.events_dropped += 1
+            log.warning(
+                LogCategory.COMM,
+                "[%s] Key event queue full, event dropped",
+                self.device_id,
+            )
+            return False
+
+        i = (self._head + self._count) % self.queue_size
+        self._events[i] = (0x8000 if pressed else 0) | (row << 7) | col
+        self._stamps[i] = timestamp
+        self._count += 1
+        return True
+
+    def drain_key_events(self, out: list) -> list:
+        """Append the queued events to out as key_event messages, and return it"""
+        device_id = self.device_id
+        while self._count:
+            event = self._events[self._head]
+
+            # Plain dict, (col, row, pressed) tuple: the cheapest message to build
+            out.append(
+                {
+                    "timestamp": self._stamps[self._head],
+                    "device_id": device_id,
+                    "type": "key_event",
+                    "data": (event & 0x7F, (event >> 7) & 0x7F, bool(event & 0x8000)),
+                    "anchored": True,  # Stamped on the local clock
+                }
+            )
+
+            self._head = (self._head + 1) % self.queue_size
+            self._count -= 1
+
+        return out
@@ -1,6 +1,6 @@
 import busio
 
-from mkx.communication_message import encode_message, MessageParser
+from mkx.communication_message import encode_message, KeyEventEncoder, MessageParser
 from mkx.periphery_abstract import PeripheryAbstract
 
 
@@ -14,11 +14,19 @@ class PeripheryUART(PeripheryAbstract):
         rx_pin,
         *,
         baudrate=9600,
+        binary=True,
+        crc=False,
         **kwargs,
     ):
         super().__init__(device_id, col_pins, row_pins, **kwargs)
         self.uart = busio.UART(tx_pin, rx_pin, baudrate=baudrate, timeout=0.01)
 
+        # Key events go out as compact binary frames, other messages stay ASCII
+        self.crc = crc
+        self.key_event_encoder = (
+            KeyEventEncoder(self.device_id, crc=crc) if binary else None
+        )
+
         self.msg_parser = MessageParser()  # for debug_receive()
 
     def debug_receive(self, verbose=False) -> list[dict]:
@@ -40,7 +48,14 @@ class PeripheryUART(PeripheryAbstract):
         return []
 
     def send(self, msg_type: str, data: dict, verbose=False):
-        payload = encode_message(self.device_id, msg_type, data, verbose)
+        if self.key_event_encoder and msg_type == "key_event":
+            payload = self.key_event_encoder.encode(
+                data["col"], data["row"], data["pressed"], verbose
+            )
+        else:
+            payload = encode_message(
+                self.device_id, msg_type, data, verbose, crc=self.crc
+            )
         try:
             self.uart.write(payload)
         except Exception as e:
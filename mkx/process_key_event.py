@@ -1,23 +1,53 @@
-from mkx.keys_layers import KeysLayer, LT, TT
-from mkx.timed_keys import TimedKeys
+from mkx import log, trace
+from mkx.log import LogCategory
+from mkx.trace import TraceAction
+from mkx.keys_abstract import KeyFlags
 from mkx.keys_sticky import SK
-from mkx.ansi_colors import Ansi, Ansi256
+from mkx.timed_keys import TimedKeys
+from mkx.ansi_colors import Ansi
 
+_MSG_PRESSED = f"{Ansi.YELLOW}{Ansi.BOLD}key: %s pressed{Ansi.RESET}"
+_MSG_RELEASED = f"{Ansi.YELLOW}{Ansi.BOLD}key: %s released{Ansi.RESET}"
+_MSG_OUT_OF_BOUNDS = f"{Ansi.RED}Key index %d out of bounds for layers %s{Ansi.RESET}"
 
-def _get_key(self, logical_index: int):
-    active_layer = self.layers_manager.get_top_layer()
 
+def _get_key(self, logical_index: int):
+    # Resolved through the active layer stack, transparent keys fall through
     try:
-        key = self.keymap[active_layer][logical_index]
+        key = self.keymap_compiler.get_key(self.layers_manager, logical_index)
     except IndexError:
-        print(
-            f"{Ansi.RED}Key index {logical_index} out of bounds for layer {active_layer}{Ansi.RESET}"
+        log.error(
+            LogCategory.KEYS,
+            _MSG_OUT_OF_BOUNDS,
+            logical_index,
+            self.layers_manager.active_layers,
         )
         return None
 
     return key
 
 
+_class_flags = {}  # Key class -> KeyFlags
+
+
+def _key_flags(key) -> int:
+    """
+    KeyFlags of the key class, resolved once per class. TimedKeys and SK
+    subclasses always carry their bit, also when a base listed before the
+    mixin (class X(KeysLayer, TimedKeys)) sets flags of its own.
+    """
+    cls = type(key)
+    flags = _class_flags.get(cls)
+    if flags is None:
+        flags = getattr(cls, "flags", KeyFlags.NONE)
+        if issubclass(cls, TimedKeys):
+            flags |= KeyFlags.TIMED
+        if issubclass(cls, SK):
+            flags |= KeyFlags.STICKY
+        _class_flags[cls] = flags
+    return flags
+
+
 def process_key_event(
     self, device_id: str, logical_index: int, pressed: bool, timestamp: int
 ):
@@ -35,28 +65,37 @@ def process_key_event(
         if key is None:
             return
 
-        print(f"{Ansi.YELLOW}{Ansi.BOLD}key: {key.key_name} pressed{Ansi.RESET}")
+        log.debug(LogCategory.KEYS, _MSG_PRESSED, key.key_name)
+        if trace.recorder:
+            trace.recorder.record(
+                TraceAction.KEY_PRESS,
+                timestamp,
+                device_id,
+                logical_index,
+                key,
+                self.layers_manager,
+            )
 
         # Track pressed keys to ensure correct release handling
         # (prevents stuck keys when layers change while a key is held)
         self.pressed_keys[key_pos] = key
 
-        # Layer keys may modify the active layer on press
-        if isinstance(key, KeysLayer):
-            key.on_press(self.layers_manager, self.keyboard, timestamp)
-            # Non-tap layer keys do not generate a normal key press
-            if not isinstance(key, LT) and not isinstance(key, TT):
-                return
+        # Capabilities are class-level KeyFlags, no type checks per press
+        flags = _key_flags(key)
 
-        # Dispatch press event for all regular and tap-enabled keys
+        # Dispatch press event, layer keys modify the active layer on press
         key.on_press(self.layers_manager, self.keyboard, timestamp)
 
+        # Non-tap layer keys do not generate a normal key press
+        if flags & KeyFlags.LAYER:
+            return
+
         # Register time-dependent keys after activation
-        if isinstance(key, TimedKeys):
+        if flags & KeyFlags.TIMED:
             self.timed_keys_manager.register(key)
 
         # Register sticky keys for deferred release handling
-        if isinstance(key, SK):
+        if flags & KeyFlags.STICKY:
             self.sticky_key_manager.register(key)
 
     else:
@@ -69,13 +108,28 @@ def process_key_event(
             if key is None:
                 return
 
-        print(f"{Ansi.YELLOW}{Ansi.BOLD}key: {key.key_name} released{Ansi.RESET}")
+        log.debug(LogCategory.KEYS, _MSG_RELEASED, key.key_name)
+        if trace.recorder:
+            trace.recorder.record(
+                TraceAction.KEY_RELEASE,
+                timestamp,
+                device_id,
+                logical_index,
+                key,
+                self.layers_manager,
+            )
 
         # Dispatch release event
         key.on_release(self.layers_manager, self.keyboard, timestamp)
 
+        flags = _key_flags(key)
+
+        # A release may restart or stop the timer of a time-dependent key
+        if flags & KeyFlags.TIMED:
+            self.timed_keys_manager.reschedule(key)
+
         # Clear active sticky keys unless the released key itself is sticky
-        if not isinstance(key, SK):
+        if not flags & KeyFlags.STICKY:
             self.sticky_key_manager.clear_stickies(self.keyboard, timestamp)
 
-    print()
+    log.debug(LogCategory.KEYS, "")
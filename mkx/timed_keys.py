@@ -1,10 +1,14 @@
 from adafruit_hid.keyboard import Keyboard
 
-from mkx.keys_abstract import KeysAbstract
+from mkx import trace
+from mkx.trace import TraceAction
+from mkx.keys_abstract import KeysAbstract, KeyFlags
 from mkx.manager_layers import LayersManager
 
 
 class TimedKeys:
+    flags = KeyFlags.TIMED
+
     def __init__(self):
         self._active = False
         self._pressed_time = None
@@ -17,23 +21,105 @@ class TimedKeys:
         self._active = False
         self._pressed_time = None
 
+    def deadline(self):
+        """
+        Time (ms) check_time has to run next, None if nothing is due until the
+        next press or release. The default 0 checks the key on every update.
+        """
+        return 0
+
     def check_time(
         self, layer_manager: LayersManager, keyboard: Keyboard, timestamp: int
     ):
-        """Called each frame while active."""
+        """Called once the deadline has passed while active."""
         raise NotImplementedError("Subclasses must implement check_time")
 
 
 class TimedKeysManager:
+    """
+    Fires check_time of the active timed keys in deadline order.
+    Timers are kept in a list sorted by (deadline, registration order),
+    so update() only looks at the timers that are due.
+    """
+
     def __init__(self):
         self._active_keys = set()
+        self._timers = []  # [deadline, seq, key], sorted
+        self._scheduled = {}  # key -> deadline of its valid timer entry
+        self._seq = 0
 
     def register(self, key: KeysAbstract):
-        if isinstance(key, TimedKeys):  # and key._active:
+        # Keys opt in by subclassing TimedKeys or by the KeyFlags.TIMED class flag
+        if isinstance(key, TimedKeys) or getattr(type(key), "flags", 0) & KeyFlags.TIMED:
             self._active_keys.add(key)
+            self._schedule(key)
+
+    def reschedule(self, key: KeysAbstract):
+        """Refresh the timer of a registered key after its release"""
+        if key not in self._active_keys:
+            return
+        if getattr(key, "_active", False):
+            self._schedule(key)
+        else:
+            self._remove(key)
+
+    def is_active(self) -> bool:
+        return bool(self._active_keys)
+
+    def next_deadline(self):
+        """Earliest pending deadline (ms), None if no timer is pending"""
+        timers = self._timers
+        while timers:
+            deadline, _, key = timers[0]
+            if self._scheduled.get(key) == deadline:
+                return deadline
+            timers.pop(0)  # Stale entry, the key was rescheduled or removed
+        return None
+
+    def _schedule(self, key):
+        deadline_fn = getattr(key, "deadline", None)
+        deadline = deadline_fn() if deadline_fn else 0
+
+        if deadline is None:
+            self._scheduled.pop(key, None)
+            return
+        if self._scheduled.get(key) == deadline:
+            return
+
+        self._scheduled[key] = deadline
+        self._seq += 1
+        entry = [deadline, self._seq, key]
+
+        timers = self._timers
+        i = len(timers)
+        while i and timers[i - 1][0] > deadline:
+            i -= 1
+        timers.insert(i, entry)
+
+    def _remove(self, key):
+        self._active_keys.discard(key)
+        self._scheduled.pop(key, None)
 
     def update(self, layer_manager: LayersManager, keyboard: Keyboard, timestamp: int):
-        for key in list(self._active_keys):
+        timers = self._timers
+        if not timers or timers[0][0] > timestamp:
+            return
+
+        # Take all due timers first, keys rescheduled while firing wait for the next update
+        due = []
+        while timers and timers[0][0] <= timestamp:
+            deadline, _, key = timers.pop(0)
+            if self._scheduled.get(key) == deadline:
+                del self._scheduled[key]
+                due.append(key)
+
+        for key in due:
+            if trace.recorder:
+                trace.recorder.record(
+                    TraceAction.TIMER_FIRE, timestamp, None, None, key, layer_manager
+                )
             key.check_time(layer_manager, keyboard, timestamp)
-            if not getattr(key, "_active", False):
-                self._active_keys.remove(key)
+            if getattr(key, "_active", False):
+                self._schedule(key)
+            else:
+                self._remove(key)
@@ -0,0 +1,157 @@
+"""
+In-RAM binary trace of key events, timers and layer changes.
+
+Records are written into a preallocated ring, so tracing does not allocate
+or print in the loop. Callers check `trace.recorder` first, a disabled trace
+costs one attribute read per call site.
+
+    from mkx import trace
+
+    trace.enable(256)   # in code.py
+    ...
+    trace.dump()        # from the REPL, decode with trace_decode.py on the host
+"""
+
+import binascii
+import struct
+import time
+
+# timestamp(u32) action(u8) device(u8) logical_index(u16) key(u16)
+# top_layer(u8) reserved(u8) layer_mask(u16)
+RECORD_FORMAT = "<IBBHHBBH"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+TRACE_SIZE = 256
+
+NONE = 0xFFFF  # No logical index or key
+
+
+class TraceAction:
+    KEY_PRESS = 1
+    KEY_RELEASE = 2
+    TIMER_FIRE = 3
+    LAYER_CHANGE = 4
+
+
+class TraceRecorder:
+    """
+    Fixed-size ring of RECORD_SIZE byte records, the oldest are overwritten.
+    Devices and keys are stored as small ids, their names are kept in tables
+    that are dumped together with the records.
+    """
+
+    def __init__(self, size=TRACE_SIZE):
+        self.size = size
+        self._buffer = bytearray(size * RECORD_SIZE)
+        self._head = 0  # Next record to write
+        self.count = 0  # Records written in total
+
+        self._devices = {}  # device_id -> id
+        self._keys = {}  # key object -> id
+        self.device_names = []
+        self.key_names = []
+
+    def _device(self, device_id) -> int:
+        if device_id is None:
+            return 0xFF
+        number = self._devices.get(device_id)
+        if number is None:
+            number = len(self.device_names) & 0xFF
+            self._devices[device_id] = number
+            self.device_names.append(str(device_id))
+        return number
+
+    def _key(self, key) -> int:
+        if key is None:
+            return NONE
+        number = self._keys.get(key)
+        if number is None:
+            number = len(self.key_names) & 0xFFFF
+            self._keys[key] = number
+            self.key_names.append(getattr(key, "key_name", type(key).__name__))
+        return number
+
+    def record(
+        self,
+        action: int,
+        timestamp=None,
+        device_id=None,
+        logical_index=None,
+        key=None,
+        layers_manager=None,
+    ):
+        if timestamp is None:
+            timestamp = time.monotonic_ns() // 1_000_000
+
+        top_layer = 0xFF
+        layer_mask = 0
+        if layers_manager is not None:
+            top_layer = layers_manager.get_top_layer() & 0xFF
+            for layer in layers_manager.active_layers:
+                layer_mask |= 1 << (layer & 0x0F)
+
+        struct.pack_into(
+            RECORD_FORMAT,
+            self._buffer,
+            self._head * RECORD_SIZE,
+            timestamp & 0xFFFFFFFF,
+            action,
+            self._device(device_id),
+            NONE if logical_index is None else logical_index & 0xFFFF,
+            self._key(key),
+            top_layer,
+            0,
+            layer_mask,
+        )
+
+        self._head = (self._head + 1) % self.size
+        self.count += 1
+
+    def records(self):
+        """Yield the stored records as tuples, oldest first"""
+        stored = min(self.count, self.size)
+        start = (self._head - stored) % self.size
+        for i in range(stored):
+            offset = ((start + i) % self.size) * RECORD_SIZE
+            yield struct.unpack_from(RECORD_FORMAT, self._buffer, offset)
+
+    def clear(self):
+        self._head = 0
+        self.count = 0
+
+    def dump(self):
+        """Print the trace as text for trace_decode.py"""
+        stored = min(self.count, self.size)
+        print(f"MKXTRACE 1 {RECORD_FORMAT} {stored} {self.count - stored}")
+        for number, name in enumerate(self.device_names):
+            print(f"D {number} {name}")
+        for number, name in enumerate(self.key_names):
+            print(f"K {number} {name}")
+
+        start = (self._head - stored) % self.size
+        for i in range(stored):
+            offset = ((start + i) % self.size) * RECORD_SIZE
+            record = self._buffer[offset : offset + RECORD_SIZE]
+            print("R " + binascii.hexlify(record).decode())
+        print("MKXTRACE END")
+
+
+recorder = None
+
+
+def enable(size=TRACE_SIZE) -> TraceRecorder:
+    """Start tracing into a new ring of size records"""
+    global recorder
+    recorder = TraceRecorder(size)
+    return recorder
+
+
+def disable():
+    global recorder
+    recorder = None
+
+
+def dump():
+    if recorder is None:
+        print("Trace is not enabled, call trace.enable() first")
+        return
+    recorder.dump()
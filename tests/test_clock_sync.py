@@ -0,0 +1,150 @@
+"""
+Unit tests for ClockSync.
+Tests offset, drift and jitter estimation between split halves.
+"""
+
+from unittest.mock import patch
+
+from mkx.clock_sync import ClockSync
+from mkx.communication_message import KeyEventEncoder, MessageParser
+
+
+def at_ms(now_ms):
+    """Patch the monotonic clock of communication_message to now_ms"""
+    return patch(
+        "mkx.communication_message.time.monotonic_ns",
+        return_value=now_ms * 1_000_000,
+    )
+
+
+class TestClockSync:
+    """Test suite for ClockSync"""
+
+    def test_unknown_device_not_corrected(self):
+        """Test timestamps of unseen devices pass unchanged"""
+        clock_sync = ClockSync()
+
+        assert clock_sync.correct("right", 1234) == 1234
+        assert clock_sync.estimate("right") is None
+
+    def test_offset_is_minimum_delta(self):
+        """Test the offset follows the smallest observed delta"""
+        clock_sync = ClockSync()
+
+        # remote clock 500 ms behind, transit 3, 1 and 7 ms
+        clock_sync.observe("right", 1000, 1503)
+        clock_sync.observe("right", 1010, 1511)
+        clock_sync.observe("right", 1020, 1527)
+
+        assert clock_sync.estimate("right")["offset_ms"] == 501
+        assert clock_sync.correct("right", 1030) == 1531
+
+    def test_offset_stable_under_transit_jitter(self):
+        """Test a slow message does not move the timeline"""
+        clock_sync = ClockSync()
+
+        clock_sync.observe("right", 1000, 1501)
+        clock_sync.observe("right", 1005, 1530)
+
+        assert clock_sync.correct("right", 1005) == 1506
+        assert clock_sync.estimate("right")["jitter_ms"] > 0
+
+    def test_drift_estimated_from_block_minima(self):
+        """Test drift follows the change of the windowed minima"""
+        clock_sync = ClockSync(window_ms=1000)
+
+        # offset grows by 1 ms per second (1000 ppm)
+        for second in range(4):
+            local = 10_000 + second * 1000
+            clock_sync.observe("right", local - 500 - second, local)
+
+        assert round(clock_sync.estimate("right")["drift_ppm"]) == 1000
+
+    def test_sync_orders_devices_on_local_timeline(self):
+        """Test messages of both halves are ordered by corrected time"""
+        clock_sync = ClockSync()
+        clock_sync.observe("left", 5000, 5000)
+        clock_sync.observe("right", 1000, 5000)
+
+        messages = [
+            {"timestamp": 5004, "device_id": "left", "type": "key_event"},
+            {"timestamp": 1002, "device_id": "right", "type": "key_event"},
+        ]
+
+        result = clock_sync.sync(messages)
+
+        assert [m["device_id"] for m in result] == ["right", "left"]
+        assert result[0]["timestamp"] == 5002
+
+    def test_remote_clock_going_back_restarts_estimate(self):
+        """Test a periphery reboot (remote time going backwards) resyncs"""
+        clock_sync = ClockSync()
+        clock_sync.observe("right", 100_000, 100_500)
+        clock_sync.observe("right", 100_010, 100_511)
+
+        # Rebooted, the remote clock starts over near zero
+        clock_sync.observe("right", 50, 100_600)
+
+        assert clock_sync.resyncs == 1
+        assert clock_sync.estimate("right")["samples"] == 1
+        assert clock_sync.correct("right", 60) == 100_610
+
+    def test_large_delta_jump_restarts_estimate(self):
+        """Test a delta far above the offset is taken as a restarted clock"""
+        clock_sync = ClockSync(resync_ms=1000)
+        clock_sync.observe("right", 10_000, 10_500)
+        clock_sync.observe("right", 10_010, 11_200)  # Slow message, no resync
+        assert clock_sync.resyncs == 0
+
+        clock_sync.observe("right", 10_020, 15_000)
+
+        assert clock_sync.resyncs == 1
+        assert clock_sync.estimate("right")["offset_ms"] == 4980
+
+    def test_anchored_messages_not_corrected(self):
+        """Test binary key events already on the local timeline pass unchanged"""
+        clock_sync = ClockSync()
+        messages = [
+            {"timestamp": 1000, "device_id": "right", "type": "status"},
+            {
+                "timestamp": 5003,
+                "device_id": "right",
+                "type": "key_event",
+                "anchored": True,
+            },
+        ]
+
+        clock_sync.observe_messages(messages, 5005)
+        result = clock_sync.sync(messages)
+
+        assert clock_sync.estimate("right")["samples"] == 1
+        assert [m["timestamp"] for m in result] == [5003, 5005]
+
+    def test_binary_event_ordered_across_transit_delay(self):
+        """Test a remote press sent before a local one is dispatched first"""
+        encoder = KeyEventEncoder("right")
+        parser = MessageParser(baudrate=9600)
+        parser.register_device("right")
+
+        # Sent at 1000, the 7 byte frame takes 7 ms at 9600 baud
+        with at_ms(1000):
+            frame = bytes(encoder.encode(4, 1, True))
+        with at_ms(1008):
+            (remote,) = parser.parse(frame)
+
+        local = {
+            "timestamp": 1003,
+            "device_id": "left",
+            "type": "key_event",
+            "data": (0, 0, True),
+            "anchored": True,
+        }
+        messages = [local, remote]
+
+        clock_sync = ClockSync()
+        clock_sync.observe_messages(messages, 1008)
+        result = clock_sync.sync(messages)
+
+        assert parser.transfer_ms(7) == 7
+        assert [m["device_id"] for m in result] == ["right", "left"]
+        assert result[0]["timestamp"] == 1001
@@ -3,10 +3,15 @@ Unit tests for Communication Message functionality.
 Tests message parsing, encoding, and synchronization.
 """
 
+from unittest.mock import patch
+
 from mkx.communication_message import (
     MessageParser,
+    KeyEventEncoder,
+    KEY_EVENT_FRAME_SIZE,
+    crc16,
+    device_number,
     encode_message,
-    sync_messages,
     debounce,
 )
 
@@ -48,6 +53,183 @@ class TestMessageParser:
         assert len(parser.buffer) == 3
 
 
+class TestMessageParserRingBuffer:
+    """Test suite for the MessageParser ring buffer"""
+
+    def _frames(self, count):
+        encoder = KeyEventEncoder("right")
+        data = b""
+        for i in range(count):
+            with patch(
+                "mkx.communication_message.time.monotonic_ns",
+                return_value=(1000 + i) * 1_000_000,
+            ):
+                data += bytes(encoder.encode(i % 8, 0, i % 2 == 0))
+        return data
+
+    def _parser(self, **kwargs):
+        parser = MessageParser(**kwargs)
+        parser.register_device("right")
+        return parser
+
+    def test_ring_buffer_preallocated(self):
+        """Test the ring buffer size follows max_message_size"""
+        parser = MessageParser(max_message_size=64)
+
+        assert parser.buffer_size == 2 * (64 + 6)
+        assert len(parser._ring) == parser.buffer_size
+
+    def test_ring_buffer_split_frames(self):
+        """Test frames split across parse calls are reassembled"""
+        parser = self._parser()
+        data = self._frames(3)
+
+        messages = []
+        for i in range(len(data)):
+            messages += parser.parse(data[i : i + 1])
+
+        assert len(messages) == 3
+        assert parser.buffer == b""
+
+    def test_ring_buffer_wraps_around(self):
+        """Test frames crossing the end of the ring are parsed"""
+        parser = self._parser(buffer_size=10)
+        data = self._frames(5)
+
+        messages = []
+        for i in range(0, len(data), 4):
+            messages += parser.parse(data[i : i + 4])
+
+        assert [m["data"][0] for m in messages] == [0, 1, 2, 3, 4]
+
+    def test_ring_buffer_burst_larger_than_buffer(self):
+        """Test a burst larger than the ring is parsed in pieces"""
+        parser = self._parser(buffer_size=16)
+
+        messages = parser.parse(self._frames(20))
+
+        assert len(messages) == 20
+        assert parser.frames_dropped == 0
+
+    def test_ring_buffer_garbage_before_frame(self):
+        """Test garbage bytes are skipped before a valid frame"""
+        parser = self._parser()
+
+        messages = parser.parse(b"\x00\x01\x02" + self._frames(1))
+
+        assert len(messages) == 1
+
+    def test_ring_buffer_oversized_length_rejected(self):
+        """Test frames longer than max_message_size are not awaited"""
+        parser = self._parser(max_message_size=16)
+
+        messages = parser.parse(b"\xb2\x00\x40" + self._frames(1))
+
+        assert len(messages) == 1
+
+    def test_ring_buffer_overflow_drops_whole_frame(self):
+        """Test an incomplete frame filling the ring is dropped as a whole"""
+        parser = self._parser(max_message_size=32, buffer_size=8)
+
+        # ASCII frame announcing 20 bytes, more than the ring can hold
+        messages = parser.parse(b"\xb2\x00\x14" + b"x" * 20 + self._frames(1))
+
+        assert parser.frames_dropped == 1
+        assert len(messages) == 1
+
+
+class TestCrcFrames:
+    """Test suite for CRC-16 frames and link statistics"""
+
+    def _encode(self, encoder, now_ms, col, row, pressed):
+        with patch(
+            "mkx.communication_message.time.monotonic_ns",
+            return_value=now_ms * 1_000_000,
+        ):
+            return bytes(encoder.encode(col, row, pressed))
+
+    def _parser(self):
+        parser = MessageParser()
+        parser.register_device("right")
+        return parser
+
+    def test_crc16_check_value(self):
+        """Test CRC-16/CCITT-FALSE standard check value"""
+        assert crc16(b"123456789") == 0x29B1
+
+    def test_crc16_detects_swapped_bytes(self):
+        """Test swapped bytes change the CRC but not the plain sum"""
+        assert sum(b"\x01\x02") == sum(b"\x02\x01")
+        assert crc16(b"\x01\x02") != crc16(b"\x02\x01")
+
+    def test_crc_key_event_round_trip(self):
+        """Test CRC key event frames are parsed"""
+        encoder = KeyEventEncoder("right", crc=True)
+        parser = self._parser()
+
+        frame = self._encode(encoder, 1000, 4, 2, True)
+        messages = parser.parse(frame)
+
+        assert len(frame) == KEY_EVENT_FRAME_SIZE + 1
+        assert messages[0]["data"] == [4, 2, True]
+        assert parser.frames_ok == 1
+
+    def test_crc_ascii_round_trip(self):
+        """Test CRC ASCII frames are parsed"""
+        parser = self._parser()
+
+        with patch(
+            "mkx.communication_message.time.monotonic_ns",
+            return_value=1000 * 1_000_000,
+        ):
+            data = encode_message("right", "status", {"battery": 80}, crc=True)
+
+        messages = parser.parse(data)
+
+        assert messages[0]["timestamp"] == 1000
+        assert messages[0]["data"] == ["80"]
+
+    def test_crc_rejects_swapped_bytes(self):
+        """Test a frame with swapped event bytes fails the CRC"""
+        encoder = KeyEventEncoder("right", crc=True)
+        parser = self._parser()
+
+        frame = bytearray(self._encode(encoder, 1000, 4, 2, True))
+        frame[4], frame[5] = frame[5], frame[4]
+
+        assert parser.parse(bytes(frame)) == []
+        assert parser.checksum_failures == 1
+
+    def test_stats_resync_skips_to_next_header(self):
+        """Test garbage is skipped in one resync and counted"""
+        encoder = KeyEventEncoder("right", crc=True)
+        parser = self._parser()
+
+        frame = self._encode(encoder, 900, 1, 1, True)
+
+        with patch(
+            "mkx.communication_message.time.monotonic_ns",
+            side_effect=[1000 * 1_000_000, 1003 * 1_000_000, 1003 * 1_000_000],
+        ):
+            messages = parser.parse(b"\x01\x02\x03\x04" + frame)
+
+        stats = parser.stats()
+        assert len(messages) == 1
+        assert stats["bytes_skipped"] == 4
+        assert stats["resyncs"] == 1
+        assert stats["resync_time_ms"] == 3
+
+    def test_stats_reset(self):
+        """Test reset_stats clears the counters"""
+        parser = self._parser()
+        parser.parse(b"\x01\x02\x03")
+
+        parser.reset_stats()
+
+        assert parser.bytes_skipped == 0
+        assert parser.frames_ok == 0
+
+
 class TestEncodeMessage:
     """Test suite for encode_message function"""
 
@@ -91,71 +273,107 @@ class TestEncodeMessage:
         assert encoded[0] == 0xB2
 
 
-class TestSyncMessages:
-    """Test suite for sync_messages function"""
+class TestBinaryKeyEvent:
+    """Test suite for the binary key event frames"""
 
-    def test_sync_messages_single_message(self):
-        """Test syncing single message"""
-        message = {
-            "timestamp": 1000,
-            "device_id": "device1",
-            "type": "key_event",
-            "data": [],
-        }
+    def _encode(self, encoder, now_ms, col, row, pressed):
+        with patch(
+            "mkx.communication_message.time.monotonic_ns",
+            return_value=now_ms * 1_000_000,
+        ):
+            return bytes(encoder.encode(col, row, pressed))
 
-        result = sync_messages([message], 2000)
+    def test_device_number_is_stable(self):
+        """Test device_number is deterministic and fits in a byte"""
+        assert device_number("booster_l") == device_number("booster_l")
+        assert device_number("booster_l") != device_number("booster_r")
+        assert 0 <= device_number("booster_r") <= 0xFF
 
-        assert len(result) == 1
-        assert result[0]["device_id"] == "device1"
+    def test_encode_key_event_size(self):
+        """Test a key event fits in a 7 byte frame"""
+        encoder = KeyEventEncoder("right")
 
-    def test_sync_messages_multiple_devices(self):
-        """Test syncing messages from multiple devices"""
-        messages = [
-            {
-                "timestamp": 1000,
-                "device_id": "device1",
-                "type": "key_event",
-                "data": [],
-            },
-            {
-                "timestamp": 1100,
-                "device_id": "device2",
-                "type": "key_event",
-                "data": [],
-            },
-        ]
+        frame = self._encode(encoder, 1000, 3, 2, True)
 
-        result = sync_messages(messages, 2000)
+        assert len(frame) == KEY_EVENT_FRAME_SIZE
+        assert frame[0] == 0xB2
+        assert frame[1] == 0x80
 
-        assert len(result) == 2
+    def test_binary_round_trip(self):
+        """Test encoded key events are parsed back with delta timestamps"""
+        encoder = KeyEventEncoder("right")
+        parser = MessageParser()
+        parser.register_device("right")
+
+        data = self._encode(encoder, 1000, 5, 3, True)
+        data += self._encode(encoder, 1012, 5, 3, False)
+
+        with patch(
+            "mkx.communication_message.time.monotonic_ns",
+            return_value=5000 * 1_000_000,
+        ):
+            messages = parser.parse(data)
+
+        assert len(messages) == 2
+        assert messages[0]["device_id"] == "right"
+        assert messages[0]["type"] == "key_event"
+        assert messages[0]["data"] == [5, 3, True]
+        assert messages[1]["data"] == [5, 3, False]
+        assert messages[1]["timestamp"] - messages[0]["timestamp"] == 12
+
+    def test_binary_unregistered_device_dropped(self):
+        """Test frames from unknown devices are dropped"""
+        encoder = KeyEventEncoder("right")
+        parser = MessageParser()
+
+        messages = parser.parse(self._encode(encoder, 1000, 0, 0, True))
+
+        assert messages == []
+        assert parser.buffer == b""
 
-    def test_sync_messages_sorted_by_timestamp(self):
-        """Test that synced messages are sorted by timestamp"""
+    def test_binary_corrupted_frame_skipped(self):
+        """Test corrupted binary frames are not delivered"""
+        encoder = KeyEventEncoder("right")
+        parser = MessageParser()
+        parser.register_device("right")
+
+        frame = bytearray(self._encode(encoder, 1000, 1, 1, True))
+        frame[5] ^= 0x01
+
+        assert parser.parse(bytes(frame)) == []
+
+    def test_mixed_ascii_and_binary(self):
+        """Test ASCII and binary frames can share one stream"""
+        encoder = KeyEventEncoder("right")
+        parser = MessageParser()
+        parser.register_device("right")
+
+        with patch(
+            "mkx.communication_message.time.monotonic_ns",
+            return_value=900 * 1_000_000,
+        ):
+            data = encode_message("right", "status", {"battery": 80})
+        data += self._encode(encoder, 1000, 2, 0, True)
+
+        messages = parser.parse(data)
+
+        assert [m["type"] for m in messages] == ["status", "key_event"]
+
+    def test_debounce_binary_data(self):
+        """Test debounce accepts binary (int, bool) key event data"""
         messages = [
-            {
-                "timestamp": 2000,
-                "device_id": "device1",
-                "type": "key_event",
-                "data": [],
-            },
             {
                 "timestamp": 1000,
-                "device_id": "device1",
+                "device_id": "right",
                 "type": "key_event",
-                "data": [],
-            },
+                "data": [2, 1, True],
+            }
         ]
 
-        result = sync_messages(messages, 3000)
-
-        # Should be sorted by adjusted timestamp
-        assert result[0]["timestamp"] <= result[1]["timestamp"]
-
-    def test_sync_messages_empty_list(self):
-        """Test syncing empty message list"""
-        result = sync_messages([], 1000)
+        result = debounce(messages)
 
-        assert result == []
+        assert result[0]["pressed"] is True
+        assert result[0]["col"] == 2
 
 
 class TestDebounce:
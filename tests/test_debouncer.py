@@ -0,0 +1,172 @@
+"""
+Unit tests for the persistent Debouncer.
+Tests eager, deferred and eager-press debouncing and per-key debounce times.
+"""
+
+import pytest
+
+from mkx.debouncer import Debouncer, DebounceMode
+
+
+class TestDebouncerEager:
+    """Test suite for DebounceMode.EAGER"""
+
+    def test_eager_reports_first_edge(self):
+        """Test a clean press is reported at once"""
+        debouncer = Debouncer(4, debounce_ms=5)
+
+        assert debouncer.process(2, True, 1000) is True
+        assert debouncer.state[2] == 1
+
+    def test_eager_filters_chatter_across_frames(self):
+        """Test chatter is filtered even when split over several calls"""
+        debouncer = Debouncer(4, debounce_ms=5)
+
+        assert debouncer.process(0, True, 1000) is True
+        # Next frame: bounce inside the debounce window
+        assert debouncer.process(0, False, 1002) is False
+        assert debouncer.process(0, True, 1003) is False
+
+        assert debouncer.poll(1010, []) == []
+        assert debouncer.state[0] == 1
+
+    def test_eager_reports_final_state_after_window(self):
+        """Test a release inside the window is not lost"""
+        debouncer = Debouncer(4, debounce_ms=5)
+
+        debouncer.process(1, True, 1000)
+        assert debouncer.process(1, False, 1002) is False
+
+        assert debouncer.poll(1003, []) == []
+        assert debouncer.poll(1005, []) == [(1, False, 1005)]
+        assert debouncer.state[1] == 0
+
+    def test_eager_ignores_release_of_unpressed_key(self):
+        """Test a release without press is dropped"""
+        debouncer = Debouncer(4, debounce_ms=5)
+
+        assert debouncer.process(3, False, 1000) is False
+
+
+class TestDebouncerDeferred:
+    """Test suite for DebounceMode.DEFERRED"""
+
+    def test_deferred_waits_for_stable_state(self):
+        """Test an edge is reported only once stable"""
+        debouncer = Debouncer(4, debounce_ms=5, mode=DebounceMode.DEFERRED)
+
+        assert debouncer.process(0, True, 1000) is False
+        assert debouncer.poll(1004, []) == []
+        assert debouncer.poll(1005, []) == [(0, True, 1000)]
+
+    def test_deferred_filters_spike(self):
+        """Test a short noise spike is never reported"""
+        debouncer = Debouncer(4, debounce_ms=5, mode=DebounceMode.DEFERRED)
+
+        debouncer.process(0, True, 1000)
+        debouncer.process(0, False, 1001)
+
+        assert debouncer.poll(1010, []) == []
+        assert debouncer.is_pending() is False
+
+    def test_deferred_restarts_window_on_bounce(self):
+        """Test each bounce restarts the stability window"""
+        debouncer = Debouncer(4, debounce_ms=5, mode=DebounceMode.DEFERRED)
+
+        debouncer.process(0, True, 1000)
+        debouncer.process(0, False, 1002)
+        debouncer.process(0, True, 1004)
+
+        assert debouncer.poll(1006, []) == []
+        assert debouncer.poll(1009, []) == [(0, True, 1004)]
+
+
+def test_invalid_debounce_mode():
+    """Test that invalid mode raises error"""
+    with pytest.raises(ValueError):
+        Debouncer(4, mode="INVALID")
+
+
+class TestDebouncerEagerPress:
+    """Test suite for DebounceMode.EAGER_PRESS"""
+
+    def test_press_reported_at_once(self):
+        """Test a press is reported without delay"""
+        debouncer = Debouncer(4, debounce_ms=5, mode=DebounceMode.EAGER_PRESS)
+
+        assert debouncer.process(0, True, 1000) is True
+        assert debouncer.is_pending() is False
+
+    def test_release_waits_for_stable_state(self):
+        """Test a release is reported once stable, with the time of the edge"""
+        debouncer = Debouncer(4, debounce_ms=5, mode=DebounceMode.EAGER_PRESS)
+
+        debouncer.process(0, True, 1000)
+        assert debouncer.process(0, False, 1020) is False
+        assert debouncer.poll(1024, []) == []
+        assert debouncer.poll(1025, []) == [(0, False, 1020)]
+
+    def test_release_chatter_filtered(self):
+        """Test bounces while releasing give one release and no extra press"""
+        debouncer = Debouncer(4, debounce_ms=5, mode=DebounceMode.EAGER_PRESS)
+
+        debouncer.process(0, True, 1000)
+        debouncer.process(0, False, 1020)
+        assert debouncer.process(0, True, 1021) is False
+        debouncer.process(0, False, 1022)
+
+        assert debouncer.poll(1026, []) == []
+        assert debouncer.poll(1027, []) == [(0, False, 1022)]
+        assert debouncer.state[0] == 0
+
+
+class TestDebouncerPerKey:
+    """Test suite for per-key debounce times"""
+
+    def test_key_debounce_time(self):
+        """Test a worn key gets a longer window than the others"""
+        debouncer = Debouncer(4, debounce_ms=5, mode=DebounceMode.DEFERRED)
+        debouncer.set_key_debounce(1, 20)
+
+        debouncer.process(0, True, 1000)
+        debouncer.process(1, True, 1000)
+
+        assert debouncer.poll(1005, []) == [(0, True, 1000)]
+        assert debouncer.poll(1019, []) == []
+        assert debouncer.poll(1020, []) == [(1, True, 1000)]
+
+    def test_next_deadline(self):
+        """Test the earliest closing window is the next deadline"""
+        debouncer = Debouncer(4, debounce_ms=5, mode=DebounceMode.DEFERRED)
+        debouncer.set_key_debounce(2, 20)
+
+        assert debouncer.next_deadline(1000) is None
+        debouncer.process(2, True, 1000)
+        debouncer.process(3, True, 1002)
+        assert debouncer.next_deadline(1003) == 1007
+        assert debouncer.next_deadline(1009) == 1009  # Overdue, due now
+
+    def test_next_deadline_across_time_mask(self):
+        """Test the deadline follows the caller's clock past the 32 bit mask"""
+        debouncer = Debouncer(2, debounce_ms=5, mode=DebounceMode.DEFERRED)
+        now = (1 << 32) + 1000
+
+        debouncer.process(0, True, now)
+
+        assert debouncer.next_deadline(now + 1) == now + 5
+
+    @pytest.mark.parametrize(
+        "mode, cost",
+        [
+            (DebounceMode.EAGER, (0, 0)),
+            (DebounceMode.DEFERRED, (12, 12)),
+            (DebounceMode.EAGER_PRESS, (0, 12)),
+        ],
+    )
+    def test_latency_cost(self, mode, cost):
+        """Test the added latency follows the mode and the longest key time"""
+        debouncer = Debouncer(4, debounce_ms=5, mode=mode)
+        debouncer.set_key_debounce(3, 12)
+
+        assert debouncer.latency_cost() == cost
+        assert "release +%d ms" % cost[1] in debouncer.describe()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the EventScheduler.
+Tests immediate release, cross-half ordering and latency statistics.
+"""
+
+from mkx.event_scheduler import EventScheduler
+
+
+class TestEventScheduler:
+    """Test suite for EventScheduler"""
+
+    def test_single_device_released_at_once(self):
+        """Test events are not held when there is no other half"""
+        scheduler = EventScheduler(local_device_id="left")
+        scheduler.advance("left", 1000)
+        scheduler.push((1000, "left", 3, True), 1000)
+
+        assert scheduler.release(1000, []) == [(1000, "left", 3, True)]
+        assert scheduler.stats()["held_events"] == 0
+
+    def test_remote_event_released_at_once(self):
+        """Test a remote event is not held for the synchronous local half"""
+        scheduler = EventScheduler(local_device_id="left")
+        scheduler.advance("left", 990)
+        scheduler.advance("right", 1000)
+        scheduler.push((1000, "right", 7, True), 1000)
+
+        assert scheduler.release(1000, []) == [(1000, "right", 7, True)]
+
+    def test_local_event_waits_for_quiet_remote(self):
+        """Test a local event is held until the remote half can no longer precede it"""
+        scheduler = EventScheduler(local_device_id="left", reorder_ms=3)
+        scheduler.advance("right", 990)
+        scheduler.advance("left", 1000)
+        scheduler.push((1000, "left", 1, True), 1000)
+
+        assert scheduler.release(1001, []) == []
+        assert scheduler.next_release() == 1003
+        assert scheduler.release(1003, []) == [(1000, "left", 1, True)]
+
+        stats = scheduler.stats()
+        assert stats["held_events"] == 1
+        assert stats["latency_max_ms"] == 3
+
+    def test_late_remote_event_is_ordered_first(self):
+        """Test an earlier remote event overtakes a held local event"""
+        scheduler = EventScheduler(local_device_id="left", reorder_ms=3)
+        scheduler.advance("right", 990)
+        scheduler.push((1000, "left", 1, True), 1000)
+
+        scheduler.advance("right", 999)
+        scheduler.push((999, "right", 8, True), 1001)
+        scheduler.advance("right", 1001)
+
+        result = scheduler.release(1001, [])
+
+        assert [e[1] for e in result] == ["right", "left"]
+        assert scheduler.is_pending() is False
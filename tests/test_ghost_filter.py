@@ -0,0 +1,66 @@
+"""
+Unit tests for ghost key detection.
+Tests rectangle detection in the row masks and the FLAG / SUPPRESS modes.
+"""
+
+import pytest
+
+from mkx.ghost_filter import GhostFilter, GhostMode, ghost_masks
+
+
+class TestGhostMasks:
+    """Test suite for ghost_masks"""
+
+    def test_no_ghost_single_keys(self):
+        """Test single keys per line never form a rectangle"""
+        assert ghost_masks([0b01, 0b10, 0b01]) is None
+
+    def test_no_ghost_one_multi_line(self):
+        """Test several keys on one drive line are not ambiguous"""
+        assert ghost_masks([0b1111, 0b0001, 0b0010]) is None
+
+    def test_two_lines_share_one_bit(self):
+        """Test lines with only one shared bit are not a rectangle"""
+        assert ghost_masks([0b0011, 0b0110]) is None
+
+    def test_rectangle(self):
+        """Test two lines sharing two bits flag the four corners"""
+        assert ghost_masks([0b0101, 0, 0b1101]) == [0b0101, 0, 0b0101]
+
+
+class TestGhostFilter:
+    """Test suite for GhostFilter"""
+
+    def test_flag_passes_masks(self):
+        """Test FLAG mode keeps the masks and counts the pattern"""
+        ghost_filter = GhostFilter(GhostMode.FLAG)
+
+        masks = ghost_filter.filter([0b11, 0b11], [0b11, 0b01])
+
+        assert masks == [0b11, 0b11]
+        assert ghost_filter.count == 1
+
+    def test_suppress_keeps_previous_state(self):
+        """Test SUPPRESS mode withholds the ambiguous press"""
+        ghost_filter = GhostFilter(GhostMode.SUPPRESS)
+
+        masks = ghost_filter.filter([0b111, 0b011], [0b011, 0b001])
+
+        assert masks == [0b111, 0b001]
+
+    def test_count_once_per_pattern(self):
+        """Test a lasting pattern is counted once, a new one again"""
+        ghost_filter = GhostFilter()
+
+        ghost_filter.filter([0b11, 0b11], [0b11, 0b01])
+        ghost_filter.filter([0b11, 0b11], [0b11, 0b01])
+        assert ghost_filter.count == 1
+
+        ghost_filter.filter([0b11, 0], [0b11, 0b01])
+        ghost_filter.filter([0b11, 0b11], [0b11, 0])
+        assert ghost_filter.count == 2
+
+    def test_invalid_mode(self):
+        """Test that invalid mode raises error"""
+        with pytest.raises(ValueError):
+            GhostFilter("INVALID")
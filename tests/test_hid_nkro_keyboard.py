@@ -0,0 +1,109 @@
+"""
+Unit tests for KeyboardNKRO.
+Tests the bitmap report and the NKRO device detection.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from mkx.hid_nkro_keyboard import KeyboardNKRO, find_nkro_device, REPORT_LENGTH
+from tests.conftest import MockKeycode
+
+LEFT_SHIFT = 0xE1  # HID usage, the mocked Keycode does not use the real modifier codes
+
+
+def make_device(report_length):
+    def send_report(report, report_id=None):
+        if len(report) != report_length:
+            raise ValueError(f"Buffer incorrect size. Should be {report_length} bytes.")
+        reports.append(bytes(report))
+
+    reports = []
+    device = SimpleNamespace(usage_page=0x01, usage=0x06, send_report=send_report)
+    device.reports = reports
+    return device
+
+
+class TestKeyboardNKRO:
+    """Test suite for KeyboardNKRO"""
+
+    def test_keys_set_bitmap_bits(self):
+        """Test any number of keys is held in the bitmap"""
+        device = make_device(REPORT_LENGTH)
+        keyboard = KeyboardNKRO(device)
+
+        keys = [MockKeycode.A, MockKeycode.B, MockKeycode.C, MockKeycode.D]
+        keys += [MockKeycode.E, MockKeycode.F, MockKeycode.G]
+        keyboard.press(*keys)
+
+        report = device.reports[-1]
+        assert len(device.reports) == 1
+        assert report[1 + (MockKeycode.A >> 3)] & (1 << (MockKeycode.A & 7))
+        assert sum(bin(b).count("1") for b in report) == 7
+
+    def test_modifiers_in_first_byte(self):
+        """Test modifier keycodes set the modifier byte"""
+        device = make_device(REPORT_LENGTH)
+        keyboard = KeyboardNKRO(device)
+
+        keyboard.press(LEFT_SHIFT)
+        assert device.reports[-1][0] == 0x02
+
+        keyboard.release(LEFT_SHIFT)
+        assert device.reports[-1] == bytes(REPORT_LENGTH)
+
+    def test_unchanged_report_not_sent(self):
+        """Test a press of an already held key sends nothing"""
+        device = make_device(REPORT_LENGTH)
+        keyboard = KeyboardNKRO(device)
+
+        keyboard.press(MockKeycode.A)
+        keyboard.press(MockKeycode.A)
+        keyboard.release(MockKeycode.B)
+        keyboard.press(None)
+
+        assert len(device.reports) == 1
+
+
+class TestFindNKRODevice:
+    """Test suite for find_nkro_device"""
+
+    def test_finds_nkro_keyboard(self):
+        """Test the keyboard taking the 16 byte report is selected"""
+        boot_keyboard = make_device(8)
+        mouse = SimpleNamespace(usage_page=0x01, usage=0x02, send_report=MagicMock())
+        nkro = make_device(REPORT_LENGTH)
+
+        assert find_nkro_device([mouse, boot_keyboard, nkro]) is nkro
+        mouse.send_report.assert_not_called()
+
+    def test_no_nkro_keyboard(self):
+        """Test None with only the boot keyboard"""
+        assert find_nkro_device([make_device(8)]) is None
+
+    def test_retries_before_enumeration(self):
+        """Test an OSError (USB not enumerated yet) is retried after a sleep"""
+        nkro = make_device(REPORT_LENGTH)
+        nkro.send_report = MagicMock(side_effect=[OSError(5, "USB busy"), None])
+
+        with patch("mkx.hid_nkro_keyboard.time.sleep") as sleep:
+            assert find_nkro_device([nkro]) is nkro
+
+        sleep.assert_called_once_with(1)
+        assert nkro.send_report.call_count == 2
+
+    def test_retry_still_checks_length(self):
+        """Test the boot keyboard is still rejected after a retried send"""
+        boot_keyboard = make_device(8)
+        send_report = boot_keyboard.send_report
+        errors = [OSError(5, "USB busy")]
+
+        def not_enumerated(report):
+            if errors:
+                raise errors.pop()
+            send_report(report)
+
+        boot_keyboard.send_report = not_enumerated
+
+        with patch("mkx.hid_nkro_keyboard.time.sleep"):
+            assert find_nkro_device([boot_keyboard]) is None
@@ -0,0 +1,122 @@
+"""
+Unit tests for KeyboardBatcher.
+Tests that key changes of one pass are coalesced and order-sensitive ones are kept.
+"""
+
+from mkx.hid_report_batcher import KeyboardBatcher
+from mkx.keys_standard import KeysStandard
+from mkx.keys_sequence import SEQ
+from mkx.keys_modifiers import MOD
+from tests.conftest import MockKeycode
+
+LEFT_SHIFT = 0xE1  # HID usage, the mocked Keycode does not use the real modifier codes
+
+
+class FakeKeyboard:
+    """Sends one report per press/release call like adafruit_hid Keyboard"""
+
+    def __init__(self):
+        self.held = set()
+        self.reports = []
+
+    def press(self, *keycodes):
+        self.held.update(keycodes)
+        self.reports.append(frozenset(self.held))
+
+    def release(self, *keycodes):
+        self.held.difference_update(keycodes)
+        self.reports.append(frozenset(self.held))
+
+    def release_all(self):
+        self.held.clear()
+        self.reports.append(frozenset())
+
+
+class FakeKeyboardNKRO(FakeKeyboard):
+    def update(self, pressed, released):
+        self.held.difference_update(released)
+        self.held.update(pressed)
+        self.reports.append(frozenset(self.held))
+
+
+class TestKeyboardBatcher:
+    """Test suite for KeyboardBatcher"""
+
+    def test_chord_sends_one_report(self):
+        """Test a chord pressed in one pass is one report"""
+        keyboard = FakeKeyboard()
+        batcher = KeyboardBatcher(keyboard)
+
+        for keycode in (MockKeycode.A, MockKeycode.S, MockKeycode.D, MockKeycode.F):
+            batcher.press(keycode)
+        assert keyboard.reports == []
+
+        batcher.flush()
+        assert keyboard.reports == [
+            {MockKeycode.A, MockKeycode.S, MockKeycode.D, MockKeycode.F}
+        ]
+
+    def test_update_used_when_available(self):
+        """Test releases and presses go out in a single NKRO report"""
+        keyboard = FakeKeyboardNKRO()
+        batcher = KeyboardBatcher(keyboard)
+        batcher.press(MockKeycode.A)
+        batcher.flush()
+
+        batcher.release(MockKeycode.A)
+        batcher.press(MockKeycode.B)
+        batcher.flush()
+
+        assert keyboard.reports == [{MockKeycode.A}, {MockKeycode.B}]
+
+    def test_seq_taps_reach_host(self):
+        """Test SEQ taps, also of the same key, are each seen by the host"""
+        keyboard = FakeKeyboard()
+        batcher = KeyboardBatcher(keyboard)
+        key_a = KeysStandard(MockKeycode.A, "A")
+        key_b = KeysStandard(MockKeycode.B, "B")
+
+        SEQ([key_a, key_a, key_b]).on_press(None, batcher, 0)
+        batcher.flush()
+
+        presses = [r for r in keyboard.reports if r]
+        assert presses == [{MockKeycode.A}, {MockKeycode.A}, {MockKeycode.B}]
+        assert keyboard.reports[-1] == set()
+
+    def test_mod_pressed_with_key(self):
+        """Test MOD sends modifier and key together and keeps them on release"""
+        keyboard = FakeKeyboard()
+        batcher = KeyboardBatcher(keyboard)
+        shift = KeysStandard(LEFT_SHIFT, "LSFT")
+        mod = MOD(shift, KeysStandard(MockKeycode.A, "A"), "M_LSFT(A)")
+
+        mod.on_press(None, batcher, 0)
+        batcher.flush()
+        assert keyboard.held == {LEFT_SHIFT, MockKeycode.A}
+
+        mod.on_release(None, batcher, 0)
+        batcher.flush()
+        assert keyboard.held == set()
+
+    def test_modifier_change_after_pending_key(self):
+        """Test a modifier change does not apply to a key pressed before it"""
+        keyboard = FakeKeyboard()
+        batcher = KeyboardBatcher(keyboard)
+
+        batcher.press(MockKeycode.A)
+        batcher.press(LEFT_SHIFT)
+        batcher.flush()
+
+        assert keyboard.reports[0] == {MockKeycode.A}
+        assert keyboard.held == {MockKeycode.A, LEFT_SHIFT}
+
+    def test_nothing_sent_without_changes(self):
+        """Test flush without changes and a release of an unheld key send nothing"""
+        keyboard = FakeKeyboard()
+        batcher = KeyboardBatcher(keyboard)
+
+        batcher.release(MockKeycode.A)
+        batcher.flush()
+
+        assert keyboard.reports == []
+        assert batcher.reports == 0
@@ -0,0 +1,103 @@
+"""
+Unit tests for the lazy key namespace.
+Tests on-demand creation, shared aliases and the transparent marker.
+"""
+
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from mkx import kc as kc_module
+from mkx import keys_media, keys_mouse, keys_standard
+from mkx.keys_standard_core import KeysStandard, TRANSPARENT
+from mkx.keys_media_core import KeysMedia
+from mkx.keys_mouse_core import KeysMouse
+from tests.conftest import MockKeycode
+
+
+@pytest.fixture
+def kc():
+    return importlib.reload(kc_module)
+
+
+class TestKeyNamespace:
+    """Test suite for the kc namespace"""
+
+    def test_keys_created_on_access(self, kc):
+        """Test nothing is created until a key is used"""
+        assert kc.created == 0
+        assert "A" not in vars(kc)
+
+        key = kc.A
+
+        assert isinstance(key, KeysStandard)
+        assert key.key_code == MockKeycode.A
+        assert kc.created == 1
+
+    def test_aliases_share_one_object(self, kc):
+        """Test all aliases resolve to the same key object"""
+        enter = kc.ENT
+
+        assert kc.ENTER is enter
+        assert kc.RETURN is enter
+        assert kc.created == 1
+
+    def test_transparent_is_layer_marker(self, kc):
+        """Test TRNS is the marker the keymap compiler looks for"""
+        assert kc.TRNS is TRANSPARENT
+        assert kc._______ is TRANSPARENT
+        assert kc.created == 0
+
+    def test_media_and_mouse_keys(self, kc):
+        """Test media and mouse keys are built from their tables"""
+        assert isinstance(kc.VOLU, KeysMedia)
+        assert isinstance(kc.MB_LC, KeysMouse)
+        assert kc.MB_LC.mouse_action == "click"
+        assert kc.MB_SU.direction() == (0, 0, 1)
+
+    def test_unknown_key(self, kc):
+        """Test an unknown name raises AttributeError"""
+        with pytest.raises(AttributeError):
+            kc.NOT_A_KEY
+
+
+@pytest.fixture
+def eager():
+    """Eager key modules rebuilt on the HID mocks kc imports from"""
+    return SimpleNamespace(
+        standard=importlib.reload(keys_standard),
+        media=importlib.reload(keys_media),
+        mouse=importlib.reload(keys_mouse),
+    )
+
+
+class TestTablesMatchEagerKeys:
+    """Test the kc tables against the eager key modules, so the copies cannot drift"""
+
+    def test_standard_keys(self, kc, eager):
+        """Test every keys_standard name resolves to a key with the same keycode"""
+        for name in eager.standard.__all__:
+            expected = getattr(eager.standard, name)
+            if isinstance(expected, type):
+                continue  # The KeysStandard class itself
+            key = getattr(kc, name)
+            assert isinstance(key, KeysStandard), name
+            assert key.key_code == expected.key_code, name
+
+    def test_media_keys(self, kc, eager):
+        """Test every keys_media name resolves to a key with the same code"""
+        for name in eager.media.__all__:
+            key = getattr(kc, name)
+            assert isinstance(key, KeysMedia), name
+            assert key.media_code == getattr(eager.media, name).media_code, name
+
+    def test_mouse_keys(self, kc, eager):
+        """Test every keys_mouse name resolves to a key with the same action"""
+        for name in eager.mouse.__all__:
+            expected = getattr(eager.mouse, name)
+            key = getattr(kc, name)
+            assert isinstance(key, KeysMouse), name
+            assert key.mouse_action == expected.mouse_action, name
+            assert key.args == expected.args, name
+            assert key.direction() == expected.direction(), name
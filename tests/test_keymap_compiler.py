@@ -0,0 +1,67 @@
+"""
+Unit tests for the KeymapCompiler.
+Tests resolved tables, transparency and cache invalidation by LayersManager.
+"""
+
+from mkx.keymap_compiler import KeymapCompiler
+from mkx.keys_standard import KeysStandard, TRNS
+from mkx.manager_layers import LayersManager
+from tests.conftest import MockKeycode
+
+
+key_a = KeysStandard(MockKeycode.A, "A")
+key_b = KeysStandard(MockKeycode.B, "B")
+key_c = KeysStandard(MockKeycode.C, "C")
+key_d = KeysStandard(MockKeycode.D, "D")
+
+KEYMAP = [
+    [key_a, key_b, key_c],
+    [key_d, TRNS, TRNS],
+    [TRNS, key_a, TRNS],
+]
+
+
+class TestKeymapCompiler:
+    """Test suite for KeymapCompiler"""
+
+    def test_top_layer_wins(self):
+        """Test non-transparent keys of the top layer are used"""
+        compiler = KeymapCompiler(KEYMAP)
+
+        assert compiler.compile([0, 1]) == [key_d, key_b, key_c]
+
+    def test_transparency_falls_through_layers(self):
+        """Test transparent keys resolve to the next active layer below"""
+        compiler = KeymapCompiler(KEYMAP)
+
+        assert compiler.compile([0, 1, 2]) == [key_d, key_a, key_c]
+
+    def test_transparent_bottom_layer_stays_transparent(self):
+        """Test nothing is resolved below the bottom layer"""
+        compiler = KeymapCompiler(KEYMAP)
+
+        assert compiler.compile([2]) == [TRNS, key_a, TRNS]
+
+    def test_tables_cached_per_stack(self):
+        """Test a stack is compiled once"""
+        compiler = KeymapCompiler(KEYMAP)
+
+        assert compiler.compile([0, 2]) is compiler.compile((0, 2))
+        assert compiler.compile([0, 2]) is not compiler.compile([0, 1])
+
+    def test_get_key_follows_layers_manager(self):
+        """Test the current table is refreshed on layer changes"""
+        compiler = KeymapCompiler(KEYMAP)
+        manager = LayersManager(default_layer=0)
+
+        assert compiler.get_key(manager, 0) is key_a
+
+        manager.activate_layer(1)
+        assert compiler.get_key(manager, 0) is key_d
+        assert compiler.get_key(manager, 1) is key_b
+
+        manager.replace_top_layer(2)
+        assert compiler.get_key(manager, 0) is key_a
+
+        manager.deactivate_layer(2)
+        assert compiler.get_key(manager, 1) is key_b
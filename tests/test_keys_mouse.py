@@ -3,8 +3,28 @@ Unit tests for Mouse key functionality.
 Tests mouse click, press, and movement operations.
 """
 
+import pytest
 from unittest.mock import MagicMock
+
+from mkx import mouse_motion
+from mkx.mouse_motion import MouseMotion, curve_step
 from mkx.keys_mouse import KeysMouse, LMB, RMB, MMB, BMB, FMB
+from mkx.timed_keys import TimedKeysManager
+
+
+@pytest.fixture
+def motion():
+    motion = MouseMotion(
+        interval_ms=10,
+        scroll_interval_ms=50,
+        move_curve=((0, 2), (100, 2), (200, 6)),
+        scroll_curve=((0, 1),),
+    )
+    motion.mouse = MagicMock()
+    saved = mouse_motion.motion
+    mouse_motion.motion = motion
+    yield motion
+    mouse_motion.motion = saved
 
 
 class TestKeysMouse:
@@ -84,14 +104,15 @@ class TestKeysMouse:
 
         mouse.mouse.release.assert_called_once_with(1)
 
-    def test_keys_mouse_on_press_move(self, mock_keyboard, layer_manager):
-        """Test KeysMouse on_press with move action"""
+    def test_keys_mouse_on_press_move(self, mock_keyboard, layer_manager, motion):
+        """Test KeysMouse on_press with move action sends a step with the frame"""
         mouse = KeysMouse("MOVE_RIGHT", "move", 10, 0, 0)
-        mouse.mouse = MagicMock()
 
         mouse.on_press(layer_manager, mock_keyboard, 0)
+        motion.mouse.move.assert_not_called()
 
-        mouse.mouse.move.assert_called_once()
+        motion.flush()
+        motion.mouse.move.assert_called_once_with(20, 0, 0)
 
     def test_keys_mouse_on_release_press_action(self, mock_keyboard, layer_manager):
         """Test KeysMouse on_release with press action (releases the button)"""
@@ -149,3 +170,65 @@ class TestKeysMouse:
 
         mouse.release(layer_manager, mock_keyboard, 100)
         assert mouse._is_pressed is False
+
+
+class TestMouseMotion:
+    """Test suite for the mouse motion engine"""
+
+    def test_curve_interpolation(self):
+        """Test the step follows the curve points"""
+        curve = ((0, 2), (100, 2), (200, 6))
+
+        assert curve_step(curve, 50) == 2
+        assert curve_step(curve, 150) == 4
+        assert curve_step(curve, 5000) == 6
+
+    def test_held_keys_accelerate(self, motion, layer_manager, mock_keyboard):
+        """Test a held move key repeats with growing steps via the timers"""
+        manager = TimedKeysManager()
+        key = KeysMouse("MOVE_RIGHT", "move", 1, 0)
+        key.on_press(layer_manager, mock_keyboard, 0)
+        manager.register(key)
+        motion.flush()
+
+        steps = []
+        for now in range(10, 210, 10):
+            manager.update(layer_manager, mock_keyboard, now)
+            motion.flush()
+            steps.append(motion.mouse.move.call_args.args[0])
+
+        assert steps[0] == 2
+        assert steps[-1] == 6
+        assert manager.next_deadline() == 210
+
+        key.on_release(layer_manager, mock_keyboard, 210)
+        manager.reschedule(key)
+        assert manager.next_deadline() is None
+
+    def test_keys_combined_in_one_report(self, motion, layer_manager, mock_keyboard):
+        """Test diagonal movement and scroll go out as one report per frame"""
+        keys = [
+            KeysMouse("MOVE_RIGHT", "move", 1, 0),
+            KeysMouse("MOVE_DOWN", "move", 0, 1),
+            KeysMouse("SCROLL_UP", "move", 0, 0, 1),
+        ]
+        for key in keys:
+            key.on_press(layer_manager, mock_keyboard, 0)
+        motion.flush()
+
+        motion.mouse.move.assert_called_once_with(2, 2, 1)
+
+        motion.tick(10)
+        motion.flush()
+        motion.mouse.move.assert_called_with(2, 2, 0)  # Scroll steps every 50 ms
+
+    def test_click_keys_not_scheduled(self, motion, layer_manager, mock_keyboard):
+        """Test click keys do not get a timer"""
+        manager = TimedKeysManager()
+        LMB.mouse = MagicMock()
+
+        LMB.on_press(layer_manager, mock_keyboard, 0)
+        manager.register(LMB)
+
+        assert manager.next_deadline() is None
+        LMB.mouse = None
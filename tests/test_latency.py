@@ -0,0 +1,79 @@
+"""
+Unit tests for the latency stats.
+Tests stage statistics, percentiles and the periodic summary.
+"""
+
+from unittest.mock import patch
+
+from mkx import latency
+from mkx.latency import LatencyStats, Stage
+from mkx.keys_latency import LATENCY_RESET
+
+
+class TestLatencyStats:
+    """Test suite for LatencyStats"""
+
+    def test_min_avg_max(self):
+        """Test min, avg and max of a stage"""
+        stats = LatencyStats()
+        for duration in (10, 20, 60):
+            stats.add(Stage.SCAN, duration)
+
+        summary = stats.summary()
+        assert summary["scan"] == {
+            "count": 3,
+            "min_us": 10,
+            "avg_us": 30,
+            "max_us": 60,
+            "p99_us": 60,
+        }
+        assert "dispatch" not in summary
+
+    def test_p99_bucket_bound(self):
+        """Test p99 is the upper bound of its power-of-two bucket"""
+        stats = LatencyStats()
+        for _ in range(99):
+            stats.add(Stage.DISPATCH, 100)  # bucket below 128 us
+        stats.add(Stage.DISPATCH, 5000)
+
+        assert stats.percentile(Stage.DISPATCH, 99) == 128
+        assert stats.percentile(Stage.DISPATCH, 100) == 5000
+
+    def test_lap_returns_now(self):
+        """Test lap times from start and returns the next start"""
+        stats = LatencyStats()
+
+        with patch("mkx.latency.time.monotonic_ns", return_value=2_500_000):
+            now = stats.lap(Stage.TIMERS, 2_000_000)
+
+        assert now == 2_500_000
+        assert stats.summary()["timers"]["max_us"] == 500
+
+    def test_periodic_report_resets(self):
+        """Test the summary is printed and reset every report_ms"""
+        stats = LatencyStats(report_ms=1000)
+        stats.add(Stage.SCAN, 10)
+
+        with patch("builtins.print") as mock_print:
+            stats.report(5000)
+            stats.report(5999)
+            mock_print.assert_not_called()
+
+            stats.report(6000)
+            assert mock_print.called
+
+        assert stats.summary() == {}
+
+    def test_key_prints_and_resets(self):
+        """Test LATENCY_RESET prints the summary and starts a new one"""
+        stats = latency.enable()
+        try:
+            stats.add(Stage.BACKLIGHT, 10)
+
+            with patch("builtins.print") as mock_print:
+                LATENCY_RESET.on_press(None, None, 0)
+
+            assert mock_print.called
+            assert stats.summary() == {}
+        finally:
+            latency.disable()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the mkx log module.
+Tests level and category filtering and stripping of log calls by build.py.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from mkx import log
+from mkx.log import LogLevel, LogCategory
+
+
+@pytest.fixture(autouse=True)
+def restore_log_settings():
+    yield
+    log.set_level(LogLevel.INFO)
+    log.set_categories(LogCategory.ALL)
+
+
+class TestLog:
+    """Test suite for log levels and categories"""
+
+    def test_level_filters_messages(self):
+        """Test messages below the level are not printed"""
+        log.set_level(LogLevel.WARNING)
+
+        with patch("builtins.print") as mock_print:
+            log.debug(LogCategory.KEYS, "key: %s", "A")
+            log.info(LogCategory.KEYS, "key: %s", "A")
+            log.warning(LogCategory.KEYS, "key: %s", "A")
+
+        mock_print.assert_called_once_with("key: A")
+
+    def test_category_filters_messages(self):
+        """Test messages of disabled categories are not printed"""
+        log.set_level(LogLevel.DEBUG)
+        log.set_categories(LogCategory.COMM)
+
+        with patch("builtins.print") as mock_print:
+            log.debug(LogCategory.KEYS, "key")
+            log.debug(LogCategory.COMM, "comm")
+
+        mock_print.assert_called_once_with("comm")
+
+    def test_disabled_message_not_formatted(self):
+        """Test arguments are not formatted while disabled"""
+        log.set_level(LogLevel.OFF)
+
+        # Would raise TypeError if formatted
+        log.error(LogCategory.ALL, "%d", "not a number")
+
+    def test_enabled(self):
+        """Test enabled reports level and category"""
+        log.set_level(LogLevel.INFO)
+        log.set_categories(LogCategory.KEYS)
+
+        assert log.enabled(LogLevel.INFO, LogCategory.KEYS) is True
+        assert log.enabled(LogLevel.DEBUG, LogCategory.KEYS) is False
+        assert log.enabled(LogLevel.ERROR, LogCategory.TOUCH) is False
+
+
+class TestStripLogCalls:
+    """Test suite for build.strip_log_calls"""
+
+    SOURCE = (
+        "def f(x):\n"
+        "    log.debug(\n"
+        "        LogCategory.KEYS, 'x: %s', x\n"
+        "    )\n"
+        "    if x:\n"
+        "        log.info(LogCategory.KEYS, 'x')  # comment\n"
+        "    log.warning(LogCategory.KEYS, 'warn')\n"
+        "    return x\n"
+    )
+
+    def test_strip_below_level(self):
+        """Test calls below the level become pass and line numbers are kept"""
+        from build import strip_log_calls
+
+        result = strip_log_calls(self.SOURCE, "warning")
+
+        assert "log.debug" not in result
+        assert "log.info" not in result
+        assert "log.warning" in result
+        assert result.count("\n") == self.SOURCE.count("\n")
+        compile(result, "stripped", "exec")
+
+    def test_strip_keeps_enabled_levels(self):
+        """Test nothing is removed at the debug level"""
+        from build import strip_log_calls
+
+        assert strip_log_calls(self.SOURCE, "debug") == self.SOURCE
@@ -0,0 +1,79 @@
+"""
+Unit tests for LoopGovernor.
+Tests the full rate while busy, the idle backoff and the timer bound.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from mkx.loop_governor import LoopGovernor
+from mkx.mkx_periphery import MKX_Periphery
+
+
+class TestLoopGovernor:
+    """Test suite for LoopGovernor"""
+
+    def test_full_rate_while_busy(self):
+        """Test no sleep while keys are held or timers pending"""
+        governor = LoopGovernor(idle_after_ms=100, max_sleep_ms=8)
+
+        for now in range(0, 1000, 50):
+            assert governor.sleep_time(now, busy=True) == 0
+
+    def test_backoff_when_idle(self):
+        """Test the sleep doubles after idle_after_ms up to max_sleep_ms"""
+        governor = LoopGovernor(idle_after_ms=100, max_sleep_ms=8)
+        governor.sleep_time(0, busy=True)
+
+        assert governor.sleep_time(50, busy=False) == 0
+        sleeps = [governor.sleep_time(100 + i, busy=False) for i in range(6)]
+
+        assert sleeps == [1, 2, 4, 8, 8, 8]
+
+    def test_activity_restores_full_rate(self):
+        """Test activity drops the sleep back to active_sleep_ms"""
+        governor = LoopGovernor(active_sleep_ms=1, idle_after_ms=0, max_sleep_ms=8)
+        governor.sleep_time(0, busy=False)
+        governor.sleep_time(1, busy=False)
+        governor.sleep_time(2, busy=False)
+
+        assert governor.sleep_time(3, busy=True) == 1
+
+    def test_sleep_bounded_by_deadline(self):
+        """Test the sleep never passes the next timer deadline"""
+        governor = LoopGovernor(idle_after_ms=0, max_sleep_ms=8)
+        for now in range(5):
+            governor.sleep_time(now, busy=False)
+
+        assert governor.sleep_time(10, busy=False, deadline=13) == 3
+        assert governor.sleep_time(10, busy=False, deadline=5) == 0
+
+    def test_wake_pins_extend_idle_sleep(self):
+        """Test wake pins allow idle sleeps up to wake_sleep_ms"""
+        governor = LoopGovernor(
+            idle_after_ms=0, max_sleep_ms=8, wake_pins=["D5"], wake_sleep_ms=32
+        )
+        sleeps = [governor.sleep_time(now, busy=False) for now in range(8)]
+
+        assert max(sleeps) == 32
+
+
+class TestPeripheryGovernor:
+    """Test suite for the governor in MKX_Periphery"""
+
+    def test_held_key_keeps_full_rate(self):
+        """Test a held key keeps the periphery busy until released"""
+        events = [[(0, 0, True)], [], [(0, 0, False)], []]
+        periphery = SimpleNamespace(
+            get_key_events=lambda: events.pop(0), send=MagicMock()
+        )
+        mkx = MKX_Periphery(periphery)
+        mkx.use_loop_governor(True, idle_after_ms=0)
+        mkx.loop_governor.sleep = MagicMock()
+
+        with patch("mkx.mkx_periphery.time.monotonic_ns", return_value=0):
+            for _ in range(4):
+                mkx.run_once()
+
+        busy = [call.args[1] for call in mkx.loop_governor.sleep.call_args_list]
+        assert busy == [True, True, True, False]
@@ -0,0 +1,96 @@
+"""
+Unit tests for MacroPlayer.
+Tests that SEQ macros are played over several passes, with delays and cancellation.
+"""
+
+import pytest
+
+from mkx import macro_player
+from mkx.macro_player import MacroPlayer
+from mkx.keys_sequence import SEQ, MACRO_CANCEL
+from mkx.keys_standard import KeysStandard
+from tests.conftest import MockKeycode
+
+
+@pytest.fixture
+def player():
+    macro_player.player = MacroPlayer(steps_per_frame=2)
+    yield macro_player.player
+    macro_player.player = None
+
+
+@pytest.fixture
+def keys():
+    return [KeysStandard(MockKeycode.A, "A"), KeysStandard(MockKeycode.B, "B")]
+
+
+class TestMacroPlayer:
+    """Test suite for MacroPlayer"""
+
+    def test_seq_queued_not_played(self, player, keys, mock_keyboard, layer_manager):
+        """Test SEQ only queues its taps while a player is set"""
+        SEQ(keys).on_press(layer_manager, mock_keyboard, 0)
+
+        assert player.is_pending()
+        assert mock_keyboard.press_count == 0
+
+    def test_steps_per_frame(self, player, keys, mock_keyboard, layer_manager):
+        """Test one tap (press and release) is played per pass of two steps"""
+        SEQ(keys).on_press(layer_manager, mock_keyboard, 0)
+
+        player.update(layer_manager, mock_keyboard, 0)
+        assert mock_keyboard.released_keys == [MockKeycode.A]
+
+        player.update(layer_manager, mock_keyboard, 1)
+        assert mock_keyboard.released_keys == [MockKeycode.A, MockKeycode.B]
+        assert not player.is_pending()
+
+    def test_nested_seq_expanded_in_order(
+        self, player, keys, mock_keyboard, layer_manager
+    ):
+        """Test a nested SEQ plays in place, before the keys after it"""
+        key_c = KeysStandard(MockKeycode.C, "C")
+        SEQ([SEQ(keys), key_c]).on_press(layer_manager, mock_keyboard, 0)
+
+        for now in range(3):
+            player.update(layer_manager, mock_keyboard, now)
+
+        assert mock_keyboard.released_keys == [
+            MockKeycode.A,
+            MockKeycode.B,
+            MockKeycode.C,
+        ]
+
+    def test_delay_between_taps(self, player, keys, mock_keyboard, layer_manager):
+        """Test delay_ms holds the next tap back"""
+        SEQ(keys, delay_ms=10).on_press(layer_manager, mock_keyboard, 0)
+
+        player.update(layer_manager, mock_keyboard, 0)
+        player.update(layer_manager, mock_keyboard, 5)
+        assert mock_keyboard.released_keys == [MockKeycode.A]
+        assert player.next_time == 10
+
+        player.update(layer_manager, mock_keyboard, 10)
+        assert mock_keyboard.released_keys == [MockKeycode.A, MockKeycode.B]
+
+    def test_cancel_releases_held_keys(
+        self, player, keys, mock_keyboard, layer_manager
+    ):
+        """Test MACRO_CANCEL drops the queue and releases a held key"""
+        player.steps_per_frame = 1
+        SEQ(keys).on_press(layer_manager, mock_keyboard, 0)
+        player.update(layer_manager, mock_keyboard, 0)
+        assert mock_keyboard.pressed_keys == [MockKeycode.A]
+
+        MACRO_CANCEL.on_press(layer_manager, mock_keyboard, 1)
+
+        assert mock_keyboard.pressed_keys == []
+        assert not player.is_pending()
+
+    def test_full_queue_drops_macro(self, keys, mock_keyboard, layer_manager):
+        """Test a macro longer than max_steps is dropped"""
+        player = MacroPlayer(max_steps=3)
+
+        player.play(keys)
+
+        assert not player.is_pending()
@@ -200,3 +200,14 @@ class TestLayersManager:
         manager.deactivate_layer(1)
         assert 1 not in manager.active_layers
         assert manager.get_top_layer() == 3
+
+    def test_layer_changes_bump_version(self):
+        """Test every change of the layer stack bumps the version"""
+        manager = LayersManager(default_layer=0)
+        version = manager.version
+
+        manager.activate_layer(1)
+        manager.replace_top_layer(2)
+
+        assert manager.active_layers == [0, 2]
+        assert manager.version == version + 2
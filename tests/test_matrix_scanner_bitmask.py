@@ -0,0 +1,186 @@
+"""
+Unit tests for the bit-packed matrix scanner backend.
+Tests row mask diffing and event generation against MatrixScanner.
+"""
+
+import pytest
+from mkx.diode_orientation import DiodeOrientation
+from mkx.ghost_filter import GhostFilter, GhostMode
+from mkx.matrix_scanner import MatrixScanner
+from mkx.matrix_scanner_bitmask import MatrixScannerBitmask
+
+# Import the mock digitalio (already set up by conftest.py)
+import digitalio
+
+
+class FakeMatrix:
+    """Switch matrix, a sense pin reads the drive level while its switch is closed"""
+
+    def __init__(self, n_drive, n_sense, pull_up=False):
+        self.idle = pull_up
+        self.closed = set()  # (drive index, sense index)
+        self.drive = [FakePin(self, i, True) for i in range(n_drive)]
+        self.sense = [FakePin(self, i, False) for i in range(n_sense)]
+
+    def sense_value(self, sense_idx):
+        for pin in self.drive:
+            if pin.value != self.idle and (pin.idx, sense_idx) in self.closed:
+                return pin.value
+        return self.idle
+
+
+class FakePin:
+    def __init__(self, matrix, idx, drive):
+        self.matrix = matrix
+        self.idx = idx
+        self.drive = drive
+        self._value = matrix.idle
+
+    def switch_to_output(self):
+        pass
+
+    def switch_to_input(self, pull=None):
+        pass
+
+    @property
+    def value(self):
+        if self.drive:
+            return self._value
+        return self.matrix.sense_value(self.idx)
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+    def __repr__(self):
+        return f"FakePin({self.drive}, {self.idx})"
+
+
+def make_scanner(cls, n_cols, n_rows, orientation, pull, **kwargs):
+    pull_up = pull is digitalio.Pull.UP
+    drive_are_cols = (orientation == DiodeOrientation.COL2ROW) != pull_up
+    if drive_are_cols:
+        matrix = FakeMatrix(n_cols, n_rows, pull_up)
+        cols, rows = matrix.drive, matrix.sense
+    else:
+        matrix = FakeMatrix(n_rows, n_cols, pull_up)
+        cols, rows = matrix.sense, matrix.drive
+    scanner = cls(cols, rows, orientation, pull, warmup_cycles=0, **kwargs)
+    return matrix, scanner
+
+
+class TestMatrixScannerBitmask:
+    """Test suite for MatrixScannerBitmask"""
+
+    def test_idle_scan_has_no_events(self):
+        """Test an idle matrix keeps all row masks clear"""
+        _, scanner = make_scanner(
+            MatrixScannerBitmask, 3, 2, DiodeOrientation.COL2ROW, digitalio.Pull.DOWN
+        )
+
+        assert scanner.get_key_events() == []
+        assert scanner.row_masks == [0, 0, 0]
+
+    def test_press_and_release(self):
+        """Test a closed switch sets its bit once and reports press then release"""
+        matrix, scanner = make_scanner(
+            MatrixScannerBitmask, 3, 2, DiodeOrientation.COL2ROW, digitalio.Pull.DOWN
+        )
+
+        matrix.closed.add((2, 1))
+        assert scanner.get_key_events() == [(2, 1, True)]
+        assert scanner.row_masks == [0, 0, 0b10]
+        assert scanner.get_key_events() == []
+
+        matrix.closed.clear()
+        assert scanner.get_key_events() == [(2, 1, False)]
+        assert scanner.row_masks == [0, 0, 0]
+
+    def test_several_bits_in_one_row(self):
+        """Test every changed bit of a drive line becomes an event"""
+        matrix, scanner = make_scanner(
+            MatrixScannerBitmask, 2, 4, DiodeOrientation.COL2ROW, digitalio.Pull.DOWN
+        )
+
+        matrix.closed.update({(1, 0), (1, 3)})
+        assert scanner.get_key_events() == [(1, 0, True), (1, 3, True)]
+
+        matrix.closed.discard((1, 0))
+        matrix.closed.add((1, 2))
+        assert scanner.get_key_events() == [(1, 0, False), (1, 2, True)]
+
+    @pytest.mark.parametrize(
+        "orientation", [DiodeOrientation.COL2ROW, DiodeOrientation.ROW2COL]
+    )
+    def test_same_events_as_matrix_scanner(self, orientation):
+        """Test the events match MatrixScanner for both diode orientations"""
+        presses = [{(0, 1)}, {(0, 1), (1, 0)}, {(1, 0)}, set(), {(1, 1), (0, 0)}]
+
+        results = []
+        for cls in (MatrixScanner, MatrixScannerBitmask):
+            matrix, scanner = make_scanner(cls, 2, 2, orientation, digitalio.Pull.DOWN)
+            events = []
+            for closed in presses:
+                matrix.closed = closed
+                events.append(scanner.get_key_events())
+            results.append(events)
+
+        assert results[0] == results[1]
+        assert any(results[1])
+
+    @pytest.mark.parametrize(
+        "orientation", [DiodeOrientation.COL2ROW, DiodeOrientation.ROW2COL]
+    )
+    @pytest.mark.parametrize("pull", [digitalio.Pull.DOWN, digitalio.Pull.UP])
+    def test_col_row_mapping(self, orientation, pull):
+        """Test events carry the column and row of the switch for every wiring"""
+        matrix, scanner = make_scanner(MatrixScannerBitmask, 3, 2, orientation, pull)
+        drive_are_cols = len(scanner.drive_pins) == 3
+
+        matrix.closed.add((2, 1) if drive_are_cols else (1, 2))
+        assert scanner.get_key_events() == [(2, 1, True)]
+
+    def test_read_mask(self):
+        """Test read_mask packs the pressed sense pins of the driven line"""
+        matrix, scanner = make_scanner(
+            MatrixScannerBitmask, 3, 2, DiodeOrientation.COL2ROW, digitalio.Pull.UP
+        )
+
+        matrix.closed.update({(0, 0), (0, 2)})
+        scanner.drive_pins[0].value = scanner.output_active
+        assert scanner.read_mask() == 0b101
+        scanner.drive_pins[0].value = not scanner.output_active
+        assert scanner.read_mask() == 0
+
+    def test_ghost_suppressed(self):
+        """Test the fourth corner of a rectangle is held back until it resolves"""
+        matrix, scanner = make_scanner(
+            MatrixScannerBitmask,
+            3,
+            3,
+            DiodeOrientation.COL2ROW,
+            digitalio.Pull.DOWN,
+            ghost=GhostMode.SUPPRESS,
+        )
+
+        matrix.closed.update({(0, 0), (0, 1), (1, 0)})
+        assert scanner.get_key_events() == [(0, 0, True), (0, 1, True), (1, 0, True)]
+
+        # A missing diode makes (1, 1) read as pressed as well
+        matrix.closed.add((1, 1))
+        assert scanner.get_key_events() == []
+        assert scanner.ghost_filter.count == 1
+
+        matrix.closed.discard((0, 0))
+        assert scanner.get_key_events() == [(0, 0, False), (1, 1, True)]
+
+    def test_ghost_flagged(self):
+        """Test FLAG mode reports the rectangle keys and counts it"""
+        matrix, scanner = make_scanner(
+            MatrixScannerBitmask, 2, 2, DiodeOrientation.COL2ROW, digitalio.Pull.DOWN
+        )
+        scanner.ghost_filter = GhostFilter(GhostMode.FLAG)
+
+        matrix.closed.update({(0, 0), (0, 1), (1, 0), (1, 1)})
+        assert len(scanner.get_key_events()) == 4
+        assert scanner.ghost_filter.count == 1
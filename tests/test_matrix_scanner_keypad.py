@@ -0,0 +1,163 @@
+"""
+Unit tests for the keypad.KeyMatrix scanner backend.
+Tests event translation and PeripheryAbstract backend selection.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+import digitalio
+
+from mkx.diode_orientation import DiodeOrientation
+
+
+class FakeEventQueue:
+    """Minimal stand-in for keypad.EventQueue"""
+
+    def __init__(self):
+        self.pending = []
+        self.overflowed = False
+
+    def get_into(self, event):
+        if not self.pending:
+            return False
+        event.key_number, event.pressed = self.pending.pop(0)
+        return True
+
+    def clear(self):
+        self.pending.clear()
+        self.overflowed = False
+
+
+class FakeKeyMatrix:
+    """Minimal stand-in for keypad.KeyMatrix"""
+
+    def __init__(self, row_pins, column_pins, **kwargs):
+        self.row_pins = row_pins
+        self.column_pins = column_pins
+        self.kwargs = kwargs
+        self.events = FakeEventQueue()
+        self.reset_count = 0
+
+    def reset(self):
+        self.reset_count += 1
+
+
+@pytest.fixture
+def keypad_scanner():
+    from mkx.matrix_scanner_keypad import MatrixScannerKeypad
+
+    cols = [MagicMock() for _ in range(3)]
+    rows = [MagicMock() for _ in range(2)]
+
+    with patch("mkx.matrix_scanner_keypad.keypad.KeyMatrix", FakeKeyMatrix):
+        scanner = MatrixScannerKeypad(
+            cols=cols,
+            rows=rows,
+            diode_orientation=DiodeOrientation.COL2ROW,
+            pull=digitalio.Pull.DOWN,
+            warmup_cycles=0,
+        )
+
+    return scanner
+
+
+class TestMatrixScannerKeypad:
+    """Test suite for MatrixScannerKeypad"""
+
+    def test_keypad_scanner_initialization(self, keypad_scanner):
+        """Test KeyMatrix is built from the column and row pins"""
+        assert keypad_scanner.len_cols == 3
+        assert keypad_scanner.len_rows == 2
+        assert keypad_scanner.key_matrix.kwargs["columns_to_anodes"] is True
+
+    def test_keypad_scanner_row2col(self):
+        """Test ROW2COL maps to columns_to_anodes=False"""
+        from mkx.matrix_scanner_keypad import MatrixScannerKeypad
+
+        with patch("mkx.matrix_scanner_keypad.keypad.KeyMatrix", FakeKeyMatrix):
+            scanner = MatrixScannerKeypad(
+                cols=[MagicMock()],
+                rows=[MagicMock()],
+                diode_orientation=DiodeOrientation.ROW2COL,
+                warmup_cycles=0,
+            )
+
+        assert scanner.key_matrix.kwargs["columns_to_anodes"] is False
+
+    def test_keypad_scanner_invalid_orientation(self):
+        """Test that invalid diode orientation raises error"""
+        from mkx.matrix_scanner_keypad import MatrixScannerKeypad
+
+        with pytest.raises(ValueError):
+            MatrixScannerKeypad(
+                cols=[MagicMock()],
+                rows=[MagicMock()],
+                diode_orientation="INVALID",
+                warmup_cycles=0,
+            )
+
+    def test_keypad_scanner_no_events(self, keypad_scanner):
+        """Test empty queue gives no events"""
+        assert keypad_scanner.get_key_events() == []
+
+    def test_keypad_scanner_event_contract(self, keypad_scanner):
+        """Test key numbers are translated to (col, row, pressed)"""
+        keypad_scanner.key_matrix.events.pending = [(0, True), (4, True), (4, False)]
+
+        events = keypad_scanner.get_key_events()
+
+        assert events == [(0, 0, True), (1, 1, True), (1, 1, False)]
+
+    def test_keypad_scanner_out_of_bounds(self, keypad_scanner):
+        """Test out of bounds key numbers are ignored"""
+        keypad_scanner.key_matrix.events.pending = [(6, True)]
+
+        assert keypad_scanner.get_key_events() == []
+
+    def test_keypad_scanner_overflow_resets(self, keypad_scanner):
+        """Test overflowed queue is cleared and the matrix reset"""
+        keypad_scanner.key_matrix.events.pending = [(1, True)]
+        keypad_scanner.key_matrix.events.overflowed = True
+
+        events = keypad_scanner.get_key_events()
+
+        assert events == []
+        assert keypad_scanner.key_matrix.reset_count == 1
+
+    def test_keypad_scanner_overflow_releases_pressed(self, keypad_scanner):
+        """Test keys reported as pressed are released before the resync"""
+        events = keypad_scanner.key_matrix.events
+        events.pending = [(0, True), (4, True), (2, True), (2, False)]
+        keypad_scanner.get_key_events()
+
+        events.pending = [(5, True)]
+        events.overflowed = True
+
+        assert keypad_scanner.get_key_events() == [(0, 0, False), (1, 1, False)]
+
+        # Keys still held come back as presses after reset()
+        events.pending = [(4, True)]
+        assert keypad_scanner.get_key_events() == [(1, 1, True)]
+
+
+class TestPeripheryScannerSelection:
+    """Test PeripheryAbstract scanner backend selection"""
+
+    def test_periphery_uses_keypad_scanner(self):
+        """Test scanner class and its options are passed through"""
+        from mkx.periphery_abstract import PeripheryAbstract
+        from mkx.matrix_scanner_keypad import MatrixScannerKeypad
+
+        with patch("mkx.matrix_scanner_keypad.keypad.KeyMatrix", FakeKeyMatrix):
+            periphery = PeripheryAbstract(
+                "device1",
+                [MagicMock(), MagicMock()],
+                [MagicMock()],
+                warmup_cycles=0,
+                scanner=MatrixScannerKeypad,
+                interval=0.005,
+            )
+
+        assert isinstance(periphery.matrix_scanner, MatrixScannerKeypad)
+        assert periphery.matrix_scanner.key_matrix.kwargs["interval"] == 0.005
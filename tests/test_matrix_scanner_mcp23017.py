@@ -0,0 +1,102 @@
+"""
+Unit tests for the MCP23017 I/O expander scanner backend.
+Tests the register setup and the whole-port row reads.
+"""
+
+from mkx.matrix_scanner_mcp23017 import (
+    GPIOB,
+    GPPUB,
+    IODIRA,
+    IODIRB,
+    OLATA,
+    MatrixScannerMCP23017,
+)
+
+
+class FakeI2C:
+    """I2C bus with MCP23017 expanders, columns on GPA and rows on GPB"""
+
+    def __init__(self, addresses):
+        self.registers = {address: {} for address in addresses}
+        self.addresses = list(addresses)
+        self.closed = set()  # (col, row)
+        self.transactions = 0
+        self.locked = False
+
+    def try_lock(self):
+        self.locked = True
+        return True
+
+    def unlock(self):
+        self.locked = False
+
+    def writeto(self, address, buf):
+        self.transactions += 1
+        self.registers[address][buf[0]] = buf[1]
+
+    def writeto_then_readfrom(self, address, out_buf, in_buf):
+        """GPIOB of any expander, the rows are shared by all of them"""
+        self.transactions += 1
+        assert out_buf[0] == GPIOB
+        port = 0xFF
+        for col, row in self.closed:
+            olat = self.registers[self.addresses[col // 8]].get(OLATA, 0xFF)
+            if not olat >> (col % 8) & 1:
+                port &= ~(1 << row)
+        in_buf[0] = port
+
+
+class TestMatrixScannerMCP23017:
+    """Test suite for MatrixScannerMCP23017"""
+
+    def test_register_setup(self):
+        """Test GPA is set up as outputs and GPB as pulled up inputs"""
+        i2c = FakeI2C([0x20])
+        MatrixScannerMCP23017(i2c, 8, 8)
+
+        registers = i2c.registers[0x20]
+        assert registers[IODIRA] == 0x00
+        assert registers[IODIRB] == 0xFF
+        assert registers[GPPUB] == 0xFF
+        assert not i2c.locked
+
+    def test_idle_scan(self):
+        """Test an idle scan costs two transactions per column and one release"""
+        i2c = FakeI2C([0x20])
+        scanner = MatrixScannerMCP23017(i2c, 8, 6)
+        i2c.transactions = 0
+
+        assert scanner.get_key_events() == []
+        assert i2c.transactions == 17
+        assert i2c.registers[0x20][OLATA] == 0xFF
+
+    def test_press_and_release(self):
+        """Test a closed switch is reported on its column and row"""
+        i2c = FakeI2C([0x20])
+        scanner = MatrixScannerMCP23017(i2c, 8, 6)
+
+        i2c.closed.add((3, 5))
+        assert scanner.get_key_events() == [(3, 5, True)]
+        assert scanner.get_key_events() == []
+
+        i2c.closed.clear()
+        assert scanner.get_key_events() == [(3, 5, False)]
+
+    def test_two_expanders(self):
+        """Test columns past 8 are scanned on the second expander"""
+        i2c = FakeI2C([0x20, 0x21])
+        scanner = MatrixScannerMCP23017(i2c, 15, 8, addresses=(0x20, 0x21))
+
+        i2c.closed.update({(1, 0), (14, 7)})
+        assert scanner.get_key_events() == [(1, 0, True), (14, 7, True)]
+        assert i2c.registers[0x21][IODIRB] == 0xFF
+
+    def test_last_column_released_before_next_expander(self):
+        """Test a key on the last column of an expander drives no other column"""
+        i2c = FakeI2C([0x20, 0x21])
+        scanner = MatrixScannerMCP23017(i2c, 15, 3, addresses=(0x20, 0x21))
+
+        i2c.closed.add((7, 2))
+        assert scanner.get_key_events() == [(7, 2, True)]
+        assert i2c.registers[0x20][OLATA] == 0xFF
+        assert i2c.registers[0x21][OLATA] == 0xFF
@@ -0,0 +1,152 @@
+"""
+Unit tests for the port-read matrix scanner backend.
+Tests port mask extraction, bit remapping and the per-pin fallback.
+"""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from mkx.diode_orientation import DiodeOrientation
+from mkx.matrix_scanner_port import MatrixScannerPort, pio_port_reader
+
+# Import the mock digitalio (already set up by conftest.py)
+import digitalio
+
+from test_matrix_scanner_bitmask import FakeMatrix, make_scanner
+
+
+def port_reader(matrix, port_bits):
+    """GPIO input register of the fake matrix, sense pin i on port_bits[i]"""
+
+    def read_port():
+        port = 0
+        for pin, port_bit in zip(matrix.sense, port_bits):
+            if pin.value:
+                port |= 1 << port_bit
+        return port
+
+    return read_port
+
+
+def make_port_scanner(n_cols, n_rows, pull, port_bits=None):
+    """COL2ROW scanner reading the fake matrix through a port"""
+    pull_up = pull is digitalio.Pull.UP
+    n_drive, n_sense = (n_rows, n_cols) if pull_up else (n_cols, n_rows)
+    matrix = FakeMatrix(n_drive, n_sense, pull_up)
+    cols, rows = (
+        (matrix.sense, matrix.drive) if pull_up else (matrix.drive, matrix.sense)
+    )
+    read_port = port_reader(matrix, port_bits or range(n_sense))
+    scanner = MatrixScannerPort(
+        cols,
+        rows,
+        DiodeOrientation.COL2ROW,
+        pull,
+        warmup_cycles=0,
+        read_port=read_port,
+        port_bits=port_bits,
+    )
+    return matrix, scanner
+
+
+@pytest.fixture
+def rp2040(monkeypatch):
+    """Fake microcontroller pins GPIO0..GPIO29 and a recording rp2pio"""
+    pins = SimpleNamespace(**{f"GPIO{n}": object() for n in range(30)})
+    rp2pio = MagicMock()
+    monkeypatch.setitem(sys.modules, "microcontroller", SimpleNamespace(pin=pins))
+    monkeypatch.setitem(sys.modules, "rp2pio", rp2pio)
+    return pins, rp2pio
+
+
+class TestMatrixScannerPort:
+    """Test suite for MatrixScannerPort"""
+
+    def test_consecutive_bits_use_shift(self):
+        """Test consecutive port bits are extracted with one shift"""
+        _, scanner = make_port_scanner(2, 3, digitalio.Pull.DOWN, [4, 5, 6])
+
+        assert scanner._shift == 4
+        assert scanner._all == 0b111
+
+    def test_press_and_release(self):
+        """Test a port read press and release give the usual events"""
+        matrix, scanner = make_port_scanner(3, 2, digitalio.Pull.DOWN)
+
+        matrix.closed.add((2, 1))
+        assert scanner.get_key_events() == [(2, 1, True)]
+        assert scanner.get_key_events() == []
+
+        matrix.closed.clear()
+        assert scanner.get_key_events() == [(2, 1, False)]
+
+    @pytest.mark.parametrize("pull", [digitalio.Pull.DOWN, digitalio.Pull.UP])
+    @pytest.mark.parametrize("port_bits", [None, [3, 4, 5], [7, 0, 12]])
+    def test_port_bits(self, pull, port_bits):
+        """Test the sense pins are found at their port bits for both pulls"""
+        matrix, scanner = make_port_scanner(3, 3, pull, port_bits)
+
+        matrix.closed.update({(0, 0), (1, 2)})
+        events = scanner.get_key_events()
+
+        pull_up = pull is digitalio.Pull.UP
+        expected = {(0, 0, True), (2, 1, True) if pull_up else (1, 2, True)}
+        assert set(events) == expected
+
+    def test_fallback_to_pin_reads(self):
+        """Test without rp2pio and read_port the sense pins are read one by one"""
+        _, scanner = make_scanner(
+            MatrixScannerPort, 2, 2, DiodeOrientation.COL2ROW, digitalio.Pull.DOWN
+        )
+
+        assert scanner.read_port is None
+        assert scanner.get_key_events() == []
+
+    def test_pio_reader_without_rp2pio(self):
+        """Test pio_port_reader returns None where rp2pio is missing"""
+        assert pio_port_reader([object()], digitalio.Pull.DOWN) is None
+
+    def test_pio_reader_consecutive_gpios(self, rp2040):
+        """Test consecutive GPIOs get a state machine starting at the first pin"""
+        pins, rp2pio = rp2040
+        sense = [pins.GPIO6, pins.GPIO7, pins.GPIO8]
+
+        assert pio_port_reader(sense, digitalio.Pull.DOWN) is not None
+        kwargs = rp2pio.StateMachine.call_args.kwargs
+        assert kwargs["first_in_pin"] is pins.GPIO6
+        assert kwargs["in_pin_count"] == 3
+        program = rp2pio.StateMachine.call_args.args[0]
+        assert list(program) == [0x80A0, 0x4003, 0x8020]
+
+    @pytest.mark.parametrize("order", [(6, 8, 9), (8, 7, 6)])
+    def test_pio_reader_gap_falls_back(self, rp2040, order):
+        """Test GPIOs with a gap or out of order are not read through PIO"""
+        pins, rp2pio = rp2040
+        sense = [getattr(pins, f"GPIO{n}") for n in order]
+
+        assert pio_port_reader(sense, digitalio.Pull.DOWN) is None
+        rp2pio.StateMachine.assert_not_called()
+
+    def test_pio_reader_digital_in_out_falls_back(self, rp2040):
+        """Test pins already wrapped in DigitalInOut fall back to pin reads"""
+        _, rp2pio = rp2040
+        sense = FakeMatrix(1, 2).sense
+
+        assert pio_port_reader(sense, digitalio.Pull.DOWN) is None
+        rp2pio.StateMachine.assert_not_called()
+
+    def test_pio_reader_type_error_falls_back(self, rp2040):
+        """Test a TypeError from the state machine gives the pin read fallback"""
+        pins, rp2pio = rp2040
+        rp2pio.StateMachine.side_effect = TypeError("expected Pin")
+
+        assert pio_port_reader([pins.GPIO2, pins.GPIO3], digitalio.Pull.UP) is None
+
+    def test_pio_reader_attribute_error_falls_back(self, rp2040):
+        """Test a missing rp2pio attribute gives the pin read fallback"""
+        pins, rp2pio = rp2040
+        rp2pio.StateMachine.side_effect = AttributeError("StateMachine")
+
+        assert pio_port_reader([pins.GPIO2, pins.GPIO3], digitalio.Pull.UP) is None
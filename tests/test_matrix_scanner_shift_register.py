@@ -0,0 +1,163 @@
+"""
+Unit tests for the 74HC595 / 74HC165 shift register scanner backend.
+Tests the SPI transfers per drive line and the direct wired mode.
+"""
+
+import pytest
+from mkx.diode_orientation import DiodeOrientation
+from mkx.matrix_scanner_shift_register import MatrixScannerShiftRegister
+
+# Import the mock digitalio (already set up by conftest.py)
+import digitalio
+
+
+class EdgePin:
+    """Output pin calling on_edge(value) on every change"""
+
+    def __init__(self, on_edge):
+        self.on_edge = on_edge
+        self._value = None
+
+    def switch_to_output(self, value=False):
+        self._value = value
+
+    def switch_to_input(self, pull=None):
+        pass
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if value != self._value:
+            self._value = value
+            self.on_edge(value)
+
+
+class FakeShiftChain:
+    """SPI bus with 595 drive and 165 sense chains around a switch matrix"""
+
+    def __init__(self, n_drive, n_sense, direct=False, pull_up=False):
+        self.n_drive = n_drive
+        self.n_sense = n_sense
+        self.direct = direct
+        self.pull_up = pull_up
+        self.closed = set()  # (drive, sense), or (0, key) when direct
+        self.shift = 0
+        self.latched = 0
+        self.sampled = 0
+        self.transfers = 0
+        self.locked = False
+        self.load = EdgePin(self._load)
+        self.latch = EdgePin(self._latch)
+
+    def _latch(self, value):
+        if value:
+            self.latched = self.shift
+
+    def _load(self, value):
+        if value:
+            return
+        pressed = 0
+        for s in range(self.n_sense):
+            for d in range(self.n_drive):
+                driven = self.direct or bool(self.latched >> d & 1) != self.pull_up
+                if driven and (d, s) in self.closed:
+                    pressed |= 1 << s
+        all_sense = (1 << self.n_sense) - 1
+        self.sampled = ~pressed & all_sense if self.pull_up else pressed
+
+    def try_lock(self):
+        self.locked = True
+        return True
+
+    def unlock(self):
+        self.locked = False
+
+    def configure(self, baudrate=None):
+        pass
+
+    def write(self, buf):
+        self.shift = int.from_bytes(bytes(buf), "big")
+
+    def readinto(self, buf):
+        self.transfers += 1
+        buf[:] = self.sampled.to_bytes(len(buf), "little")
+
+    def write_readinto(self, out_buf, in_buf):
+        self.readinto(in_buf)
+        self.write(out_buf)
+
+
+def make_scanner(cols, rows, pull=digitalio.Pull.DOWN, direct=False):
+    if direct:
+        chain = FakeShiftChain(1, cols * rows, direct=True)
+    elif pull is digitalio.Pull.UP:
+        chain = FakeShiftChain(rows, cols, pull_up=True)
+    else:
+        chain = FakeShiftChain(cols, rows)
+    scanner = MatrixScannerShiftRegister(
+        chain,
+        chain.load,
+        cols,
+        rows,
+        latch=None if direct else chain.latch,
+        diode_orientation=DiodeOrientation.COL2ROW,
+        pull=pull,
+    )
+    return chain, scanner
+
+
+class TestMatrixScannerShiftRegister:
+    """Test suite for MatrixScannerShiftRegister"""
+
+    def test_idle_scan(self):
+        """Test an idle matrix gives no events and one transfer per drive line"""
+        chain, scanner = make_scanner(10, 4)
+
+        assert scanner.get_key_events() == []
+        assert chain.transfers == 10
+        assert not chain.locked
+
+    def test_press_and_release(self):
+        """Test a closed switch is reported on its column and row"""
+        chain, scanner = make_scanner(10, 4)
+
+        chain.closed.add((9, 3))
+        assert scanner.get_key_events() == [(9, 3, True)]
+        assert scanner.get_key_events() == []
+
+        chain.closed.clear()
+        assert scanner.get_key_events() == [(9, 3, False)]
+
+    def test_several_keys(self):
+        """Test keys on different drive lines in one pass"""
+        chain, scanner = make_scanner(12, 3)
+
+        chain.closed.update({(0, 0), (8, 2), (11, 1)})
+        assert scanner.get_key_events() == [(0, 0, True), (8, 2, True), (11, 1, True)]
+
+    def test_pull_up_drives_low(self):
+        """Test with Pull.UP the drive lines are active low and the rows drive"""
+        chain, scanner = make_scanner(10, 3, pull=digitalio.Pull.UP)
+
+        assert scanner.row_masks == [0, 0, 0]
+        chain.closed.add((2, 7))  # Drive line = row 2, sense line = column 7
+        assert scanner.get_key_events() == [(7, 2, True)]
+
+    def test_direct_wiring_single_transfer(self):
+        """Test without latch the whole board is read in one transfer"""
+        chain, scanner = make_scanner(15, 8, direct=True)
+
+        chain.closed.add((0, 3 * 15 + 14))
+        assert scanner.get_key_events() == [(14, 3, True)]
+        assert chain.transfers == 1
+
+    @pytest.mark.parametrize("cols", [8, 9, 16, 20])
+    def test_drive_buffers(self, cols):
+        """Test the drive patterns select one 595 output each"""
+        _, scanner = make_scanner(cols, 8)
+
+        for d, buf in enumerate(scanner._drive_bufs):
+            assert int.from_bytes(bytes(buf), "big") == 1 << d
@@ -71,6 +71,16 @@ class TestPeripheryAbstract:
 
         assert len(events) == 1
 
+    def test_periphery_prebuilt_scanner(self):
+        """Test a scanner instance is used as is, without pins"""
+        scanner = MagicMock()
+        scanner.get_key_events = MagicMock(return_value=[(5, 1, True)])
+
+        periphery = ConcretePeriphery("device1", None, None, scanner=scanner)
+
+        assert periphery.matrix_scanner is scanner
+        assert periphery.get_key_events() == [(5, 1, True)]
+
     def test_periphery_send_message(self):
         """Test periphery send method"""
         col_pins = [MagicMock()]
@@ -0,0 +1,93 @@
+"""
+Unit tests for PeripheryCentral and InterfaceCentral.
+Tests the in-memory key event queue between the central's own half and its interface.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from mkx.periphery_central import PeripheryCentral
+from mkx.interface_central import InterfaceCentral
+from mkx.communication_message import key_event_fields
+
+
+@pytest.fixture
+def periphery():
+    return PeripheryCentral(
+        "central", [MagicMock(), MagicMock()], [MagicMock()], warmup_cycles=0, queue_size=4
+    )
+
+
+class TestPeripheryCentralQueue:
+    """Test suite for the PeripheryCentral key event queue"""
+
+    def test_queue_empty(self, periphery):
+        """Test an empty queue gives no messages"""
+        assert periphery.drain_key_events([]) == []
+
+    def test_queue_keeps_all_events_of_a_scan(self, periphery):
+        """Test several events of one scan are all delivered, in order"""
+        periphery.push_key_event(0, 0, True, 1000)
+        periphery.push_key_event(1, 0, True, 1000)
+        periphery.push_key_event(0, 0, False, 1001)
+
+        messages = periphery.drain_key_events([])
+
+        assert [key_event_fields(m) for m in messages] == [
+            (0, 0, True),
+            (1, 0, True),
+            (0, 0, False),
+        ]
+        assert [m["timestamp"] for m in messages] == [1000, 1000, 1001]
+        assert messages[0]["device_id"] == "central"
+        assert messages[0]["type"] == "key_event"
+
+    def test_messages_are_plain_dicts(self, periphery):
+        """Test drained events are plain dicts on the local timeline"""
+        periphery.push_key_event(1, 0, True, 1000)
+
+        (message,) = periphery.drain_key_events([])
+
+        assert type(message) is dict
+        assert message["data"] == (1, 0, True)
+        assert message["anchored"] is True
+
+    def test_queue_wraps_around(self, periphery):
+        """Test the ring is reused after draining"""
+        for i in range(3):
+            periphery.push_key_event(i, 0, True, 1000 + i)
+        periphery.drain_key_events([])
+
+        for i in range(3):
+            periphery.push_key_event(i, 1, False, 2000 + i)
+
+        messages = periphery.drain_key_events([])
+        assert [key_event_fields(m) for m in messages] == [
+            (0, 1, False),
+            (1, 1, False),
+            (2, 1, False),
+        ]
+
+    def test_queue_full_drops_newest(self, periphery):
+        """Test overflow is counted and queued events are kept"""
+        for i in range(4):
+            assert periphery.push_key_event(i, 0, True, 1000) is True
+        assert periphery.push_key_event(5, 0, True, 1000) is False
+
+        assert periphery.events_dropped == 1
+        assert len(periphery.drain_key_events([])) == 4
+
+
+class TestInterfaceCentralReceive:
+    """Test suite for InterfaceCentral.receive"""
+
+    def test_receive_reads_queue(self, periphery):
+        """Test key events are received without encoding"""
+        interface = InterfaceCentral(periphery, 0, 0, 1, 0)
+        periphery.push_key_event(1, 0, True, 1000)
+
+        messages = interface.receive()
+
+        assert len(messages) == 1
+        assert key_event_fields(messages[0]) == (1, 0, True)
+        assert interface.receive() == []
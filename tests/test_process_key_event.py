@@ -0,0 +1,141 @@
+"""
+Unit tests for process_key_event.
+Tests the KeyFlags based dispatch of layer, timed and sticky keys.
+"""
+
+from types import SimpleNamespace
+
+from mkx.process_key_event import process_key_event
+from mkx.keys_abstract import KeysAbstract, KeyFlags
+from mkx.keys_standard import KeysStandard
+from mkx.keys_layers import MO, LT
+from mkx.keys_sticky import SK
+from mkx.keymap_compiler import KeymapCompiler
+from mkx.timed_keys import TimedKeys, TimedKeysManager
+from mkx.keys_sticky import StickyKeyManager
+from tests.conftest import MockKeycode
+
+
+class CustomTimedKey(KeysAbstract):
+    """Third-party key opting into timed handling by its class flag"""
+
+    flags = KeyFlags.TIMED
+
+    def __init__(self):
+        super().__init__()
+        self.key_name = "CUSTOM_TIMED"
+        self._active = False
+
+    def on_press(self, layer_manager, keyboard, timestamp):
+        self._active = True
+
+    def on_release(self, layer_manager, keyboard, timestamp):
+        self._active = False
+
+    def check_time(self, layer_manager, keyboard, timestamp):
+        pass
+
+
+class MixinTimedKey(KeysStandard, TimedKeys):
+    """Timed key built with the mixin pattern, flags not redeclared"""
+
+    def __init__(self):
+        KeysStandard.__init__(self, MockKeycode.B, "MIXIN_TIMED")
+        TimedKeys.__init__(self)
+
+    def check_time(self, layer_manager, keyboard, timestamp):
+        pass
+
+
+class TimedSticky(SK, TimedKeys):
+    """Sticky key with a timer, its first base sets flags of its own"""
+
+    def __init__(self, key):
+        SK.__init__(self, key)
+        TimedKeys.__init__(self)
+
+    def check_time(self, layer_manager, keyboard, timestamp):
+        pass
+
+
+def make_central(keymap, mock_keyboard, layer_manager):
+    return SimpleNamespace(
+        keymap_compiler=KeymapCompiler(keymap),
+        layers_manager=layer_manager,
+        keyboard=mock_keyboard,
+        pressed_keys={},
+        timed_keys_manager=TimedKeysManager(),
+        sticky_key_manager=StickyKeyManager(),
+    )
+
+
+class TestProcessKeyEvent:
+    """Test suite for process_key_event dispatch"""
+
+    def test_standard_key(self, mock_keyboard, layer_manager):
+        """Test a standard key is pressed and released"""
+        key_a = KeysStandard(MockKeycode.A, "A")
+        central = make_central([[key_a]], mock_keyboard, layer_manager)
+
+        process_key_event(central, "dev", 0, True, 0)
+        assert MockKeycode.A in mock_keyboard.pressed_keys
+
+        process_key_event(central, "dev", 0, False, 10)
+        assert MockKeycode.A not in mock_keyboard.pressed_keys
+
+    def test_layer_key_not_registered(self, mock_keyboard, layer_manager):
+        """Test a layer key changes the layer and is not registered as timed"""
+        central = make_central([[MO(1)], [MO(1)]], mock_keyboard, layer_manager)
+
+        process_key_event(central, "dev", 0, True, 0)
+
+        assert layer_manager.active_layers == [0, 1]
+        assert central.timed_keys_manager.is_active() is False
+
+    def test_layer_tap_key_registered_as_timed(self, mock_keyboard, layer_manager):
+        """Test LT is handled as a timed key"""
+        key = LT(1, KeysStandard(MockKeycode.A, "A"))
+        central = make_central([[key]], mock_keyboard, layer_manager)
+
+        process_key_event(central, "dev", 0, True, 0)
+
+        assert key in central.timed_keys_manager._active_keys
+
+    def test_third_party_timed_key(self, mock_keyboard, layer_manager):
+        """Test a custom key opts into timed handling without dispatcher changes"""
+        key = CustomTimedKey()
+        central = make_central([[key]], mock_keyboard, layer_manager)
+
+        process_key_event(central, "dev", 0, True, 0)
+
+        assert key in central.timed_keys_manager._active_keys
+
+    def test_sticky_key_registered(self, mock_keyboard, layer_manager):
+        """Test a sticky key is registered and its release keeps it active"""
+        key = SK(KeysStandard(MockKeycode.A, "A"))
+        central = make_central([[key]], mock_keyboard, layer_manager)
+
+        process_key_event(central, "dev", 0, True, 0)
+        process_key_event(central, "dev", 0, False, 10)
+
+        assert key in central.sticky_key_manager._active_sticky_keys
+        assert key._active is True
+
+    def test_mixin_timed_key_without_flags(self, mock_keyboard, layer_manager):
+        """Test a TimedKeys mixin subclass is registered without redeclaring flags"""
+        key = MixinTimedKey()
+        central = make_central([[key]], mock_keyboard, layer_manager)
+
+        process_key_event(central, "dev", 0, True, 0)
+
+        assert key in central.timed_keys_manager._active_keys
+
+    def test_sticky_timed_mixin(self, mock_keyboard, layer_manager):
+        """Test the TimedKeys bit is added behind a base with its own flags"""
+        key = TimedSticky(KeysStandard(MockKeycode.A, "A"))
+        central = make_central([[key]], mock_keyboard, layer_manager)
+
+        process_key_event(central, "dev", 0, True, 0)
+
+        assert key in central.timed_keys_manager._active_keys
+        assert key in central.sticky_key_manager._active_sticky_keys
@@ -155,3 +155,88 @@ class TestTimedKeysManager:
 
         # Should not raise an error
         manager.update(None, None, 1000)
+
+
+class DeadlineTimedKey(TimedKeys):
+    """Timed key with an explicit deadline, records when it fired"""
+
+    def __init__(self, name, fired, timeout=200):
+        super().__init__()
+        self.name = name
+        self.fired = fired
+        self.timeout = timeout
+
+    def deadline(self):
+        if self._pressed_time is None:
+            return None
+        return self._pressed_time + self.timeout
+
+    def check_time(self, layers_manager, keyboard, timestamp):
+        if timestamp - self._pressed_time >= self.timeout:
+            self.fired.append(self.name)
+            self.stop_timer()
+
+
+class TestTimedKeysManagerDeadlines:
+    """Test suite for deadline ordering in TimedKeysManager"""
+
+    def test_next_deadline(self):
+        """Test next_deadline gives the earliest pending timer"""
+        manager = TimedKeysManager()
+        assert manager.next_deadline() is None
+
+        key_a = DeadlineTimedKey("a", [], timeout=200)
+        key_b = DeadlineTimedKey("b", [], timeout=50)
+        key_a.start_timer(1000)
+        key_b.start_timer(1000)
+        manager.register(key_a)
+        manager.register(key_b)
+
+        assert manager.next_deadline() == 1050
+
+    def test_keys_not_due_are_not_checked(self):
+        """Test update does not touch timers before their deadline"""
+        fired = []
+        manager = TimedKeysManager()
+        key = DeadlineTimedKey("a", fired)
+        key.start_timer(1000)
+        manager.register(key)
+
+        manager.update(None, None, 1100)
+
+        assert fired == []
+        assert key in manager._active_keys
+
+    def test_timers_fire_in_deadline_order(self):
+        """Test several timers expiring in one update fire in deadline order"""
+        fired = []
+        manager = TimedKeysManager()
+        late = DeadlineTimedKey("late", fired, timeout=150)
+        early = DeadlineTimedKey("early", fired, timeout=100)
+        late.start_timer(1000)
+        early.start_timer(1000)
+        manager.register(late)
+        manager.register(early)
+
+        manager.update(None, None, 1500)
+
+        assert fired == ["early", "late"]
+        assert manager.is_active() is False
+        assert manager.next_deadline() is None
+
+    def test_reschedule_after_release(self):
+        """Test a restarted timer replaces the old deadline"""
+        fired = []
+        manager = TimedKeysManager()
+        key = DeadlineTimedKey("a", fired)
+        key.start_timer(1000)
+        manager.register(key)
+
+        key.start_timer(1100)
+        manager.reschedule(key)
+        assert manager.next_deadline() == 1300
+
+        key.stop_timer()
+        manager.reschedule(key)
+        assert manager.next_deadline() is None
+        assert manager.is_active() is False
@@ -0,0 +1,78 @@
+"""
+Unit tests for the binary trace recorder.
+Tests the record ring, recording from the managers and decoding a dump.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from mkx import trace
+from mkx.trace import TraceAction, TraceRecorder, NONE
+from mkx.keys_standard import KeysStandard
+from mkx.manager_layers import LayersManager
+from tests.conftest import MockKeycode
+
+from trace_decode import parse_dump, timeline
+
+
+@pytest.fixture
+def recorder():
+    recorder = trace.enable(4)
+    yield recorder
+    trace.disable()
+
+
+class TestTraceRecorder:
+    """Test suite for TraceRecorder"""
+
+    def test_record_fields(self, layer_manager):
+        """Test a record keeps its fields and name tables"""
+        recorder = TraceRecorder(4)
+        key_a = KeysStandard(MockKeycode.A, "A")
+        layer_manager.activate_layer(2)
+
+        recorder.record(TraceAction.KEY_PRESS, 1000, "left", 7, key_a, layer_manager)
+
+        assert list(recorder.records()) == [
+            (1000, TraceAction.KEY_PRESS, 0, 7, 0, 2, 0, 0b101)
+        ]
+        assert recorder.device_names == ["left"]
+        assert recorder.key_names == ["A"]
+
+    def test_ring_keeps_newest(self):
+        """Test the oldest records are overwritten"""
+        recorder = TraceRecorder(2)
+        for timestamp in (1, 2, 3):
+            recorder.record(TraceAction.TIMER_FIRE, timestamp)
+
+        assert [r[0] for r in recorder.records()] == [2, 3]
+        assert recorder.records().__next__()[3] == NONE
+
+    def test_layer_changes_recorded(self, recorder):
+        """Test LayersManager records its changes while tracing"""
+        manager = LayersManager(default_layer=0)
+
+        with patch("mkx.trace.time.monotonic_ns", return_value=5_000_000):
+            manager.activate_layer(1)
+
+        (record,) = recorder.records()
+        assert record[0] == 5
+        assert record[1] == TraceAction.LAYER_CHANGE
+        assert record[5] == 1
+
+    def test_dump_decodes_to_timeline(self, recorder, capsys):
+        """Test a dump is decoded by trace_decode.py"""
+        key_a = KeysStandard(MockKeycode.A, "A")
+        recorder.record(TraceAction.KEY_PRESS, 1000, "left", 3, key_a)
+        recorder.record(TraceAction.KEY_RELEASE, 1012, "left", 3, key_a)
+
+        trace.dump()
+        devices, keys, records, lost = parse_dump(capsys.readouterr().out.splitlines())
+
+        assert devices == {0: "left"}
+        assert keys == {0: "A"}
+        assert lost == 0
+
+        lines = list(timeline(devices, keys, records))
+        assert "KEY_RELEASE" in lines[2]
+        assert "+12" in lines[2]
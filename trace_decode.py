@@ -0,0 +1,91 @@
+import sys
+import struct
+import argparse
+
+# Keep in sync with mkx/trace.py
+ACTIONS = {1: "KEY_PRESS", 2: "KEY_RELEASE", 3: "TIMER_FIRE", 4: "LAYER_CHANGE"}
+NONE = 0xFFFF
+
+
+def parse_dump(lines):
+    """Parse the text printed by trace.dump(), other serial output is ignored."""
+    record_format = None
+    devices = {}
+    keys = {}
+    records = []
+    lost = 0
+
+    for line in lines:
+        line = line.strip()
+        if line.startswith("MKXTRACE END"):
+            break
+        if line.startswith("MKXTRACE "):
+            _, _, record_format, _, lost = line.split(" ")
+            lost = int(lost)
+            devices.clear()
+            keys.clear()
+            records.clear()
+        elif record_format is None:
+            continue
+        elif line.startswith("D "):
+            _, number, name = line.split(" ", 2)
+            devices[int(number)] = name
+        elif line.startswith("K "):
+            _, number, name = line.split(" ", 2)
+            keys[int(number)] = name
+        elif line.startswith("R "):
+            records.append(struct.unpack(record_format, bytes.fromhex(line[2:])))
+
+    if record_format is None:
+        raise ValueError("No MKXTRACE dump found")
+
+    return devices, keys, records, lost
+
+
+def timeline(devices, keys, records):
+    """Yield one formatted line per record, times relative to the first record"""
+    yield (
+        f"{'time':>8} {'+delta':>7}  {'action':<13}{'device':<14}"
+        f"{'index':>5}  {'key':<16}{'layer':>5}  active"
+    )
+
+    first = previous = records[0][0] if records else 0
+    for timestamp, action, device, index, key, top_layer, _, mask in records:
+        delta = (timestamp - previous) & 0xFFFFFFFF
+        elapsed = (timestamp - first) & 0xFFFFFFFF
+        previous = timestamp
+
+        device_name = "" if device == 0xFF else devices.get(device, f"#{device}")
+        key_name = "" if key == NONE else keys.get(key, f"#{key}")
+        index_str = "" if index == NONE else str(index)
+        layer_str = "" if top_layer == 0xFF else str(top_layer)
+        active = [layer for layer in range(16) if mask & (1 << layer)]
+
+        yield (
+            f"{elapsed:>8} {'+' + str(delta):>7}  {ACTIONS.get(action, action):<13}"
+            f"{device_name:<14}{index_str:>5}  {key_name:<16}{layer_str:>5}  {active}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Decode an mkx trace dump (trace.dump() output) into a timeline."
+    )
+    parser.add_argument(
+        "dump",
+        nargs="?",
+        help="File with the captured serial output (default: stdin)",
+    )
+    args = parser.parse_args()
+
+    if args.dump:
+        with open(args.dump) as f:
+            devices, keys, records, lost = parse_dump(f)
+    else:
+        devices, keys, records, lost = parse_dump(sys.stdin)
+
+    if lost:
+        print(f"({lost} older records were overwritten)")
+
+    for line in timeline(devices, keys, records):
+        print(line)